@@ -0,0 +1,78 @@
+"""Compare `snippy batch` with one `git add` + `git commit` per record.
+
+The porcelain loop is a lower bound for the old `snippy run -m` loop, which
+paid the same git cost plus a Python start-up per commit.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_repo(path, count):
+    subprocess.run(["git", "init", "-q", path], check=True)
+    for key, value in (("user.name", "bench"), ("user.email", "bench@example.com")):
+        subprocess.run(["git", "-C", path, "config", key, value], check=True)
+    with open(os.path.join(path, "README"), "w") as f:
+        f.write("bench\n")
+    subprocess.run(["git", "-C", path, "add", "README"], check=True)
+    subprocess.run(["git", "-C", path, "commit", "-qm", "init"], check=True)
+    for index in range(count):
+        with open(os.path.join(path, f"file{index}.txt"), "w") as f:
+            f.write(f"{index}\n")
+
+
+def porcelain_loop(path, count):
+    started = time.perf_counter()
+    for index in range(count):
+        subprocess.run(["git", "-C", path, "add", f"file{index}.txt"], check=True)
+        subprocess.run(
+            ["git", "-C", path, "commit", "-qm", f"feat: ✨ add file{index}"],
+            check=True,
+        )
+    return time.perf_counter() - started
+
+
+def snippy_batch(path, count):
+    records = "".join(
+        json.dumps({"type": "feat", "subject": f"add file{i}", "paths": [f"file{i}.txt"]})
+        + "\n"
+        for i in range(count)
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT, SNIPPY_NO_DAEMON="1")
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", "from snippy.client import main; main()", "batch"],
+        input=records,
+        text=True,
+        cwd=path,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - started
+
+
+def main(count=500):
+    with tempfile.TemporaryDirectory() as workdir:
+        loop_repo = os.path.join(workdir, "loop")
+        batch_repo = os.path.join(workdir, "batch")
+        make_repo(loop_repo, count)
+        make_repo(batch_repo, count)
+
+        loop_time = porcelain_loop(loop_repo, count)
+        batch_time = snippy_batch(batch_repo, count)
+
+    print(f"git commit loop: {count / loop_time:8.1f} commits/s ({loop_time:.2f}s)")
+    print(f"snippy batch:    {count / batch_time:8.1f} commits/s ({batch_time:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
@@ -0,0 +1,104 @@
+"""Per-keystroke filtering latency for a 10k entry commit-type catalog.
+
+Types each query one character at a time and times the indexed
+SearchSession against pfzy (what InquirerPy's fuzzy prompt runs on every
+keystroke, without its added wait time).
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snippy.utils.config_cache import build_commit_type_choices  # noqa: E402
+from snippy.utils.config_schema import CommitType  # noqa: E402
+from snippy.utils.search_index import SearchSession, build_search_index  # noqa: E402
+
+ENTRIES = 10_000
+QUERIES = ("refactor", "api 버그", "docs payment", "fxpmt", "성능 개선")
+
+WORDS = (
+    "api auth billing cache cli config db deploy docs infra ios android "
+    "payment search ui ux web worker queue metrics logging build release"
+).split()
+DESCRIPTIONS = (
+    ("새로운 기능 추가", "New Feature"),
+    ("버그 수정", "Bug Fix"),
+    ("문서 수정", "Documentation"),
+    ("코드 리팩토링", "Code Refactoring"),
+    ("성능 개선", "Performance Improvement"),
+    ("빌드 및 배포 설정 변경", "Build and Deployment Configuration"),
+)
+TYPES = ("feat", "fix", "docs", "refactor", "perf", "chore", "test", "style")
+
+
+def make_catalog(size, seed=0):
+    rng = random.Random(seed)
+    commit_types = {}
+    for i in range(size):
+        base = rng.choice(TYPES)
+        scope = "-".join(rng.sample(WORDS, 2))
+        korean, english = rng.choice(DESCRIPTIONS)
+        commit_types[f"{base}({scope})_{i}"] = CommitType(
+            rng.choice(("✨", "🐛", "📝", "♻️", "⚡", "🔧")),
+            f"{scope} {korean} / {english} for the {rng.choice(WORDS)} team",
+        )
+    return build_commit_type_choices(commit_types, True, True)
+
+
+def time_keystrokes(make_search):
+    # query 마다 새 prompt 를 여는 것처럼 make_search() 로 검색 함수를 새로 만듦
+    latencies = []
+    for query in QUERIES:
+        search = make_search()
+        for length in range(1, len(query) + 1):
+            started = time.perf_counter()
+            search(query[:length])
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(label, latencies):
+    latencies = sorted(latencies)
+    median = latencies[len(latencies) // 2]
+    p95 = latencies[int(len(latencies) * 0.95)]
+    print(
+        f"{label:8} median {median * 1e3:7.2f}ms  p95 {p95 * 1e3:7.2f}ms  "
+        f"max {latencies[-1] * 1e3:7.2f}ms"
+    )
+    return p95
+
+
+def main(size=ENTRIES):
+    choices = make_catalog(size)
+    names = [choice["name"] for choice in choices]
+
+    started = time.perf_counter()
+    index = build_search_index(names)
+    print(f"{size} entries, index built in {(time.perf_counter() - started) * 1e3:.1f}ms")
+
+    indexed = time_keystrokes(lambda: SearchSession(index).search)
+    indexed_p95 = report("indexed", indexed)
+
+    try:
+        from pfzy import fuzzy_match
+    except ImportError:
+        print("pfzy is not installed; skipping the InquirerPy baseline")
+        return 0
+
+    haystack = [{"name": name} for name in names]
+    baseline = time_keystrokes(
+        lambda: lambda query: asyncio.run(fuzzy_match(query, haystack, key="name"))
+    )
+    baseline_p95 = report("pfzy", baseline)
+    if indexed_p95 >= baseline_p95:
+        print("FAIL indexed search is not faster than pfzy", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
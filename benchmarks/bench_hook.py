@@ -0,0 +1,88 @@
+"""Wall time of one git hook call on a warm cache.
+
+Installs the hooks into a throwaway repository (with a throwaway HOME) and
+runs each hook script the way git does. Fails when the median call takes
+30ms or more.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUNS = 30
+BUDGET_MS = 30.0
+
+SNIPPY_SCRIPT = """#!{python}
+import sys
+from snippy.client import main
+sys.exit(main())
+"""
+
+
+def run_hook(path, *args, env):
+    started = time.perf_counter()
+    result = subprocess.run([path, *args], env=env, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - started, result.returncode
+
+
+def main(runs=RUNS):
+    with tempfile.TemporaryDirectory() as tmp:
+        # 설치된 환경처럼 .pyc 를 쓰고 읽도록 함
+        env = dict(os.environ, HOME=tmp, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="")
+        # hook 은 PATH 의 snippy 를 실행하므로 console script 와 같은 것을 둠
+        bin_dir = os.path.join(tmp, "bin")
+        os.makedirs(bin_dir)
+        snippy = os.path.join(bin_dir, "snippy")
+        with open(snippy, "w") as file:
+            file.write(SNIPPY_SCRIPT.format(python=sys.executable))
+        os.chmod(snippy, 0o755)
+        env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
+        repo = os.path.join(tmp, "repo")
+        subprocess.run(["git", "init", "-q", repo], check=True)
+        subprocess.run(
+            [sys.executable, "-m", "snippy.main", "hook", "install"],
+            cwd=repo,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        hooks = os.path.join(repo, ".git", "hooks")
+        message = os.path.join(tmp, "COMMIT_EDITMSG")
+
+        failures = []
+        cases = [
+            ("commit-msg ok", "commit-msg", "feat: ✨ add hook mode\n", [], 0),
+            ("commit-msg bad", "commit-msg", "add hook mode\n", [], 1),
+            ("prepare-commit-msg", "prepare-commit-msg", "\n# comment\n", [], 0),
+        ]
+        for label, hook, text, extra, expected in cases:
+            times = []
+            for _ in range(runs):
+                with open(message, "w", encoding="utf-8") as file:
+                    file.write(text)
+                elapsed, code = run_hook(
+                    os.path.join(hooks, hook), message, *extra, env=env
+                )
+                if code != expected:
+                    failures.append(f"{label}: exit {code}, expected {expected}")
+                    break
+                times.append(elapsed)
+            if not times:
+                continue
+            median = statistics.median(times) * 1e3
+            print(f"{label:>20}: median {median:6.1f}ms  min {min(times) * 1e3:6.1f}ms")
+            if median >= BUDGET_MS:
+                failures.append(f"{label}: median {median:.1f}ms, budget {BUDGET_MS}ms")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Scope inference over a 100k path staged set.
+
+Compares the compiled trie against trying every rule on every path.
+"""
+
+import os
+import random
+import sys
+import time
+from fnmatch import fnmatch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snippy.utils.scope_utils import get_scope_matcher  # noqa: E402
+
+PATHS = 100_000
+PACKAGES = 200
+
+
+def make_rules():
+    rules = {f"packages/pkg{i}/": f"pkg{i}" for i in range(PACKAGES)}
+    rules.update({"docs/": "docs", "*.md": "docs", "**/test_*.py": "test"})
+    return rules
+
+
+def make_paths(size, seed=0):
+    rng = random.Random(seed)
+    paths = set()
+    while len(paths) < size:
+        package = rng.randrange(PACKAGES)
+        depth = rng.randrange(1, 5)
+        dirs = "/".join(f"d{rng.randrange(20)}" for _ in range(depth))
+        name = rng.choice(("mod", "test_mod", "README"))
+        ext = rng.choice((".py", ".md", ".ts"))
+        paths.add(f"packages/pkg{package}/{dirs}/{name}{rng.randrange(50)}{ext}")
+    # git 은 경로를 정렬해서 내보냄
+    return sorted(paths)
+
+
+def naive_scan(rules, paths):
+    counts = {}
+    for path in paths:
+        best = None
+        for pattern, scope in rules.items():
+            anchored = "/" in pattern.strip("/")
+            pattern = pattern.strip("/")
+            parts = path.split("/")
+            candidates = (
+                ["/".join(parts[: i + 1]) for i in range(len(parts))]
+                if anchored
+                else parts
+            )
+            if any(fnmatch(candidate, pattern) for candidate in candidates):
+                best = scope
+        if best is not None:
+            counts[best] = counts.get(best, 0) + 1
+    return counts
+
+
+def main(size=PATHS):
+    rules = make_rules()
+    paths = make_paths(size)
+
+    started = time.perf_counter()
+    counts, _ = get_scope_matcher(rules).scan(iter(paths))
+    trie_time = time.perf_counter() - started
+    print(f"trie:  {size} paths in {trie_time * 1e3:8.1f}ms")
+
+    sample = paths[: size // 100]
+    started = time.perf_counter()
+    expected = naive_scan(rules, sample)
+    naive_time = (time.perf_counter() - started) * 100
+    print(f"naive: {size} paths in {naive_time * 1e3:8.1f}ms (extrapolated from 1%)")
+
+    sample_counts, _ = get_scope_matcher(rules).scan(iter(sample))
+    if sample_counts != expected:
+        print("FAIL trie and naive matching disagree", file=sys.stderr)
+        return 1
+    if trie_time >= naive_time:
+        print("FAIL trie is not faster than per-rule matching", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Time the staged-change backends on a large temporary repository.
+
+The backends are checked against git in tests/test_git_backend.py.
+
+Usage:
+    python benchmarks/bench_staged.py [file_count]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snippy.utils.git_backend import IndexGitBackend, SubprocessGitBackend  # noqa: E402
+
+
+def git(path, *args, **kwargs):
+    return subprocess.run(
+        ["git", "-C", path, *args], check=True, stdout=subprocess.PIPE, **kwargs
+    ).stdout
+
+
+def write(path, name, content):
+    full_path = os.path.join(path, name)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "w") as f:
+        f.write(content)
+
+
+def make_repo(path, file_count=50):
+    git(path, "init", "-q")
+    git(path, "config", "user.name", "bench")
+    git(path, "config", "user.email", "bench@example.com")
+    git(path, "config", "gc.auto", "0")
+    for index in range(file_count):
+        write(path, f"pkg{index % 20}/sub{index % 7}/file{index}.txt", f"{index}\n")
+    git(path, "add", "-A")
+    git(path, "commit", "-qm", "init")
+
+
+def time_backend(backend, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        backend.has_staged_changes()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench(file_count):
+    with tempfile.TemporaryDirectory() as path:
+        make_repo(path, file_count)
+        git(path, "repack", "-adq")
+        os.chdir(path)
+        for label, prepare in (
+            ("clean", lambda: None),
+            ("one staged", lambda: (write(path, "z.txt", "z\n"), git(path, "add", "z.txt"))),
+        ):
+            prepare()
+            print(f"{file_count} files, {label}:")
+            for backend in (SubprocessGitBackend(), IndexGitBackend()):
+                print(f"  {backend.name:<10} {time_backend(backend) * 1000:8.2f} ms")
+        git(path, "reset", "-q")
+        write(path, "pkg0/sub0/file0.txt", "changed\n")
+        git(path, "add", "pkg0/sub0/file0.txt")
+        git(path, "reset", "-q", "pkg0/sub0/file0.txt")
+        print(f"{file_count} files, invalidated cache-tree:")
+        for backend in (SubprocessGitBackend(), IndexGitBackend()):
+            print(f"  {backend.name:<10} {time_backend(backend) * 1000:8.2f} ms")
+
+
+def main():
+    cwd = os.getcwd()
+    try:
+        bench(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
+    finally:
+        os.chdir(cwd)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
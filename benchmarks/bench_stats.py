@@ -0,0 +1,103 @@
+"""`snippy stats` index build, incremental update and query latency.
+
+Builds a repository with ``git fast-import`` (several authors, types and
+directories spread over a few years), indexes it, adds a handful of commits
+and indexes again. Fails when the incremental update is not much cheaper than
+the full build, or when a query takes 50ms or more.
+"""
+
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+COMMITS = 50_000
+NEW_COMMITS = 100
+QUERY_BUDGET_MS = 50.0
+
+TYPES = ("feat: ✨", "fix: 🐛", "docs: 📝", "refactor: ♻️", "chore: 🔧")
+AUTHORS = [f"dev{i} <dev{i}@example.com>" for i in range(40)]
+DIRS = [f"packages/pkg{i}/src" for i in range(30)] + ["docs", "scripts"]
+
+
+def fast_import(repo, count, start, seed, parent=True):
+    rng = random.Random(seed)
+    lines = []
+    for index in range(start, start + count):
+        message = f"{rng.choice(TYPES)} change {index}".encode()
+        author = rng.choice(AUTHORS)
+        when = 1_500_000_000 + index * 3600
+        path = f"{rng.choice(DIRS)}/file{rng.randrange(100)}.txt"
+        lines.append(f"commit refs/heads/main\nmark :{index + 1}\n")
+        lines.append(f"committer {author} {when} +0000\n")
+        lines.append(f"data {len(message)}\n")
+        lines.append(message.decode() + "\n")
+        if index == start and parent and start:
+            lines.append("from refs/heads/main^0\n")
+        lines.append(f"M 100644 inline {path}\ndata 2\n{index % 10}\n\n")
+    subprocess.run(
+        ["git", "-C", repo, "fast-import", "--quiet"],
+        input="".join(lines).encode(),
+        check=True,
+    )
+
+
+def main(count=COMMITS):
+    from snippy.commands.stats import query_stats
+    from snippy.utils.commit_index import open_commit_index, update_commit_index
+    from snippy.utils.template_utils import compile_template
+
+    template = "<type>: <emoji> <subject>"
+    matcher = compile_template(template).matcher()
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = os.path.join(tmp, "repo")
+        subprocess.run(["git", "init", "-q", "-b", "main", repo], check=True)
+        fast_import(repo, count, 0, seed=0)
+        git_dir = os.path.join(repo, ".git")
+        os.chdir(repo)
+
+        connection = open_commit_index(template, git_dir)
+        started = time.perf_counter()
+        added, _ = update_commit_index(connection, matcher)
+        full_time = time.perf_counter() - started
+        print(f"full build:  {added} commits in {full_time * 1e3:8.1f}ms")
+
+        fast_import(repo, NEW_COMMITS, count, seed=1)
+        started = time.perf_counter()
+        added, _ = update_commit_index(connection, matcher)
+        incremental_time = time.perf_counter() - started
+        print(f"incremental: {added} commits in {incremental_time * 1e3:8.1f}ms")
+        if incremental_time * 10 >= full_time:
+            failures.append("incremental update is not 10x cheaper than a full build")
+
+        queries = {
+            "by type": ("type", {}),
+            "by author": ("author", {}),
+            "by month": ("month", {}),
+            "since": ("type", {"since": datetime(2018, 1, 1)}),
+            "author by week": ("week", {"author": "dev7"}),
+            "path": ("type", {"path": "packages/pkg3"}),
+            "by path": ("path", {"path": "packages"}),
+        }
+        for label, (group_by, options) in queries.items():
+            started = time.perf_counter()
+            query_stats(connection, group_by, **options)
+            elapsed = (time.perf_counter() - started) * 1e3
+            print(f"{label:>16}: {elapsed:8.2f}ms")
+            if elapsed >= QUERY_BUDGET_MS:
+                failures.append(f"{label} took {elapsed:.1f}ms")
+        connection.close()
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
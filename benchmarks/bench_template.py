@@ -0,0 +1,44 @@
+"""Compare compiled template rendering against the old chained str.replace calls."""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snippy.utils.template_utils import compile_template  # noqa: E402
+
+TEMPLATE = "<type>: <emoji> <subject>"
+ARGS = ("feat", "✨", "Add compiled template rendering")
+
+
+def replace_chain(template, commit_type, emoji, subject):
+    message = template.replace("<type>", commit_type).replace("<subject>", subject)
+    if "<emoji>" in template:
+        message = message.replace("<emoji>", emoji)
+    else:
+        message = message.replace("<emoji>", "")
+    return message
+
+
+def main(number=200_000):
+    compiled = compile_template(TEMPLATE)
+    assert compiled.render(*ARGS) == replace_chain(TEMPLATE, *ARGS)
+
+    replace_time = min(
+        timeit.repeat(lambda: replace_chain(TEMPLATE, *ARGS), number=number, repeat=5)
+    )
+    render_time = min(
+        timeit.repeat(lambda: compiled.render(*ARGS), number=number, repeat=5)
+    )
+
+    print(f"replace chain: {replace_time / number * 1e9:8.1f} ns/render")
+    print(f"compiled:      {render_time / number * 1e9:8.1f} ns/render")
+    if render_time >= replace_time:
+        print("FAIL compiled rendering is not faster than the replace chain", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Fail when snippy's cold-start import time or module set exceeds the recorded budget.
+
+Usage:
+    python benchmarks/import_budget.py            # check against import_budget.json
+    python benchmarks/import_budget.py --report   # print measurements only
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_budget.json")
+
+# 각 시나리오는 커맨드가 dispatch 되는 시점까지 import 되는 모듈을 측정
+SCENARIOS = {
+    "help": (
+        "import click\n"
+        "from snippy.main import cli\n"
+        "cli.get_help(click.Context(cli))\n"
+    ),
+    "run": (
+        "import click\n"
+        "from snippy.main import cli\n"
+        "cli.get_command(click.Context(cli), 'run')\n"
+    ),
+    # git hook 은 click 없이 snippy.hook 만 import
+    "hook": "from snippy.hook import main\n",
+    # -t 와 -m 으로 모두 지정한 커밋은 prompt 라이브러리 없이 git commit 까지 실행
+    "commit": "from snippy.client import main\nmain()\n",
+}
+
+# 실제로 실행되는 시나리오의 인자, 임시 HOME 과 저장소에서 실행됨
+SCENARIO_ARGS = {
+    "commit": ["-t", "feat", "-m", "Check the import budget"],
+}
+
+
+def measure(source, args=(), env=None, cwd=None):
+    env = dict(env or os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="")
+    baseline = _importtime(["-c", "pass"], env)
+    result = _importtime(["-c", source, *args], env, cwd)
+    modules = sorted(set(result) - set(baseline))
+    cumulative_us = sum(result[name][1] for name in _top_level(result, baseline))
+    return {"modules": modules, "cumulative_us": cumulative_us}
+
+
+def _importtime(args, env, cwd=None):
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        cwd=cwd,
+        check=True,
+    )
+    modules = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = len(name) - len(name.lstrip())
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def _top_level(result, baseline):
+    # 가장 얕은 depth 의 모듈만 더해야 cumulative 시간이 중복 집계되지 않음
+    new = {name: value for name, value in result.items() if name not in baseline}
+    if not new:
+        return []
+    min_depth = min(depth for _, _, depth in new.values())
+    return [name for name, (_, _, depth) in new.items() if depth == min_depth]
+
+
+class CommitWorkspace:
+    """Throwaway HOME and repository with a change staged before every run."""
+
+    def __init__(self, path):
+        self.home = os.path.join(path, "home")
+        self.repo = os.path.join(path, "repo")
+        os.makedirs(os.path.join(self.home, ".snippy"))
+        with open(os.path.join(self.home, ".snippy", "config.json"), "w") as f:
+            # 백그라운드 업데이트 확인 프로세스를 띄우지 않도록 끔
+            json.dump(
+                {
+                    "commit_template": "<type>: <emoji> <subject>",
+                    "commit_types": {
+                        "feat": {"emoji": ":sparkles:", "description": "New Feature"}
+                    },
+                    "update_check_ttl_hours": 0,
+                },
+                f,
+            )
+        self.env = dict(
+            os.environ,
+            HOME=self.home,
+            SNIPPY_NO_DAEMON="1",
+            GIT_CONFIG_NOSYSTEM="1",
+            GIT_AUTHOR_NAME="budget",
+            GIT_AUTHOR_EMAIL="budget@example.com",
+            GIT_COMMITTER_NAME="budget",
+            GIT_COMMITTER_EMAIL="budget@example.com",
+        )
+        self.env.pop("SNIPPY_TRACE", None)
+        self.runs = 0
+        self.git("init", "-q", self.repo)
+        self.git("-C", self.repo, "config", "gc.auto", "0")
+
+    def git(self, *args):
+        subprocess.run(["git", *args], env=self.env, check=True)
+
+    def prepare(self):
+        self.runs += 1
+        with open(os.path.join(self.repo, "file.txt"), "w") as f:
+            f.write(f"{self.runs}\n")
+        self.git("-C", self.repo, "add", "file.txt")
+        return {"env": self.env, "cwd": self.repo}
+
+
+def best_of(source, repeat, args=(), prepare=None):
+    runs = []
+    for _ in range(repeat):
+        options = prepare() if prepare is not None else {}
+        runs.append(measure(source, args, **options))
+    best = min(runs, key=lambda run: run["cumulative_us"])
+    return {"modules": best["modules"], "cumulative_us": best["cumulative_us"]}
+
+
+def check(name, measured, budget):
+    failures = []
+    if measured["cumulative_us"] > budget["max_cumulative_us"]:
+        failures.append(
+            f"{name}: import time {measured['cumulative_us']}us exceeds budget "
+            f"{budget['max_cumulative_us']}us"
+        )
+    if len(measured["modules"]) > budget["max_modules"]:
+        failures.append(
+            f"{name}: {len(measured['modules'])} modules imported, budget is "
+            f"{budget['max_modules']}"
+        )
+    for forbidden in budget.get("forbidden", []):
+        leaked = [
+            module
+            for module in measured["modules"]
+            if module == forbidden or module.startswith(forbidden + ".")
+        ]
+        if leaked:
+            failures.append(f"{name}: imports {forbidden} ({leaked[0]})")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--report", action="store_true", help="Only print measurements.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    budgets = {}
+    if not args.report:
+        with open(BUDGET_PATH, "r") as f:
+            budgets = json.load(f)
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = CommitWorkspace(tmp)
+        # 첫 실행에서 config 스냅샷과 .pyc 가 만들어지므로 측정에서 제외
+        best_of(SCENARIOS["commit"], 1, SCENARIO_ARGS["commit"], workspace.prepare)
+        measurements = {
+            name: best_of(
+                source,
+                args.repeat,
+                SCENARIO_ARGS.get(name, ()),
+                workspace.prepare if name in SCENARIO_ARGS else None,
+            )
+            for name, source in SCENARIOS.items()
+        }
+
+    for name, measured in measurements.items():
+        print(
+            f"{name:>8}: {measured['cumulative_us']:>8}us  "
+            f"{len(measured['modules']):>4} modules"
+        )
+        if not args.report and name in budgets:
+            failures.extend(check(name, measured, budgets[name]))
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
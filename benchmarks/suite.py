@@ -0,0 +1,541 @@
+"""Offline benchmark suite with a recorded baseline.
+
+Covers cold starts of the real CLI (``snippy --help``, ``snippy run -m`` with
+and without the type picker, ``snippy -t <type> -m``, ``snippy update``) and
+the in-process steps they are made of: migrating, saving and loading a large
+config, building the picker choices for a large catalog, rendering templates
+and the staged check on a large repository.
+
+Everything runs in a throwaway HOME. ``brew`` is a stand-in script on PATH,
+git identity comes from the environment, the picker is answered through a
+pseudo-terminal and the update prompt through stdin, so no network, Homebrew
+or terminal is needed.
+
+Usage:
+    python benchmarks/suite.py                  # run and print medians
+    python benchmarks/suite.py --save           # record benchmarks/baseline.json
+    python benchmarks/suite.py --compare        # fail on regressions
+    python benchmarks/suite.py -k cold -k load  # only names containing these
+
+The baseline is only meaningful on the machine that recorded it: record it
+on the base commit, then run ``--compare`` on the change.
+"""
+
+import argparse
+import json
+import os
+import platform
+import select
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+sys.path.insert(0, ROOT)
+
+# 중앙값이 baseline 대비 이 비율 이상, 그리고 MIN_SLACK_MS 이상 느려지면 실패
+THRESHOLD = 0.25
+MIN_SLACK_MS = 1.0
+
+PROCESS_RUNS = 10
+FUNCTION_RUNS = 30
+CATALOG_SIZE = 2_000
+RENDER_CALLS = 10_000
+STAGED_FILES = 20_000
+PROMPT_TIMEOUT = 10.0
+CURSOR_POSITION_REQUEST = b"\033[6n"
+
+FAKE_BREW = """#!/bin/sh
+case "$1" in
+list) echo "snippy 1.0.0";;
+info) echo '{"formulae":[{"versions":{"stable":"99.0.0"}}]}';;
+esac
+"""
+
+# 일부는 emoji_table 에 없는 alias 라서 emoji 패키지 경로도 함께 측정됨
+EMOJI_CODES = (
+    ":sparkles:",
+    ":bug:",
+    ":memo:",
+    ":recycle:",
+    ":zap:",
+    ":rocket:",
+    ":heart:",
+    ":smile:",
+    ":thumbsup:",
+    ":star:",
+    "✨",
+    "",
+)
+
+
+class Workspace:
+    """Throwaway HOME, fake ``brew`` and repositories shared by the benchmarks."""
+
+    def __init__(self, path):
+        self.path = path
+        self.home = os.path.join(path, "home")
+        self.bin = os.path.join(path, "bin")
+        os.makedirs(os.path.join(self.home, ".snippy"))
+        os.makedirs(self.bin)
+        brew = os.path.join(self.bin, "brew")
+        with open(brew, "w") as f:
+            f.write(FAKE_BREW)
+        os.chmod(brew, 0o755)
+
+        self.env = dict(
+            os.environ,
+            HOME=self.home,
+            PATH=f"{self.bin}{os.pathsep}{os.environ.get('PATH', '')}",
+            PYTHONPATH=ROOT,
+            PYTHONDONTWRITEBYTECODE="",
+            SNIPPY_NO_DAEMON="1",
+            GIT_CONFIG_NOSYSTEM="1",
+            GIT_AUTHOR_NAME="bench",
+            GIT_AUTHOR_EMAIL="bench@example.com",
+            GIT_COMMITTER_NAME="bench",
+            GIT_COMMITTER_EMAIL="bench@example.com",
+            TERM="xterm",
+        )
+        self.env.pop("SNIPPY_TRACE", None)
+        self.env.pop("SNIPPY_VERSION_MANIFEST", None)
+        # in-process 벤치마크도 실제 ~/.snippy 를 건드리지 않도록 함
+        os.environ.update(
+            HOME=self.home, SNIPPY_NO_DAEMON="1", PATH=self.env["PATH"]
+        )
+        self.config_path = os.path.join(self.home, ".snippy", "config.json")
+        self.snapshot_path = os.path.join(self.home, ".snippy", "config.snapshot")
+        self.repos = {}
+
+    def write_config(self, **options):
+        from snippy.utils.config_store import write_config
+
+        config = {
+            "commit_template": "<type>: <emoji> <subject>",
+            "commit_types": make_catalog(12),
+            "update_check_ttl_hours": 0,
+        }
+        config.update(options)
+        write_config(config, self.config_path)
+
+    def git(self, repo, *args, **kwargs):
+        return subprocess.run(
+            ["git", "-C", repo, *args],
+            env=self.env,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            **kwargs,
+        )
+
+    def repo(self, name, files=1):
+        """Return a repository with ``files`` committed files, created once."""
+        if name in self.repos:
+            return self.repos[name]
+        path = os.path.join(self.path, name)
+        subprocess.run(["git", "init", "-q", path], check=True, env=self.env)
+        # 백그라운드 gc 가 측정에 끼어들거나 임시 디렉터리 정리와 겹치지 않도록 끔
+        self.git(path, "config", "gc.auto", "0")
+        self.git(path, "config", "maintenance.auto", "false")
+        for index in range(files):
+            directory = os.path.join(path, f"dir{index % 100}")
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, f"file{index}.txt"), "w") as f:
+                f.write(f"{index}\n")
+        self.git(path, "add", "-A")
+        self.git(path, "commit", "-qm", "init")
+        self.repos[name] = path
+        return path
+
+    def stage_change(self, repo, content):
+        with open(os.path.join(repo, "dir0", "file0.txt"), "w") as f:
+            f.write(f"{content}\n")
+        self.git(repo, "add", "dir0/file0.txt")
+
+    def snippy(self, *args):
+        return [sys.executable, "-m", "snippy.client", *args]
+
+
+def make_catalog(size):
+    return {
+        f"type{index}": {
+            "emoji": EMOJI_CODES[index % len(EMOJI_CODES)],
+            "description": f"커밋 타입 {index} / Commit type {index}",
+        }
+        for index in range(size)
+    }
+
+
+def time_call(function, runs=FUNCTION_RUNS, setup=None):
+    samples = []
+    for _ in range(runs):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def time_process(workspace, args, runs=PROCESS_RUNS, cwd=None, setup=None, **kwargs):
+    samples = []
+    # 첫 실행은 .pyc 생성 등이 섞이므로 버림
+    for run in range(runs + 1):
+        if setup is not None:
+            setup(run)
+        started = time.perf_counter()
+        result = subprocess.run(
+            args,
+            cwd=cwd,
+            env=workspace.env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **kwargs,
+        )
+        elapsed = time.perf_counter() - started
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"{' '.join(args)} exited with {result.returncode}: "
+                f"{result.stderr.decode(errors='replace').strip()}"
+            )
+        if run:
+            samples.append(elapsed)
+    return samples, result
+
+
+def run_with_terminal(workspace, args, cwd, answer, prompt):
+    """Run ``args`` on a pseudo-terminal, typing ``answer`` once ``prompt`` shows."""
+    import pty
+
+    started = time.perf_counter()
+    pid, fd = pty.fork()
+    if pid == 0:
+        try:
+            os.chdir(cwd)
+            os.execve(args[0], args, workspace.env)
+        finally:
+            os._exit(127)
+    output = b""
+    answered = False
+    deadline = time.monotonic() + PROMPT_TIMEOUT
+    try:
+        while time.monotonic() < deadline:
+            ready, _, _ = select.select([fd], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                chunk = os.read(fd, 65536)
+            except OSError:
+                break
+            if not chunk:
+                break
+            output += chunk
+            if CURSOR_POSITION_REQUEST in chunk:
+                # 응답이 없으면 prompt_toolkit 이 타임아웃까지 기다림
+                os.write(fd, b"\033[1;1R")
+            if not answered and prompt in output:
+                os.write(fd, answer)
+                answered = True
+    finally:
+        os.close(fd)
+        _, status = os.waitpid(pid, 0)
+    elapsed = time.perf_counter() - started
+    if not answered or os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(
+            f"{' '.join(args)} did not finish on a terminal: "
+            f"{output[-500:].decode(errors='replace')}"
+        )
+    return elapsed
+
+
+def bench_cold_help(workspace):
+    workspace.write_config()
+    return time_process(workspace, workspace.snippy("--help"))[0]
+
+
+def bench_cold_run_message(workspace):
+    # 타입/이모지를 끄면 picker 없이 -m 메시지로 바로 커밋
+    workspace.write_config(include_type=False, include_emoji=False)
+    repo = workspace.repo("run")
+    samples, _ = time_process(
+        workspace,
+        workspace.snippy("run", "-m", "Benchmark commit"),
+        cwd=repo,
+        setup=lambda run: workspace.stage_change(repo, f"message {run}"),
+    )
+    return samples
+
+
+def bench_cold_run_type(workspace):
+    # -t 와 -m 으로 모두 지정하면 prompt 라이브러리 없이 커밋
+    workspace.write_config()
+    repo = workspace.repo("run")
+    samples, _ = time_process(
+        workspace,
+        workspace.snippy("-t", "type1", "-m", "Benchmark commit"),
+        cwd=repo,
+        setup=lambda run: workspace.stage_change(repo, f"type {run}"),
+        stdin=subprocess.DEVNULL,
+    )
+    return samples
+
+
+def bench_cold_run_picker(workspace):
+    workspace.write_config()
+    repo = workspace.repo("run")
+    samples = []
+    for run in range(PROCESS_RUNS + 1):
+        workspace.stage_change(repo, f"picker {run}")
+        elapsed = run_with_terminal(
+            workspace,
+            workspace.snippy("run", "-m", "Benchmark commit"),
+            repo,
+            answer=b"\r",
+            prompt=b"Select commit type",
+        )
+        if run:
+            samples.append(elapsed)
+    return samples
+
+
+def bench_update_check(workspace):
+    workspace.write_config()
+    samples, result = time_process(
+        workspace, workspace.snippy("update"), input=b"n\n"
+    )
+    if b"Update cancelled" not in result.stdout:
+        raise RuntimeError("snippy update did not reach the update prompt")
+    return samples
+
+
+def bench_save_config(workspace):
+    from snippy.utils.config_schema import parse_config
+    from snippy.utils.config_store import write_config
+
+    config, _ = parse_config({"commit_types": make_catalog(CATALOG_SIZE)})
+    return time_call(lambda: write_config(config, workspace.config_path))
+
+
+def bench_load_config_cold(workspace):
+    from snippy.utils import config_cache
+
+    workspace.write_config(commit_types=make_catalog(CATALOG_SIZE))
+
+    def forget():
+        config_cache._loaded_snapshots.clear()
+        try:
+            os.unlink(workspace.snapshot_path)
+        except FileNotFoundError:
+            pass
+
+    return time_call(
+        lambda: config_cache.load_config_snapshot(
+            workspace.config_path, workspace.snapshot_path
+        ),
+        setup=forget,
+    )
+
+
+def bench_load_config_warm(workspace):
+    from snippy.utils import config_cache
+
+    workspace.write_config(commit_types=make_catalog(CATALOG_SIZE))
+    config_cache.load_config_snapshot(workspace.config_path, workspace.snapshot_path)
+    return time_call(
+        lambda: config_cache.load_config_snapshot(
+            workspace.config_path, workspace.snapshot_path
+        ),
+        setup=config_cache._loaded_snapshots.clear,
+    )
+
+
+def bench_load_layered_config_warm(workspace):
+    from snippy.utils import config_cache
+
+    # 저장소 루트 탐색 + layer stat 만으로 캐시된 merge 결과를 쓰는지 측정
+    workspace.write_config(commit_types=make_catalog(CATALOG_SIZE))
+    repo = workspace.repo("layered")
+    with open(os.path.join(repo, ".snippy.json"), "w") as f:
+        json.dump({"commit_template": "[<type>] <subject>"}, f)
+    start = os.path.join(repo, *[f"level{depth}" for depth in range(8)])
+    os.makedirs(start, exist_ok=True)
+    config_cache.load_config_snapshot(workspace.config_path, start=start)
+    return time_call(
+        lambda: config_cache.load_config_snapshot(workspace.config_path, start=start),
+        setup=config_cache._loaded_snapshots.clear,
+    )
+
+
+def bench_migrate_config(workspace):
+    from snippy.utils.config_schema import parse_config
+
+    # schema_version 이 없는 옛 설정 파일을 현재 버전의 Config 로 읽는 비용
+    config = {"commit_types": make_catalog(CATALOG_SIZE)}
+    parse_config(config)
+    return time_call(lambda: parse_config(config))
+
+
+def bench_render_template(workspace):
+    from snippy.utils.template_utils import compile_template
+
+    template = compile_template("[<scope>] <type>: <emoji> <subject>")
+
+    def render():
+        for _ in range(RENDER_CALLS):
+            template.render("feat", "✨", "Add a benchmark suite", "cli")
+
+    return time_call(render)
+
+
+def bench_build_choices(workspace):
+    from snippy.utils.config_cache import build_commit_type_choices
+    from snippy.utils.config_schema import parse_config
+
+    config, _ = parse_config({"commit_types": make_catalog(CATALOG_SIZE)})
+    commit_types = config.commit_types
+    return time_call(lambda: build_commit_type_choices(commit_types, True, True))
+
+
+def bench_staged_check(workspace, backend_name):
+    from snippy.utils.git_backend import get_git_backend
+
+    repo = workspace.repo("large", files=STAGED_FILES)
+    workspace.stage_change(repo, "staged")
+    previous = os.getcwd()
+    os.chdir(repo)
+    try:
+        backend = get_git_backend(backend_name)
+        if not backend.has_staged_changes():
+            raise RuntimeError(f"{backend_name} backend missed the staged change")
+        return time_call(backend.has_staged_changes, runs=PROCESS_RUNS)
+    finally:
+        os.chdir(previous)
+
+
+BENCHMARKS = {
+    "cold_help": bench_cold_help,
+    "cold_run_message": bench_cold_run_message,
+    "cold_run_type": bench_cold_run_type,
+    "cold_run_picker": bench_cold_run_picker,
+    "cold_update_check": bench_update_check,
+    "save_config_2k": bench_save_config,
+    "load_config_cold_2k": bench_load_config_cold,
+    "load_config_warm_2k": bench_load_config_warm,
+    "load_layered_config_warm_2k": bench_load_layered_config_warm,
+    "migrate_config_2k": bench_migrate_config,
+    "render_template_10k": bench_render_template,
+    "build_choices_2k": bench_build_choices,
+    "staged_check_subprocess_20k": lambda w: bench_staged_check(w, "subprocess"),
+    "staged_check_index_20k": lambda w: bench_staged_check(w, "index"),
+}
+
+
+def run_benchmarks(names):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Workspace(tmp)
+        for name in names:
+            samples = BENCHMARKS[name](workspace)
+            results[name] = round(statistics.median(samples) * 1e3, 3)
+            print(f"{name:>28}: {results[name]:10.2f}ms", flush=True)
+    return results
+
+
+def load_baseline(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_baseline(path, results):
+    baseline = {
+        "machine": f"{platform.system()} {platform.machine()}",
+        "python": platform.python_version(),
+        "results": results,
+    }
+    if os.path.exists(path):
+        # 일부만 다시 측정한 경우 나머지 항목은 유지
+        previous = load_baseline(path).get("results", {})
+        baseline["results"] = {**previous, **results}
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=4, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results, baseline, threshold):
+    """Print each result against the baseline and return the names that regressed."""
+    failures = []
+    print()
+    for name, value in results.items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            print(f"{name:>28}: no baseline")
+            continue
+        change = (value - previous) / previous * 100 if previous else 0.0
+        limit = max(previous * (1 + threshold), previous + MIN_SLACK_MS)
+        status = "FAIL" if value > limit else "ok"
+        print(
+            f"{name:>28}: {previous:10.2f}ms -> {value:10.2f}ms "
+            f"({change:+6.1f}%)  {status}"
+        )
+        if value > limit:
+            failures.append(name)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        default=[],
+        help="Only run benchmarks whose name contains this (repeatable).",
+    )
+    parser.add_argument("--save", action="store_true", help="Record the baseline.")
+    parser.add_argument(
+        "--compare", action="store_true", help="Fail when a result regressed."
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"Allowed slowdown as a fraction (default: {THRESHOLD}).",
+    )
+    args = parser.parse_args()
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if not args.patterns or any(pattern in name for pattern in args.patterns)
+    ]
+    if not names:
+        parser.error("no benchmark matches -k")
+    if shutil.which("git") is None:
+        parser.error("git is required")
+
+    results = run_benchmarks(names)
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"\nBaseline written to {args.baseline}")
+    if args.compare:
+        baseline = load_baseline(args.baseline)
+        failures = compare(results, baseline, args.threshold)
+        if failures:
+            # 한 번의 측정 잡음으로 실패하지 않도록 느려진 항목만 다시 측정해서 확인
+            print("\nRe-running the regressed benchmarks to confirm...")
+            rerun = run_benchmarks(failures)
+            confirmed = {name: min(results[name], rerun[name]) for name in failures}
+            failures = compare(confirmed, baseline, args.threshold)
+        for name in failures:
+            print(f"FAIL {name} regressed past {args.threshold:.0%}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""Generate snippy/utils/emoji_table.py from the `emoji` package.
+
+Usage:
+    python scripts/generate_emoji_table.py          # rewrite the table
+    python scripts/generate_emoji_table.py --check  # fail if the shipped table is stale
+"""
+
+import argparse
+import os
+import sys
+
+import emoji
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLE_PATH = os.path.join(ROOT, "snippy", "utils", "emoji_table.py")
+
+# 기본 커밋 타입 + gitmoji 에서 쓰는 alias
+ALIASES = [
+    ":adhesive_bandage:",
+    ":alembic:",
+    ":alien:",
+    ":ambulance:",
+    ":arrow_down:",
+    ":arrow_up:",
+    ":art:",
+    ":beers:",
+    ":bento:",
+    ":bookmark:",
+    ":boom:",
+    ":bricks:",
+    ":bug:",
+    ":building_construction:",
+    ":bulb:",
+    ":busts_in_silhouette:",
+    ":camera_flash:",
+    ":card_file_box:",
+    ":chart_with_upwards_trend:",
+    ":children_crossing:",
+    ":closed_lock_with_key:",
+    ":clown_face:",
+    ":coffin:",
+    ":construction:",
+    ":construction_worker:",
+    ":dizzy:",
+    ":egg:",
+    ":fire:",
+    ":globe_with_meridians:",
+    ":goal_net:",
+    ":green_heart:",
+    ":heavy_minus_sign:",
+    ":heavy_plus_sign:",
+    ":iphone:",
+    ":label:",
+    ":lipstick:",
+    ":lock:",
+    ":loud_sound:",
+    ":mag:",
+    ":memo:",
+    ":money_with_wings:",
+    ":monocle_face:",
+    ":mute:",
+    ":necktie:",
+    ":package:",
+    ":page_facing_up:",
+    ":passport_control:",
+    ":pencil2:",
+    ":poop:",
+    ":pushpin:",
+    ":recycle:",
+    ":rewind:",
+    ":rocket:",
+    ":rotating_light:",
+    ":safety_vest:",
+    ":see_no_evil:",
+    ":seedling:",
+    ":sparkles:",
+    ":speech_balloon:",
+    ":stethoscope:",
+    ":tada:",
+    ":technologist:",
+    ":test_tube:",
+    ":thread:",
+    ":triangular_flag_on_post:",
+    ":truck:",
+    ":twisted_rightwards_arrows:",
+    ":wastebasket:",
+    ":wheelchair:",
+    ":white_check_mark:",
+    ":wrench:",
+    ":zap:",
+]
+
+
+def build_table():
+    table = {}
+    for alias in sorted(set(ALIASES)):
+        glyph = emoji.emojize(alias, language="alias")
+        if glyph == alias:
+            raise SystemExit(f"`emoji` does not know the alias {alias}")
+        table[alias] = glyph
+    return table
+
+
+def render_table(table):
+    lines = [
+        "# Generated by scripts/generate_emoji_table.py. Do not edit by hand.",
+        f"# emoji=={emoji.__version__}",
+        "",
+        "EMOJI_ALIASES = {",
+    ]
+    lines.extend(f'    "{alias}": "{glyph}",' for alias, glyph in table.items())
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Verify that every shipped alias matches `emoji`.",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        sys.path.insert(0, ROOT)
+        from snippy.utils.emoji_table import EMOJI_ALIASES
+
+        mismatches = [
+            f"{alias}: table has {glyph!r}, emoji has "
+            f"{emoji.emojize(alias, language='alias')!r}"
+            for alias, glyph in EMOJI_ALIASES.items()
+            if emoji.emojize(alias, language="alias") != glyph
+        ]
+        missing = sorted(set(ALIASES) - set(EMOJI_ALIASES))
+        mismatches.extend(f"{alias}: missing from table" for alias in missing)
+        for mismatch in mismatches:
+            print(f"FAIL {mismatch}", file=sys.stderr)
+        print(f"checked {len(EMOJI_ALIASES)} aliases")
+        return 1 if mismatches else 0
+
+    with open(TABLE_PATH, "w") as f:
+        f.write(render_table(build_table()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
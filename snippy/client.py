@@ -0,0 +1,120 @@
+"""Console entry point.
+
+Forwards the invocation to a running ``snippy daemon`` when there is one and
+falls back to running the click app in-process otherwise. Only the standard
+library is imported here so the forwarding path stays cheap.
+"""
+
+import os
+import struct
+import sys
+
+from snippy.constants import DAEMON_SOCKET_PATH
+from snippy.utils.trace import span, start_tracing_from
+
+HEADER = struct.Struct("!i")
+
+# 터미널에서 client 로 전달된 시그널을 daemon 의 worker 로 그대로 넘김
+FORWARDED_SIGNALS = ("SIGINT", "SIGTERM", "SIGHUP", "SIGWINCH")
+
+# daemon 에 넘기지 않고 항상 현재 프로세스에서 실행하는 서브커맨드
+IN_PROCESS_COMMANDS = ("daemon",)
+
+
+def recv_exactly(sock, size):
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def send_request(sock, request, fds=()):
+    import json
+    import socket
+
+    payload = json.dumps(request).encode()
+    socket.send_fds(sock, [HEADER.pack(len(payload))], list(fds))
+    sock.sendall(payload)
+
+
+def connect_daemon(path=DAEMON_SOCKET_PATH):
+    # hook 경로는 daemon 을 쓰지 않으므로 socket/json 은 필요할 때 import
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward_to_daemon(argv):
+    """Run ``argv`` in the daemon. Returns the exit code, or None if it did not run."""
+    import signal
+
+    sock = connect_daemon()
+    if sock is None:
+        return None
+
+    with sock:
+        try:
+            send_request(
+                sock,
+                {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)},
+                fds=(0, 1, 2),
+            )
+            header = recv_exactly(sock, HEADER.size)
+        except OSError:
+            return None
+        if header is None:
+            # worker 가 시작되기 전에 daemon 이 연결을 끊음 (종료/업데이트 중)
+            return None
+        worker_pid = HEADER.unpack(header)[0]
+
+        def forward_signal(signum, frame):
+            try:
+                os.kill(worker_pid, signum)
+            except ProcessLookupError:
+                pass
+
+        for name in FORWARDED_SIGNALS:
+            if hasattr(signal, name):
+                signal.signal(getattr(signal, name), forward_signal)
+
+        status = recv_exactly(sock, HEADER.size)
+        if status is None:
+            return 1
+        return HEADER.unpack(status)[0]
+
+
+def run_in_process():
+    start_tracing_from(sys.argv[1:])
+    with span("import snippy.main"):
+        from snippy.main import cli
+
+    cli()
+
+
+def main():
+    argv = sys.argv[1:]
+    command = argv[0] if argv else None
+    if command == "hook":
+        # 설치된 git hook 이 부르는 경로, daemon 과 click 을 거치지 않음
+        from snippy.hook import HOOKS, main as run_hook
+
+        if argv[1:2] and argv[1] in HOOKS:
+            sys.exit(run_hook(argv[1:]))
+    if not os.environ.get("SNIPPY_NO_DAEMON") and command not in IN_PROCESS_COMMANDS:
+        exit_code = forward_to_daemon(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+    run_in_process()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+import hashlib
+import json
+import os
+import stat
+import sys
+import time
+
+import click
+
+from snippy.commands.config import load_snapshot
+from snippy.utils.config_schema import get_type_name
+from snippy.utils.git_utils import get_subprocess_module
+from snippy.utils.template_utils import compile_template
+
+BATCH_REF = "refs/snippy/batch"
+
+
+class RecordError(Exception):
+    pass
+
+
+def git_output(*args):
+    subprocess = get_subprocess_module()
+    result = subprocess.run(
+        ["git", *args], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout
+
+
+def resolve_head():
+    subprocess = get_subprocess_module()
+    result = subprocess.run(
+        ["git", "rev-parse", "--verify", "-q", "HEAD"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    # 첫 커밋 전(unborn HEAD)이면 None
+    return result.stdout.strip() or None
+
+
+def quote_path(path):
+    if path.startswith('"') or "\n" in path or "\\" in path:
+        escaped = path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'
+    return path
+
+
+def blob_id(content, hash_name):
+    digest = hashlib.new(hash_name)
+    digest.update(b"blob %d\0" % len(content))
+    digest.update(content)
+    return digest.hexdigest()
+
+
+class FastImport:
+    """A single long-lived ``git fast-import`` process that builds every commit."""
+
+    def __init__(self, ref, parent):
+        subprocess = get_subprocess_module()
+        self.ref = ref
+        # 이번 세션에서 만든 커밋은 checkpoint 전까지 mark 로만 참조할 수 있음
+        self.parent = parent
+        self.head = parent
+        self.marks = 0
+        self.process = subprocess.Popen(
+            ["git", "fast-import", "--quiet", "--done", "--force"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def write(self, data):
+        self.process.stdin.write(data)
+
+    def write_data(self, content):
+        self.write(b"data %d\n" % len(content))
+        self.write(content)
+        self.write(b"\n")
+
+    def ls(self, path):
+        # 부모 커밋에서 path 의 (mode, object id), 없으면 None
+        if self.parent is None:
+            return None
+        self.write(f"ls {self.parent} {quote_path(path)}\n".encode())
+        self.process.stdin.flush()
+        response = self.process.stdout.readline().decode()
+        if not response or response.startswith("missing "):
+            return None
+        mode, _, object_id = response.split("\t", 1)[0].split(" ")
+        return mode, object_id
+
+    def commit(self, message, author, committer, changes):
+        self.marks += 1
+        mark = f":{self.marks}"
+        self.write(f"commit {self.ref}\nmark {mark}\n".encode())
+        self.write(f"author {author}\ncommitter {committer}\n".encode())
+        self.write_data(message.encode())
+        if self.parent is not None:
+            self.write(f"from {self.parent}\n".encode())
+        for path, mode, content in changes:
+            if mode is None:
+                self.write(f"D {quote_path(path)}\n".encode())
+            else:
+                self.write(f"M {mode} inline {quote_path(path)}\n".encode())
+                self.write_data(content)
+        self.write(f"\nget-mark {mark}\n".encode())
+        self.process.stdin.flush()
+        self.parent = mark
+        self.head = self.process.stdout.readline().decode().strip()
+        return self.head
+
+    def close(self):
+        self.write(b"done\n")
+        self.process.stdin.close()
+        self.process.stdout.close()
+        return self.process.wait()
+
+
+def read_change(toplevel, path):
+    full_path = os.path.join(toplevel, path)
+    try:
+        info = os.lstat(full_path)
+    except FileNotFoundError:
+        return path, None, None
+    if stat.S_ISLNK(info.st_mode):
+        return path, "120000", os.readlink(full_path).encode()
+    if stat.S_ISDIR(info.st_mode):
+        raise RecordError(f"{path} is a directory; list the files to commit.")
+    mode = "100755" if info.st_mode & stat.S_IXUSR else "100644"
+    with open(full_path, "rb") as file:
+        return path, mode, file.read()
+
+
+def repo_path(toplevel, cwd, path):
+    full_path = os.path.normpath(os.path.join(cwd, path))
+    relative = os.path.relpath(full_path, toplevel)
+    if relative == "." or relative.startswith(".." + os.sep) or relative == "..":
+        raise RecordError(f"{path} is outside the repository.")
+    return relative.replace(os.sep, "/")
+
+
+def render_record(record, snapshot, template):
+    config = snapshot["config"]
+    include_type = config.include_type
+    include_emoji = config.include_emoji
+
+    subject = record.get("subject")
+    if not subject:
+        raise RecordError("subject is required.")
+
+    commit_type, emoji = "", ""
+    if include_type or include_emoji:
+        commit_type = record.get("type") or ""
+        if commit_type not in config.commit_types:
+            raise RecordError(f"unknown commit type '{commit_type}'.")
+        if include_emoji:
+            emoji = config.commit_types[commit_type].emoji
+        if not include_type:
+            commit_type = ""
+    return template.render(get_type_name(commit_type), emoji, subject)
+
+
+def parse_record(line):
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise RecordError(f"invalid JSON: {e}")
+    if not isinstance(record, dict):
+        raise RecordError("each line must be a JSON object.")
+    for key in ("type", "subject"):
+        if record.get(key) is not None and not isinstance(record[key], str):
+            raise RecordError(f"{key} must be a string.")
+    paths = record.get("paths")
+    if not paths or not isinstance(paths, list):
+        raise RecordError("paths must be a non-empty list.")
+    if not all(path and isinstance(path, str) for path in paths):
+        raise RecordError("paths must only hold non-empty strings.")
+    return record
+
+
+def run_batch(lines):
+    snapshot = load_snapshot()
+    template = compile_template(
+        snapshot["config"].commit_template, snapshot["template_tokens"]
+    )
+    toplevel = git_output("rev-parse", "--show-toplevel").strip()
+    cwd = os.getcwd()
+    author = git_output("var", "GIT_AUTHOR_IDENT").strip()
+    committer = git_output("var", "GIT_COMMITTER_IDENT").strip()
+    head = resolve_head()
+    hash_name = git_output("rev-parse", "--show-object-format").strip() or "sha1"
+
+    importer = FastImport(BATCH_REF, head)
+    committed_paths = set()
+    created = failed = 0
+    started = time.perf_counter()
+
+    # 중간에 실패해도 임시 ref 가 남지 않도록 항상 지움
+    try:
+        try:
+            for number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = parse_record(line)
+                    message = render_record(record, snapshot, template)
+                    changes = [
+                        read_change(toplevel, repo_path(toplevel, cwd, path))
+                        for path in record["paths"]
+                    ]
+                    if all(
+                        importer.ls(path)
+                        == (
+                            None
+                            if mode is None
+                            else (mode, blob_id(content, hash_name))
+                        )
+                        for path, mode, content in changes
+                    ):
+                        raise RecordError("nothing to commit.")
+                except RecordError as e:
+                    failed += 1
+                    click.echo(
+                        click.style(f"[{number}] failed: {e}", fg="red"), err=True
+                    )
+                    continue
+
+                commit_id = importer.commit(message, author, committer, changes)
+                committed_paths.update(path for path, _, _ in changes)
+                created += 1
+                click.echo(f"[{number}] {commit_id[:7]} {message}")
+        finally:
+            returncode = importer.close()
+
+        if returncode != 0:
+            raise click.ClickException(
+                "git fast-import failed; HEAD was not updated."
+            )
+
+        if created:
+            git_output(
+                "update-ref", "-m", "snippy batch", "HEAD", importer.head, head or ""
+            )
+            sync_index(toplevel, committed_paths)
+    finally:
+        delete_batch_ref()
+
+    elapsed = time.perf_counter() - started
+    rate = created / elapsed if elapsed else 0.0
+    click.echo(
+        click.style(
+            f"Created {created} commits in {elapsed:.2f}s ({rate:.1f} commits/s), "
+            f"{failed} failed.",
+            fg="green" if not failed else "yellow",
+            bold=True,
+        ),
+        err=True,
+    )
+    return failed
+
+
+def delete_batch_ref():
+    # fast-import 가 ref 를 만들기 전에 실패했을 수도 있으므로 오류는 무시
+    subprocess = get_subprocess_module()
+    subprocess.run(
+        ["git", "update-ref", "-d", BATCH_REF],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def sync_index(toplevel, paths):
+    # 커밋된 경로는 이제 HEAD 와 작업 트리가 같으므로 index 도 맞춰 줌
+    subprocess = get_subprocess_module()
+    subprocess.run(
+        ["git", "update-index", "-q", "--add", "--remove", "-z", "--stdin"],
+        input=b"".join(path.encode() + b"\0" for path in sorted(paths)),
+        cwd=toplevel,
+        check=True,
+    )
+
+
+@click.command(name="batch")
+def batch_command():
+    """Create templated commits from JSONL records on stdin.
+
+    Each line is {"type": ..., "subject": ..., "paths": [...]}. The listed
+    paths are committed with their current working-tree contents.
+    """
+    failed = run_batch(sys.stdin)
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,252 @@
+import re
+import sys
+
+import click
+
+from snippy.commands.config import load_snapshot
+from snippy.utils.git_utils import CatFileBatch, iter_git_records, verify_range
+from snippy.utils.progress import progress
+from snippy.utils.repo_cache import open_repo_cache
+from snippy.utils.template_utils import build_type_classifier, compile_template
+
+# 한 번에 cat-file 로 읽고 cache 에 기록하는 커밋 수
+CHANGELOG_BATCH_SIZE = 1024
+
+# 파싱 규칙이 바뀌면 올림, cache 의 PRAGMA user_version 과 다르면 다시 파싱
+CHANGELOG_CACHE_FORMAT = 1
+
+BREAKING_PATTERN = re.compile(r"^BREAKING[ -]CHANGE:\s*(.+)$", re.MULTILINE)
+
+# 파싱 결과는 템플릿별로 저장되므로 commit types 를 바꿔도 다시 파싱하지 않음
+CHANGELOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    sha TEXT NOT NULL,
+    template TEXT NOT NULL,
+    type TEXT,
+    emoji TEXT,
+    scope TEXT,
+    subject TEXT,
+    line TEXT NOT NULL,
+    breaking TEXT,
+    PRIMARY KEY (sha, template)
+) WITHOUT ROWID;
+CREATE TEMP TABLE IF NOT EXISTS range_commits (
+    position INTEGER PRIMARY KEY,
+    sha TEXT NOT NULL
+);
+CREATE TEMP TABLE IF NOT EXISTS sections (
+    type TEXT,
+    emoji TEXT,
+    position INTEGER NOT NULL
+);
+"""
+
+
+def parse_commit(content, matcher):
+    """Return (type, emoji, scope, subject, line, breaking) for a raw commit object."""
+    headers, _, message = content.partition(b"\n\n")
+    encoding = "utf-8"
+    for header in headers.split(b"\n"):
+        if header.startswith(b"encoding "):
+            encoding = header[len(b"encoding ") :].decode("ascii", "replace")
+    try:
+        message = message.decode(encoding, "replace")
+    except LookupError:
+        message = message.decode("utf-8", "replace")
+
+    line, _, body = message.partition("\n")
+    line = line.strip()
+    breaking = BREAKING_PATTERN.search(body)
+    breaking = breaking.group(1).strip() if breaking else None
+    match = matcher.match(line)
+    if match is None:
+        return None, None, None, None, line, breaking
+    groups = match.groupdict()
+    return (
+        groups.get("type"),
+        groups.get("emoji"),
+        groups.get("scope") or None,
+        groups.get("subject"),
+        line,
+        breaking,
+    )
+
+
+def open_changelog_cache():
+    connection = open_repo_cache("changelog", CHANGELOG_SCHEMA)
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+    if version != CHANGELOG_CACHE_FORMAT:
+        with connection:
+            connection.execute("DELETE FROM commits")
+        connection.execute(f"PRAGMA user_version = {CHANGELOG_CACHE_FORMAT}")
+    return connection
+
+
+def load_range(connection, revision_range, include_merges=False):
+    args = ["log", "-z", "--format=%H"]
+    if not include_merges:
+        args.append("--no-merges")
+    args.append(revision_range)
+    connection.execute("DELETE FROM range_commits")
+    connection.executemany(
+        "INSERT INTO range_commits (sha) VALUES (?)",
+        ((sha,) for sha in iter_git_records(args) if sha),
+    )
+
+
+def update_cache(connection, template, matcher):
+    """Parse the commits of the loaded range that are not cached yet.
+
+    Returns the number of commits parsed. Each batch is committed on its own,
+    so an interrupted run keeps what it already parsed.
+    """
+    parsed = 0
+    last_position = 0
+    with CatFileBatch() as reader:
+        while True:
+            rows = connection.execute(
+                """
+                SELECT position, sha FROM range_commits AS r
+                WHERE position > ? AND NOT EXISTS (
+                    SELECT 1 FROM commits AS c
+                    WHERE c.sha = r.sha AND c.template = ?
+                )
+                ORDER BY position LIMIT ?
+                """,
+                (last_position, template, CHANGELOG_BATCH_SIZE),
+            ).fetchall()
+            if not rows:
+                return parsed
+            last_position = rows[-1][0]
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (sha, template, *parse_commit(content, matcher))
+                        for sha, object_type, content in reader.read_many(
+                            sha for _, sha in rows
+                        )
+                        if object_type == "commit"
+                    ),
+                )
+            parsed += len(rows)
+
+
+def load_sections(connection, template, snapshot):
+    """Fill the sections table for the loaded range and return the headings.
+
+    ``headings`` maps a section position to its (emoji, description). Each
+    parsed (type, emoji) pair in the range is classified once with the same
+    rules ``stats`` uses, so both commands agree on every commit.
+    """
+    config = snapshot["config"]
+    classify = build_type_classifier(
+        config, compile_template(config.commit_template, snapshot["template_tokens"])
+    )
+    positions = {
+        commit_type: position
+        for position, commit_type in enumerate(config.commit_types)
+    }
+
+    headings = {}
+    connection.execute("DELETE FROM sections")
+    pairs = connection.execute(
+        """
+        SELECT DISTINCT c.type, c.emoji FROM range_commits AS r
+        JOIN commits AS c ON c.sha = r.sha AND c.template = ?
+        """,
+        (template,),
+    ).fetchall()
+    for commit_type, emoji in pairs:
+        key = classify(commit_type, emoji)
+        if key is None:
+            continue
+        position = positions[key]
+        commit_data = config.commit_types[key]
+        headings[position] = (commit_data.emoji, commit_data.description)
+        connection.execute(
+            "INSERT INTO sections VALUES (?, ?, ?)", (commit_type, emoji, position)
+        )
+    return headings
+
+
+def iter_changelog(connection, template, headings):
+    """Yield the Markdown changelog in chunks, one query row at a time."""
+    breaking_rows = connection.execute(
+        """
+        SELECT c.sha, c.breaking FROM range_commits AS r
+        JOIN commits AS c ON c.sha = r.sha AND c.template = ?
+        WHERE c.breaking IS NOT NULL
+        ORDER BY r.position
+        """,
+        (template,),
+    )
+    first = True
+    for sha, breaking in breaking_rows:
+        if first:
+            yield "## ⚠️ Breaking Changes\n\n"
+            first = False
+        yield f"- {breaking} ({sha[:7]})\n"
+    if not first:
+        yield "\n"
+
+    rows = connection.execute(
+        """
+        SELECT s.position, c.sha, c.scope, c.subject, c.line
+        FROM range_commits AS r
+        JOIN commits AS c ON c.sha = r.sha AND c.template = ?
+        LEFT JOIN sections AS s ON s.type IS c.type AND s.emoji IS c.emoji
+        ORDER BY s.position IS NULL, s.position, r.position
+        """,
+        (template,),
+    )
+    current = -1
+    for position, sha, scope, subject, line in rows:
+        if position != current:
+            if current != -1:
+                yield "\n"
+            if position is None:
+                yield "## Other\n\n"
+            else:
+                emoji, description = headings[position]
+                yield f"## {emoji} {description}".rstrip() + "\n\n"
+            current = position
+        if position is None:
+            yield f"- {line} ({sha[:7]})\n"
+        elif scope:
+            yield f"- **{scope}:** {subject} ({sha[:7]})\n"
+        else:
+            yield f"- {subject} ({sha[:7]})\n"
+
+
+@click.command(name="changelog")
+@click.argument("revision_range")
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w", encoding="utf-8"),
+    default="-",
+    help="Write the Markdown to a file instead of stdout.",
+)
+@click.option("--include-merges", is_flag=True, help="Also list merge commits.")
+def changelog_command(revision_range, output, include_merges):
+    """Write a Markdown changelog for REVISION_RANGE grouped by commit type."""
+    verify_range(revision_range)
+    snapshot = load_snapshot()
+    template_source = snapshot["config"].commit_template
+    matcher = compile_template(
+        template_source, snapshot["template_tokens"]
+    ).matcher()
+
+    connection = open_changelog_cache()
+    try:
+        # stdout 은 changelog 본문이므로 진행 표시는 stderr 에
+        with progress("Reading commits...", stream=sys.stderr):
+            load_range(connection, revision_range, include_merges)
+            parsed = update_cache(connection, template_source, matcher)
+        headings = load_sections(connection, template_source, snapshot)
+        for chunk in iter_changelog(connection, template_source, headings):
+            output.write(chunk)
+    finally:
+        connection.close()
+    click.echo(f"Parsed {parsed} new commits.", err=True)
@@ -1,22 +1,12 @@
+import sys
+
 import click
-from InquirerPy import inquirer
-from InquirerPy.separator import Separator
-from InquirerPy.validator import EmptyInputValidator
-
-from snippy.utils.emoji_utils import emojize_if_valid
-from snippy.utils.git_utils import get_subprocess_module, warn_if_no_staged_files
-
-
-def format_commit_type(base_type, commit_data, include_type, include_emoji):
-    if include_type and include_emoji:
-        return f"{base_type} ({emojize_if_valid(commit_data['emoji'])}) - {commit_data['description']}"
-    elif include_type:
-        return f"{base_type} - {commit_data['description']}"
-    elif include_emoji:
-        return (
-            f"{emojize_if_valid(commit_data['emoji'])} - {commit_data['description']}"
-        )
-    return f"{base_type} - {commit_data['description']}"
+
+from snippy.utils.config_cache import build_commit_type_choices
+from snippy.utils.fuzzy_utils import use_search_index
+from snippy.utils.git_backend import get_git_backend
+from snippy.utils.git_utils import warn_if_no_staged_files
+from snippy.utils.trace import span
 
 
 def select_commit_type(
@@ -25,40 +15,131 @@ def select_commit_type(
     include_emoji=True,
     show_add_new=False,
     show_delete=False,
+    choices=None,
+    search_index=None,
+    order=None,
 ):
-    choices = []
-    for commit_type, commit_data in commit_types.items():
-        base_type = commit_type.split("_")[0]
-        display = format_commit_type(
-            base_type, commit_data, include_type, include_emoji
-        )
-        choices.append({"name": display, "value": (commit_type, commit_data["emoji"])})
+    with span("import InquirerPy"):
+        from InquirerPy import inquirer
+        from InquirerPy.separator import Separator
+        from InquirerPy.validator import EmptyInputValidator
+
+    if choices is None:
+        choices = build_commit_type_choices(commit_types, include_type, include_emoji)
+    elif order is not None:
+        choices = [choices[i] for i in order]
+    else:
+        choices = list(choices)
 
+    if show_add_new or show_delete:
+        # 항목이 추가되면 미리 만든 인덱스와 순서가 맞지 않으므로 새로 만듦
+        search_index = order = None
     if show_add_new:
         choices.append(Separator())
         choices.append({"name": "+ Add a new type", "value": "add"})
     if show_delete:
         choices.append({"name": "- Delete a type", "value": "delete"})
 
-    result = inquirer.fuzzy(
-        message="Select commit type:",
-        choices=choices,
-        default="",
-        border=True,
-        info=False,
-        instruction="(Type to search)",
-        vi_mode=False,
-        match_exact=False,
-        long_instruction="↑↓ to move, Enter to select",
-        validate=EmptyInputValidator(),
-        mandatory=True,
-    ).execute()
-
-    return result
-
-
-def commit_with_warning(commit_message):
-    warn_if_no_staged_files(commit_message)
-    subprocess = get_subprocess_module()
-    subprocess.run(["git", "commit", "-m", commit_message])
+    with span("build picker"):
+        prompt = inquirer.fuzzy(
+            message="Select commit type:",
+            choices=choices,
+            default="",
+            border=True,
+            info=False,
+            instruction="(Type to search)",
+            vi_mode=False,
+            match_exact=False,
+            long_instruction="↑↓ to move, Enter to select",
+            validate=EmptyInputValidator(),
+            mandatory=True,
+        )
+
+    prompt = use_search_index(prompt, search_index, order)
+    with span("select commit type"):
+        return prompt.execute()
+
+
+def resolve_commit_type(commit_types, type_name):
+    """Return (commit_type, emoji) for a type given with ``-t``.
+
+    Unknown types raise a UsageError that suggests the closest configured type.
+    """
+    commit_data = commit_types.get(type_name)
+    if commit_data is not None:
+        return type_name, commit_data.emoji
+
+    import difflib
+
+    matches = difflib.get_close_matches(type_name, commit_types, n=1, cutoff=0.5)
+    if not matches:
+        matches = [t for t in commit_types if t.lower() == type_name.lower()]
+    hint = f" Did you mean '{matches[0]}'?" if matches else ""
+    raise click.UsageError(
+        f"Unknown commit type '{type_name}'.{hint} "
+        f"Configured types: {', '.join(commit_types)}."
+    )
+
+
+def commit_with_warning(commit_message, has_staged=None):
+    backend = get_git_backend()
+    with span("check staged files", cached=has_staged is not None):
+        warn_if_no_staged_files(commit_message, backend, has_staged)
+    with span("git commit"):
+        returncode = backend.commit(commit_message)
+    if returncode != 0:
+        # git 이 이미 오류를 출력했으므로 exit code 만 그대로 넘김
+        sys.exit(returncode)
     click.echo(click.style("Commit successful!", fg="green", bold=True))
+
+
+def commit_in_repos(commit_message, repo_patterns, jobs):
+    """Commit ``commit_message`` in every matching repo and print a summary."""
+    from snippy.utils.io_utils import run_async
+    from snippy.utils.multi_repo import (
+        STATUS_COMMITTED,
+        STATUS_FAILED,
+        commit_repos,
+        expand_repos,
+    )
+    from snippy.utils.progress import progress
+
+    repos = expand_repos(repo_patterns)
+    if not repos:
+        click.echo(click.style("No repositories matched --repos.", fg="red"))
+        sys.exit(1)
+
+    click.echo(
+        f"Committing in {len(repos)} repositories "
+        f"({jobs} git processes at a time)..."
+    )
+    with progress("Committing", total=len(repos)) as reporter:
+        results = run_async(
+            commit_repos,
+            repos,
+            commit_message,
+            jobs,
+            on_result=lambda result: reporter.advance(),
+        )
+
+    marks = {
+        STATUS_COMMITTED: click.style("✔", fg="green"),
+        STATUS_FAILED: click.style("✘", fg="red"),
+    }
+    width = max(len(result.repo) for result in results)
+    counts = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+        mark = marks.get(result.status, click.style("-", fg="yellow"))
+        detail = f"  {result.detail}" if result.detail else ""
+        click.echo(f"{mark} {result.repo:<{width}}  {result.status}{detail}")
+
+    click.echo(
+        click.style(
+            ", ".join(f"{count} {status}" for status, count in counts.items()),
+            fg="red" if counts.get(STATUS_FAILED) else "green",
+            bold=True,
+        )
+    )
+    if counts.get(STATUS_FAILED):
+        sys.exit(1)
@@ -1,35 +1,24 @@
-import json
-
 import click
-from InquirerPy import inquirer
-from InquirerPy.base.control import Choice
-from InquirerPy.separator import Separator
-
-from snippy.constants import CONFIG_PATH, OFF_RED, ON_GREEN, RAW_COMMIT_TYPES, SEPARATOR
-from snippy.utils.emoji_utils import emojize_commit_types, emojize_if_valid
-from snippy.utils.io_utils import run_async
-
 
-def get_default_config():
-    return {
-        "commit_template": "<type>: <emoji> <subject>",
-        "commit_types": emojize_commit_types(RAW_COMMIT_TYPES),
-    }
+from snippy.constants import CONFIG_PATH, OFF_RED, ON_GREEN, SEPARATOR
+from snippy.utils.config_cache import load_config_snapshot
+from snippy.utils.config_schema import CommitType, get_default_config, get_type_name
+from snippy.utils.config_store import ConfigStore, write_config
+from snippy.utils.emoji_utils import emojize_if_valid
+from snippy.utils.fuzzy_utils import use_search_index
+from snippy.utils.template_utils import compile_template, render_example
 
 
-async def load_config_async():
-    try:
-        with open(CONFIG_PATH, "r") as file:
-            return json.load(file)
-    except FileNotFoundError:
-        default_config = get_default_config()
-        save_config(default_config)
-        return default_config
+def load_snapshot(start=None):
+    snapshot = load_config_snapshot(start=start)
+    if snapshot is None:
+        save_config(get_default_config())
+        snapshot = load_config_snapshot(start=start)
+    return snapshot
 
 
 def save_config(config):
-    with open(CONFIG_PATH, "w") as file:
-        json.dump(config, file, indent=4)
+    write_config(config, CONFIG_PATH)
 
 
 def reset_config():
@@ -37,7 +26,25 @@ def reset_config():
     save_config(default_config)
 
 
-def configure(config):
+@click.command(name="config")
+def config_command():
+    store = ConfigStore(CONFIG_PATH, default_factory=get_default_config)
+    # 편집 중의 수정은 모아 두었다가 종료할 때(또는 debounce 간격마다) 한 번에 저장
+    with store.session():
+        configure(store)
+
+
+@click.command(name="reset")
+def reset_command():
+    reset_config()
+    click.echo("Configuration reset to default values.")
+
+
+def configure(store):
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+    from InquirerPy.separator import Separator
+
     while True:
         click.echo(click.style("\nSnippy Configuration", bold=True))
         click.echo(click.style(SEPARATOR, dim=True))
@@ -64,41 +71,25 @@ def configure(config):
         if option == "q":
             break
         elif option == "t":
-            configure_template(config)
+            configure_template(store)
         elif option == "c":
-            configure_commit_types(config)
+            configure_commit_types(store)
         elif option == "r":
             if inquirer.confirm(
                 message="Are you sure you want to reset all settings to default?",
                 default=False,
             ).execute():
-                reset_config()
-                config = run_async(load_config_async)
+                store.replace(get_default_config())
+                store.flush()
                 click.echo("🔄 Configuration reset to default values. ")
 
-    save_config(config)
-
 
 def show_current_configuration(config):
-    if config["commit_types"]:
-        first_commit_type = next(iter(config["commit_types"].items()))
-        example_commit = config["commit_template"]
-        include_type = config.get("include_type", True)
-        include_emoji = config.get("include_emoji", True)
-
-        if include_type:
-            example_commit = example_commit.replace("<type>", first_commit_type[0])
-        else:
-            example_commit = example_commit.replace("<type>", "")
-
-        if include_emoji:
-            example_commit = example_commit.replace(
-                "<emoji>", emojize_if_valid(first_commit_type[1]["emoji"])
-            )
-        else:
-            example_commit = example_commit.replace("<emoji>", "")
-
-        example_commit = example_commit.replace("<subject>", "This is example comment.")
+    include_type = config.include_type
+    include_emoji = config.include_emoji
+    example_commit = render_example(
+        config.commit_template, config.commit_types, include_type, include_emoji
+    )
 
     emoji_status = (
         click.style("on", fg="green", bold=True)
@@ -112,7 +103,7 @@ def show_current_configuration(config):
     )
 
     click.echo("\nTemplate:")
-    click.echo(f"  {config['commit_template']} (e.g: {example_commit})")
+    click.echo(f"  {config.commit_template} (e.g: {example_commit})")
     click.echo()
     click.echo("Commit types:")
     click.echo(f"  <emoji> option is {emoji_status}")
@@ -120,41 +111,29 @@ def show_current_configuration(config):
     click.echo()
 
     if include_type and include_emoji:
-        for commit_type, commit_data in config["commit_types"].items():
+        for commit_type, commit_data in config.commit_types.items():
             print(
-                f"  {commit_type.split('_')[0]}: {emojize_if_valid(commit_data['emoji'])} - {commit_data['description']}"
+                f"  {get_type_name(commit_type)}: {commit_data.emoji} - {commit_data.description}"
             )
     elif include_type:
-        for commit_type, commit_data in config["commit_types"].items():
-            print(f"  {commit_type.split('_')[0]} - {commit_data['description']}")
+        for commit_type, commit_data in config.commit_types.items():
+            print(f"  {get_type_name(commit_type)} - {commit_data.description}")
     elif include_emoji:
-        for commit_data in config["commit_types"].values():
-            print(
-                f"  {emojize_if_valid(commit_data['emoji'])} - {commit_data['description']}"
-            )
+        for commit_data in config.commit_types.values():
+            print(f"  {commit_data.emoji} - {commit_data.description}")
 
     click.echo(click.style(SEPARATOR, dim=True))
 
 
 def show_current_template(config):
-    current_template = config.get("commit_template")
-    include_type = config.get("include_type", True)
-    include_emoji = config.get("include_emoji", True)
-
-    if config["commit_types"]:
-        first_commit_type = next(iter(config["commit_types"].items()))
-        example_commit = current_template
-        if include_type:
-            example_commit = example_commit.replace("<type>", first_commit_type[0])
-        else:
-            example_commit = example_commit.replace("<type>", "")
-        if include_emoji:
-            example_commit = example_commit.replace(
-                "<emoji>", emojize_if_valid(first_commit_type[1]["emoji"])
-            )
-        else:
-            example_commit = example_commit.replace("<emoji>", "")
-        example_commit = example_commit.replace("<subject>", "This is example comment.")
+    current_template = config.commit_template
+    include_type = config.include_type
+    include_emoji = config.include_emoji
+
+    if config.commit_types:
+        example_commit = render_example(
+            current_template, config.commit_types, include_type, include_emoji
+        )
 
         click.echo("\nTemplate Configuration")
         click.echo(click.style(SEPARATOR, dim=True))
@@ -172,25 +151,12 @@ def show_current_template(config):
         click.echo(click.style(SEPARATOR, dim=True))
 
 
-def configure_template(config):
-    def update_example_commit():
-        if config["commit_types"]:
-            first_commit_type = next(iter(config["commit_types"].items()))
-            example = config["commit_template"]
-            if config.get("include_type", True):
-                example = example.replace("<type>", first_commit_type[0])
-            else:
-                example = example.replace("<type>", "")
-            if config.get("include_emoji", True):
-                example = example.replace(
-                    "<emoji>", emojize_if_valid(first_commit_type[1])
-                )
-            else:
-                example = example.replace("<emoji>", "")
-            example = example.replace("<subject>", "This is example comment.")
-            return example
-        return ""
+def configure_template(store):
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+    from InquirerPy.separator import Separator
 
+    config = store.config
     while True:
         show_current_template(config)
 
@@ -230,77 +196,62 @@ def configure_template(config):
             if option == "b":
                 continue
             elif option == "1":
-                include_emoji = not config.get("include_emoji", True)
-                config["include_emoji"] = include_emoji
+                include_emoji = not config.include_emoji
+                config.include_emoji = include_emoji
                 click.echo(f"<emoji> set to {'on' if include_emoji else 'off'}")
             elif option == "2":
-                include_type = not config.get("include_type", True)
-                config["include_type"] = include_type
+                include_type = not config.include_type
+                config.include_type = include_type
                 click.echo(f"<type> set to {'on' if include_type else 'off'}")
 
             commit_template = "<type>: <emoji> <subject>"
-            if not config.get("include_type", True):
+            if not config.include_type:
                 commit_template = commit_template.replace("<type>: ", "")
-            if not config.get("include_emoji", True):
+            if not config.include_emoji:
                 commit_template = commit_template.replace("<emoji> ", "")
-            config["commit_template"] = commit_template
-            save_config(config)
+            config.commit_template = commit_template
+            store.mark_dirty()
+            store.save()
         elif choice == "t":
             while True:
                 new_template = inquirer.text(
                     message="Enter new commit template:",
-                    instruction=f"Use {'<type>, ' if config.get('include_type', True) else ''}"
-                    f"{'<emoji>, ' if config.get('include_emoji', True) else ''}"
-                    "<subject>, or press Enter to go back",
+                    instruction=f"Use {'<type>, ' if config.include_type else ''}"
+                    f"{'<emoji>, ' if config.include_emoji else ''}"
+                    "<subject> (optional <scope>), or press Enter to go back",
                     default="",
                 ).execute()
 
                 if not new_template:
                     break
 
-                errors = []
-                if "<subject>" not in new_template:
-                    errors.append("Template must include <subject>.")
-                if config.get("include_emoji", True) and "<emoji>" not in new_template:
-                    errors.append("<emoji> must be included when emoji is enabled.")
-                if config.get("include_type", True) and "<type>" not in new_template:
-                    errors.append("<type> must be included when type is enabled.")
+                errors = compile_template(new_template).validate(
+                    config.include_type, config.include_emoji
+                )
 
                 if errors:
                     click.echo(click.style(" ".join(errors), fg="red", bold=True))
                     continue
 
-                config["commit_template"] = new_template
-                save_config(config)
+                config.commit_template = new_template
+                store.mark_dirty()
+                store.save()
                 click.echo(
                     click.style(f"Template updated to: {new_template}", fg="green")
                 )
                 break
 
 
-def configure_commit_types(config):
-    if "commit_types" not in config:
-        config["commit_types"] = emojize_commit_types(RAW_COMMIT_TYPES)
-    else:
-        # 기존 설정 파일의 데이터 구조를 새로운 구조로 변환
-        new_commit_types = {}
-        for commit_type, value in config["commit_types"].items():
-            if isinstance(value, str):
-                # 기존 구조에서 새로운 구조로 변환
-                new_commit_types[commit_type] = {
-                    "emoji": value,
-                    "description": RAW_COMMIT_TYPES.get(commit_type, {}).get(
-                        "description", ""
-                    ),
-                }
-            else:
-                # 이미 새로운 구조인 경우
-                new_commit_types[commit_type] = value
-        config["commit_types"] = new_commit_types
+def configure_commit_types(store):
+    from InquirerPy import inquirer
+    from InquirerPy.base.control import Choice
+
+    config = store.config
+    commit_types = config.commit_types
 
     while True:
-        include_emoji = config.get("include_emoji", True)
-        include_type = config.get("include_type", True)
+        include_emoji = config.include_emoji
+        include_type = config.include_type
 
         click.echo("\nCommit Types Configuration")
         click.echo(click.style(SEPARATOR, dim=True))
@@ -317,14 +268,10 @@ def configure_commit_types(config):
 
         # 커밋 타입 선택지 생성
         type_choices = []
-        for idx, (commit_type, commit_data) in enumerate(
-            config["commit_types"].items()
-        ):
-            base_type = commit_type.split("_")[0]
-            emoji_display = (
-                emojize_if_valid(commit_data["emoji"]) if include_emoji else ""
-            )
-            display_text = f"{base_type} {emoji_display} - {commit_data['description']}"
+        for idx, (commit_type, commit_data) in enumerate(commit_types.items()):
+            base_type = get_type_name(commit_type)
+            emoji_display = commit_data.emoji if include_emoji else ""
+            display_text = f"{base_type} {emoji_display} - {commit_data.description}"
             type_choices.append(Choice(value=str(idx + 1), name=display_text))
 
         # 액션 선택지 생성
@@ -337,7 +284,7 @@ def configure_commit_types(config):
         # 모든 선택지를 하나의 리스트로 합치기
         all_choices = type_choices + action_choices
 
-        option = inquirer.fuzzy(
+        prompt = inquirer.fuzzy(
             message="Select a commit type to edit or choose an action:",
             choices=all_choices,
             default=None,
@@ -348,7 +295,8 @@ def configure_commit_types(config):
             match_exact=False,
             long_instruction="↑↓ to move, Enter to select",
             filter=lambda result: result if result else "",
-        ).execute()
+        )
+        option = use_search_index(prompt).execute()
 
         if option == "b" or option == "q":
             break
@@ -377,35 +325,33 @@ def configure_commit_types(config):
                 default="",
             ).execute()
 
-            if type_key in config["commit_types"]:
+            if type_key in commit_types:
                 suffix = 1
                 new_type_key = f"{type_key}_{suffix}"
-                while new_type_key in config["commit_types"]:
+                while new_type_key in commit_types:
                     suffix += 1
                     new_type_key = f"{type_key}_{suffix}"
                 type_key = new_type_key
 
-            config["commit_types"][type_key] = {
-                "emoji": new_emoji,
-                "description": new_description,
-            }
+            commit_types[type_key] = CommitType(
+                emojize_if_valid(new_emoji), new_description
+            )
+            store.mark_dirty()
             click.echo(
-                f"Added new type: {click.style(type_key.split('_')[0], fg='green')} with emoji: {emojize_if_valid(new_emoji)}"
+                f"Added new type: {click.style(get_type_name(type_key), fg='green')} with emoji: {commit_types[type_key].emoji}"
             )
 
         elif option == "d":
             delete_choices = [
                 Choice(
                     value=str(idx),
-                    name=f"{commit_type.split('_')[0]} {emojize_if_valid(commit_data['emoji']) if include_emoji else ''} - {commit_data['description']}",
-                )
-                for idx, (commit_type, commit_data) in enumerate(
-                    config["commit_types"].items()
+                    name=f"{get_type_name(commit_type)} {commit_data.emoji if include_emoji else ''} - {commit_data.description}",
                 )
+                for idx, (commit_type, commit_data) in enumerate(commit_types.items())
             ]
             delete_choices.append(Choice(value="b", name="Go back"))
 
-            delete_option = inquirer.fuzzy(
+            prompt = inquirer.fuzzy(
                 message="Select a commit type to delete:",
                 choices=delete_choices,
                 default=None,
@@ -416,7 +362,8 @@ def configure_commit_types(config):
                 match_exact=False,
                 long_instruction="↑↓ to move, Enter to select",
                 filter=lambda result: result if result else "",
-            ).execute()
+            )
+            delete_option = use_search_index(prompt).execute()
 
             if delete_option == "b":
                 continue
@@ -426,68 +373,68 @@ def configure_commit_types(config):
 
             try:
                 delete_idx = int(delete_option)
-                type_key = list(config["commit_types"].keys())[delete_idx]
+                type_key = list(commit_types.keys())[delete_idx]
                 confirm = inquirer.confirm(
-                    message=f"Are you sure you want to delete '{type_key.split('_')[0]}'?",
+                    message=f"Are you sure you want to delete '{get_type_name(type_key)}'?",
                     default=False,
                 ).execute()
 
                 if confirm:
-                    del config["commit_types"][type_key]
-                    click.echo(f"Deleted commit type '{type_key.split('_')[0]}'.")
+                    del commit_types[type_key]
+                    store.mark_dirty()
+                    click.echo(f"Deleted commit type '{get_type_name(type_key)}'.")
             except (ValueError, IndexError):
                 click.echo(click.style("Invalid selection.", fg="red"))
 
         else:
             try:
                 option_idx = int(option) - 1
-                if 0 <= option_idx < len(config["commit_types"]):
-                    type_key = list(config["commit_types"].keys())[option_idx]
+                if 0 <= option_idx < len(commit_types):
+                    type_key = list(commit_types.keys())[option_idx]
                     click.echo(
-                        f"Editing commit type: {click.style(type_key.split('_')[0], fg='blue')} ({emojize_if_valid(config['commit_types'][type_key]['emoji'])})"
+                        f"Editing commit type: {click.style(get_type_name(type_key), fg='blue')} ({commit_types[type_key].emoji})"
                     )
 
                     new_type = inquirer.text(
-                        message=f"Enter new name for {type_key.split('_')[0]}:",
+                        message=f"Enter new name for {get_type_name(type_key)}:",
                         instruction="Press Enter to keep current",
                         default="",
                     ).execute()
 
                     if new_type:
-                        config["commit_types"][new_type] = config["commit_types"].pop(
-                            type_key
-                        )
+                        commit_types[new_type] = commit_types.pop(type_key)
                         type_key = new_type
+                        store.mark_dirty()
                         click.echo(
-                            f"Updated commit type name to: {type_key.split('_')[0]}"
+                            f"Updated commit type name to: {get_type_name(type_key)}"
                         )
                     else:
                         click.echo("Commit type name unchanged.")
 
                     new_emoji = inquirer.text(
-                        message=f"Enter new emoji for {type_key.split('_')[0]}:",
+                        message=f"Enter new emoji for {get_type_name(type_key)}:",
                         instruction="Use :emoji: format, press Enter to keep current",
                         default="",
                     ).execute()
 
                     if new_emoji:
-                        config["commit_types"][type_key]["emoji"] = new_emoji
+                        commit_types[type_key].emoji = emojize_if_valid(new_emoji)
+                        store.mark_dirty()
                         click.echo(
-                            f"Updated {type_key.split('_')[0]} to {emojize_if_valid(new_emoji)}"
+                            f"Updated {get_type_name(type_key)} to {commit_types[type_key].emoji}"
                         )
                     else:
                         click.echo("Commit Type Emoji unchanged.")
 
                     new_description = inquirer.text(
-                        message=f"Enter new description for {type_key.split('_')[0]}:",
+                        message=f"Enter new description for {get_type_name(type_key)}:",
                         instruction="Press Enter to keep current",
-                        default=config["commit_types"][type_key]["description"],
+                        default=commit_types[type_key].description,
                     ).execute()
 
                     if new_description:
-                        config["commit_types"][type_key][
-                            "description"
-                        ] = new_description
+                        commit_types[type_key].description = new_description
+                        store.mark_dirty()
                         click.echo(f"Updated description to: {new_description}")
                     else:
                         click.echo("Description unchanged.")
@@ -495,4 +442,4 @@ def configure_commit_types(config):
             except (ValueError, IndexError):
                 click.echo(click.style("Invalid selection.", fg="red"))
 
-        save_config(config)
+        store.save()
@@ -0,0 +1,247 @@
+import json
+import os
+import socket
+import struct
+import sys
+
+import click
+
+from snippy.client import HEADER, connect_daemon, recv_exactly, send_request
+from snippy.constants import (
+    BASE_DIR,
+    DAEMON_IDLE_TIMEOUT,
+    DAEMON_REQUEST_TIMEOUT,
+    DAEMON_SOCKET_PATH,
+)
+from snippy.utils.trace import finish_tracing, reset_tracing, start_tracing_from
+
+MAX_FDS = 3
+
+
+def warm_up():
+    # 매 실행마다 비용이 드는 모듈과 설정을 미리 로드
+    import InquirerPy.inquirer  # noqa: F401
+    import questionary  # noqa: F401
+
+    import snippy.commands.commit  # noqa: F401
+    import snippy.commands.run  # noqa: F401
+    from snippy.commands.config import load_snapshot
+    from snippy.main import cli
+
+    load_snapshot()
+    return cli
+
+
+def bind_socket(path=DAEMON_SOCKET_PATH):
+    os.makedirs(BASE_DIR, exist_ok=True)
+    existing = connect_daemon(path)
+    if existing is not None:
+        existing.close()
+        raise click.ClickException(f"A snippy daemon is already listening on {path}.")
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    return server
+
+
+# 잘못된 요청으로 receive_request 가 내는 예외, daemon 은 그 연결만 버리고 계속 실행
+# (json.JSONDecodeError 와 UnicodeDecodeError 는 ValueError)
+BAD_REQUEST_ERRORS = (socket.timeout, struct.error, ValueError, OSError)
+
+
+def receive_request(conn):
+    header, fds, _, _ = socket.recv_fds(conn, HEADER.size, MAX_FDS)
+    try:
+        if len(header) < HEADER.size:
+            header += recv_exactly(conn, HEADER.size - len(header)) or b""
+        payload = recv_exactly(conn, HEADER.unpack(header)[0])
+        if payload is None:
+            raise ValueError("connection closed before the request was sent")
+        request = json.loads(payload)
+        if not isinstance(request, dict) or not (
+            "control" in request or {"argv", "cwd", "env"} <= request.keys()
+        ):
+            raise ValueError("malformed request")
+        return request, fds
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def attach_stdio(fds):
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    sys.stdin = open(0, "r", closefd=False)
+    sys.stdout = open(1, "w", buffering=1 if os.isatty(1) else -1, closefd=False)
+    sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+
+def serve_request(cli, conn, request, fds):
+    attach_stdio(fds)
+    os.chdir(request["cwd"])
+    os.environ.clear()
+    os.environ.update(request["env"])
+    sys.argv = ["snippy", *request["argv"]]
+    conn.sendall(HEADER.pack(os.getpid()))
+    # daemon 에서 물려받은 trace 는 버리고 요청의 argv/env 기준으로 다시 시작
+    reset_tracing()
+    start_tracing_from(request["argv"])
+
+    try:
+        cli.main(args=request["argv"], prog_name="snippy")
+        exit_code = 0
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            click.echo(e.code, err=True)
+            exit_code = 1
+    except KeyboardInterrupt:
+        exit_code = 130
+    except Exception as e:
+        click.echo(click.style(f"An unexpected error occurred: {e}", fg="red"))
+        exit_code = 1
+    finally:
+        # worker 는 os._exit 로 끝나서 atexit 이 실행되지 않음
+        finish_tracing()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    conn.sendall(HEADER.pack(exit_code))
+
+
+def reap_workers(workers):
+    for pid in list(workers):
+        try:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            workers.discard(pid)
+
+
+def serve(server, idle_timeout=DAEMON_IDLE_TIMEOUT, path=DAEMON_SOCKET_PATH):
+    from snippy.commands.config import load_snapshot
+    from snippy.utils.version_utils import get_distribution_signature
+
+    cli = warm_up()
+    signature = get_distribution_signature()
+    server.settimeout(idle_timeout)
+    workers = set()
+
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                reap_workers(workers)
+                if workers:
+                    continue
+                break
+
+            with conn:
+                # 아무것도 보내지 않는 client 때문에 daemon 이 멈추지 않도록 요청에만 timeout
+                conn.settimeout(DAEMON_REQUEST_TIMEOUT)
+                try:
+                    request, fds = receive_request(conn)
+                except BAD_REQUEST_ERRORS:
+                    continue
+                conn.settimeout(None)
+                if request.get("control") == "stop":
+                    for fd in fds:
+                        os.close(fd)
+                    break
+                if get_distribution_signature() != signature:
+                    # snippy 가 업데이트되었으면 응답하지 않고 종료, client 는 in-process 로 실행
+                    for fd in fds:
+                        os.close(fd)
+                    break
+
+                # 설정이 바뀌었으면 fork 전에 다시 로드해서 worker 가 최신 스냅샷을 물려받게 함
+                # (요청한 디렉터리의 저장소 설정 기준)
+                # 설정 파일이 깨져 있어도 daemon 은 계속 돌아야 함, worker 가 같은 설정을
+                # 다시 읽으면서 그 요청에만 오류를 보여줌
+                try:
+                    load_snapshot(request["cwd"])
+                except Exception:
+                    pass
+                pid = os.fork()
+                if pid == 0:
+                    server.close()
+                    try:
+                        serve_request(cli, conn, request, fds)
+                    finally:
+                        os._exit(0)
+                for fd in fds:
+                    os.close(fd)
+                workers.add(pid)
+            reap_workers(workers)
+    finally:
+        server.close()
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        for pid in workers:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+
+def stop_daemon(path=DAEMON_SOCKET_PATH):
+    sock = connect_daemon(path)
+    if sock is None:
+        return False
+    with sock:
+        send_request(sock, {"control": "stop"})
+    return True
+
+
+def detach():
+    if os.fork() > 0:
+        os._exit(0)
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.close(devnull)
+
+
+@click.command(name="daemon")
+@click.option(
+    "--idle-timeout",
+    default=DAEMON_IDLE_TIMEOUT,
+    show_default=True,
+    type=int,
+    help="Seconds without requests before the daemon exits.",
+)
+@click.option("--detach", "detach_", is_flag=True, help="Run in the background.")
+@click.option("--stop", is_flag=True, help="Stop the running daemon.")
+def daemon_command(idle_timeout, detach_, stop):
+    """Keep snippy warm in a background process."""
+    if stop:
+        if stop_daemon():
+            click.echo("Snippy daemon stopped.")
+        else:
+            click.echo("No snippy daemon is running.")
+        return
+
+    server = bind_socket()
+    if detach_:
+        detach()
+    else:
+        click.echo(f"Snippy daemon listening on {DAEMON_SOCKET_PATH}")
+    serve(server, idle_timeout)
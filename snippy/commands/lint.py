@@ -0,0 +1,162 @@
+import json
+import os
+import sys
+from collections import deque
+from itertools import chain
+
+import click
+
+from snippy.commands.config import load_snapshot
+from snippy.utils.config_schema import get_type_name
+from snippy.utils.git_utils import iter_git_records, verify_range
+from snippy.utils.template_utils import compile_template
+
+# 한 worker 에 넘기는 커밋 수, 이보다 적으면 pool 없이 현재 프로세스에서 검사
+LINT_CHUNK_SIZE = 5000
+
+_worker_patterns = None
+
+
+def build_patterns(snapshot):
+    """Return (strict, loose) regex sources for the configured template.
+
+    The strict pattern only accepts the configured type keys and emojis; the
+    loose one accepts anything in their place and is used to explain failures.
+    """
+    config = snapshot["config"]
+    template = compile_template(config.commit_template, snapshot["template_tokens"])
+    commit_types = config.commit_types
+    types = {get_type_name(commit_type) for commit_type in commit_types}
+    emojis = {commit_data.emoji for commit_data in commit_types.values()}
+    return template.matcher(types, emojis).pattern, template.matcher().pattern
+
+
+def init_worker(patterns):
+    import re
+
+    global _worker_patterns
+    _worker_patterns = tuple(re.compile(pattern) for pattern in patterns)
+
+
+def lint_chunk(records):
+    """Return the violations among ``records`` as (commit, subject, error) tuples."""
+    strict, loose = _worker_patterns
+    violations = []
+    for record in records:
+        commit, _, subject = record.partition(" ")
+        if strict.match(subject):
+            continue
+        if loose.match(subject):
+            error = "unknown commit type or emoji"
+        else:
+            error = "does not match the commit template"
+        violations.append((commit, subject, error))
+    return violations
+
+
+def iter_chunks(records, size):
+    chunk = []
+    for record in records:
+        if record:
+            chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def lint_range(revision_range, patterns, jobs, include_merges=False):
+    """Yield (violations, checked) per chunk of ``revision_range``, in log order.
+
+    At most ``jobs * 2`` chunks are in flight, so memory stays constant for any
+    range size.
+    """
+    args = ["log", "-z", "--format=%H %s"]
+    if not include_merges:
+        args.append("--no-merges")
+    args.append(revision_range)
+    chunks = iter_chunks(iter_git_records(args), LINT_CHUNK_SIZE)
+
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if second is None or jobs <= 1:
+        # 작은 범위는 process 를 띄우는 비용이 더 크므로 그대로 검사
+        init_worker(patterns)
+        yield lint_chunk(first), len(first)
+        for chunk in chain([second] if second is not None else [], chunks):
+            yield lint_chunk(chunk), len(chunk)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(patterns,)
+    ) as pool:
+        pending = deque()
+        for chunk in chain([first, second], chunks):
+            pending.append((pool.submit(lint_chunk, chunk), len(chunk)))
+            if len(pending) >= jobs * 2:
+                future, checked = pending.popleft()
+                yield future.result(), checked
+        while pending:
+            future, checked = pending.popleft()
+            yield future.result(), checked
+
+
+@click.command(name="lint")
+@click.argument("revision_range", default="HEAD")
+@click.option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=lambda: os.cpu_count() or 1,
+    show_default="CPU count",
+    help="Worker processes for large ranges.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "text"]),
+    default="json",
+    show_default=True,
+    help="json prints one JSON object per line.",
+)
+@click.option("--include-merges", is_flag=True, help="Also check merge commits.")
+def lint_command(revision_range, jobs, output_format, include_merges):
+    """Check commit subjects in REVISION_RANGE against the commit template."""
+    verify_range(revision_range)
+    patterns = build_patterns(load_snapshot())
+
+    checked = failed = 0
+    for violations, count in lint_range(
+        revision_range, patterns, max(jobs, 1), include_merges
+    ):
+        checked += count
+        failed += len(violations)
+        for commit, subject, error in violations:
+            if output_format == "json":
+                click.echo(
+                    json.dumps(
+                        {"commit": commit, "subject": subject, "error": error},
+                        ensure_ascii=False,
+                    )
+                )
+            else:
+                click.echo(f"{commit[:7]} {subject}  ({error})")
+
+    if output_format == "json":
+        click.echo(json.dumps({"checked": checked, "failed": failed}))
+    else:
+        click.echo(
+            click.style(
+                f"Checked {checked} commits, {failed} do not follow the template.",
+                fg="red" if failed else "green",
+                bold=True,
+            ),
+            err=True,
+        )
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,208 @@
+import sys
+
+import click
+
+from snippy.commands.commit import (
+    commit_in_repos,
+    commit_with_warning,
+    resolve_commit_type,
+    select_commit_type,
+)
+from snippy.commands.config import load_snapshot
+from snippy.constants import REPO_JOBS
+from snippy.utils.click_utils import click_run_option, click_type_options
+from snippy.utils.config_cache import get_choice_key
+from snippy.utils.config_schema import get_type_name
+from snippy.utils.git_utils import iter_staged_paths
+from snippy.utils.template_utils import compile_template, render_example
+from snippy.utils.trace import span
+from snippy.utils.update_check import get_update_notice, schedule_update_check
+from snippy.utils.usage_log import frecency_order, record_usage
+
+
+@click.command(name="run")
+@click_run_option()
+@click_type_options()
+@click.option(
+    "--repos",
+    multiple=True,
+    help="Commit in these repositories instead: comma-separated paths or globs.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help=f"Git processes to run at once with --repos (default: {REPO_JOBS}).",
+)
+@click.pass_context
+def run_command(ctx, message, type_name, no_type, no_emoji, repos, jobs):
+    # Use message from context if available, otherwise use the option
+    if ctx.obj and ctx.obj.get('message'):
+        message = ctx.obj.get('message')
+    if ctx.obj and ctx.obj.get('type_name'):
+        type_name = ctx.obj.get('type_name')
+    if ctx.obj:
+        no_type = no_type or ctx.obj.get('no_type', False)
+        no_emoji = no_emoji or ctx.obj.get('no_emoji', False)
+    run_internal(message, repos, jobs, type_name, no_type, no_emoji)
+
+
+def show_update_notice():
+    # 지난 실행에서 백그라운드로 확인한 결과만 사용하므로 기다리지 않음
+    notice = get_update_notice()
+    if notice is None:
+        return
+    installed_version, latest_version = notice
+    click.echo(
+        f"🆕✨ New version available! Current: {installed_version}, Latest: {latest_version}"
+    )
+    click.echo(
+        f"Run {click.style('`snippy update`', fg='bright_yellow', bold=True)} to update. 👋"
+    )
+    click.echo()
+
+
+def require_terminal(hint):
+    # prompt 라이브러리는 터미널이 없으면 알 수 없는 오류로 끝나므로 먼저 안내
+    if not sys.stdin.isatty():
+        raise click.UsageError(f"No terminal to prompt on. {hint}")
+
+
+def run_internal(
+    message, repos=(), jobs=None, type_name=None, no_type=False, no_emoji=False
+):
+    try:
+        with span("load config"):
+            snapshot = load_snapshot()
+        config = snapshot["config"]
+
+        commit_template = config.commit_template
+        commit_types = config.commit_types
+
+        include_type = config.include_type and not no_type
+        include_emoji = config.include_emoji and not no_emoji
+        template = compile_template(commit_template, snapshot["template_tokens"])
+        # 끈 placeholder 는 구분자와 함께 빼야 ": ✨ subject" 같은 메시지가 생기지 않음
+        if not include_type:
+            template = template.without("<type>")
+        if not include_emoji:
+            template = template.without("<emoji>")
+
+        update_check_ttl = config.update_check_ttl_hours
+        if update_check_ttl:
+            with span("update check"):
+                show_update_notice()
+                schedule_update_check(update_check_ttl)
+
+        pick_type = (include_type or include_emoji) and type_name is None
+        if pick_type or not message:
+            require_terminal("Pass the commit type with -t and the message with -m.")
+            example_commit = render_example(
+                template.source, commit_types, include_type, include_emoji
+            )
+            click.echo("Template:")
+            click.echo(f"  {template.source} (e.g: {example_commit})")
+            click.echo()
+
+        commit_type = ""
+        emoji_code = ""
+        # 고른 타입은 커밋이 끝난 뒤에만 기록, 취소하거나 staged 가 없으면 순위에 넣지 않음
+        selected_type = None
+
+        if pick_type:
+            choice_key = get_choice_key(include_type, include_emoji)
+            choices = snapshot["choices"][choice_key]
+            result = select_commit_type(
+                commit_types,
+                include_type,
+                include_emoji,
+                choices=choices,
+                search_index=snapshot["search"][choice_key],
+                order=frecency_order([choice["value"][0] for choice in choices]),
+            )
+            if result in ["add", "delete"]:
+                click.echo(
+                    "Configuration options are not available in commit mode. Please use 'snippy config'."
+                )
+                sys.exit(1)
+            elif result is None:
+                click.echo("Commit cancelled.")
+                sys.exit(1)
+            else:
+                commit_type, emoji_code = result
+                selected_type = commit_type
+        elif include_type or include_emoji:
+            # -t 로 타입이 정해졌으면 picker(InquirerPy)를 import 하지 않음
+            commit_type, emoji_code = resolve_commit_type(commit_types, type_name)
+            selected_type = commit_type
+
+        # picker 와 -t 모두 고른 항목의 type/emoji 를 함께 돌려주므로 끈 쪽은 비움
+        if not include_type:
+            commit_type = ""
+        if not include_emoji:
+            emoji_code = ""
+
+        # 메시지에는 config 키가 아니라 타입 이름을 씀 ("fix_1" -> "fix")
+        commit_type = get_type_name(commit_type)
+
+        # Use provided message or prompt for one
+        if message:
+            subject = message
+        else:
+            with span("import questionary"):
+                import questionary
+
+            with span("enter message"):
+                subject = questionary.text("Enter commit message:").ask()
+            if subject is None:
+                click.echo("Commit cancelled.")
+                sys.exit(1)
+
+        # <scope> 가 있으면 staged 경로 목록을 한 번만 읽어 scope 와 staged 여부를 함께 얻음
+        # 여러 저장소에 같은 메시지를 쓰는 경우에는 scope 를 추론하지 않음
+        scope, has_staged = "", None
+        if "<scope>" in template.placeholders and config.scopes and not repos:
+            from snippy.utils.scope_utils import infer_scope
+
+            with span("infer scope"):
+                scope, staged_count = infer_scope(
+                    config.scopes, iter_staged_paths()
+                )
+            has_staged = staged_count > 0
+
+        if not subject:
+            generated_message = template.render(
+                commit_type, emoji_code, "", scope
+            ).strip()
+
+            if generated_message:
+                click.echo(
+                    click.style(
+                        f"No commit message provided. Using default: {generated_message}",
+                        fg="yellow",
+                    )
+                )
+            else:
+                click.echo(
+                    click.style(
+                        "Commit message cannot be empty. Please provide a message.",
+                        fg="red",
+                    )
+                )
+                sys.exit(1)
+
+        commit_message = template.render(commit_type, emoji_code, subject, scope)
+
+        if repos:
+            commit_in_repos(
+                commit_message, repos, jobs or config.repo_jobs
+            )
+        else:
+            commit_with_warning(commit_message, has_staged)
+        if selected_type is not None:
+            record_usage(selected_type)
+
+    except KeyboardInterrupt:
+        click.echo("\nSay Good bye to Snippy. Bye Bye!", err=True)
+        raise click.Abort()
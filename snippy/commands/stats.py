@@ -0,0 +1,335 @@
+import json
+from datetime import time
+
+import click
+
+from snippy.commands.config import load_snapshot
+from snippy.utils.config_schema import get_type_name
+from snippy.utils.commit_index import (
+    EPOCH_ORDINAL,
+    STATS_PATH_DEPTH,
+    open_commit_index,
+    update_commit_index,
+)
+from snippy.utils.git_utils import iter_git_records
+from snippy.utils.progress import progress
+from snippy.utils.template_utils import build_type_classifier, compile_template
+
+TIME_WINDOWS = {
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+    "year": "%Y",
+}
+
+OTHER_LABEL = "other"
+
+
+def build_classifier(snapshot):
+    """Return a function mapping a parsed (type, emoji) to a commit type label."""
+    config = snapshot["config"]
+    template = compile_template(config.commit_template, snapshot["template_tokens"])
+    classify_type = build_type_classifier(config, template)
+    labels = {}
+    for commit_type, commit_data in config.commit_types.items():
+        base_type = get_type_name(commit_type)
+        labels[commit_type] = (
+            f"{base_type} {commit_data.emoji}".strip()
+            if config.include_emoji
+            else base_type
+        )
+
+    def classify(commit_type, emoji):
+        return labels.get(classify_type(commit_type, emoji), OTHER_LABEL)
+
+    return classify
+
+
+def load_path_commits(connection, path):
+    """Collect commits touching ``path`` with git itself, for paths not indexed."""
+    connection.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS path_commits (sha TEXT PRIMARY KEY)"
+    )
+    connection.execute("DELETE FROM path_commits")
+    connection.executemany(
+        "INSERT OR IGNORE INTO path_commits VALUES (?)",
+        (
+            (sha,)
+            for sha in iter_git_records(
+                [
+                    "log",
+                    "-z",
+                    "--no-merges",
+                    "--format=%H",
+                    "--branches",
+                    "--tags",
+                    "--",
+                    path,
+                ]
+            )
+            if sha
+        ),
+    )
+
+
+def is_whole_day(value):
+    return value is None or value.time() == time.min
+
+
+def query_stats(connection, group_by, author=None, path=None, since=None, until=None):
+    """Return [(group, type, emoji, count)] answered from the index.
+
+    Each query is sent to the smallest rollup that can answer it: per
+    directory, per author or per day. Combinations none of them cover go
+    through the per-commit tables and their indexes.
+    """
+    path = (path or "").strip("/")
+    prefix_id = None
+    if path:
+        prefix = connection.execute(
+            "SELECT id FROM prefixes WHERE path = ?", (path,)
+        ).fetchone()
+        if prefix is None:
+            return query_commits(connection, group_by, author, path, since, until)
+        prefix_id = prefix[0]
+    has_time = since is not None or until is not None
+
+    if group_by in ("type", "path") and (path or group_by == "path"):
+        if not (author or has_time):
+            return query_prefix_counts(connection, group_by, path, prefix_id)
+    if not (path or has_time) and group_by in ("type", "author"):
+        return query_author_counts(connection, group_by, author)
+    if (
+        not (path or author)
+        and group_by not in ("author", "path")
+        and is_whole_day(since)
+        and is_whole_day(until)
+    ):
+        return query_day_counts(connection, group_by, since, until)
+    return query_commits(connection, group_by, author, path, since, until)
+
+
+def query_rollup(connection, table, group, joins="", conditions=(), params=()):
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return connection.execute(
+        f"""
+        SELECT {group}, NULLIF(r.type, ''), NULLIF(r.emoji, ''), SUM(r.count)
+        FROM {table} AS r {joins}
+        {where}
+        GROUP BY 1, 2, 3
+        """,
+        params,
+    ).fetchall()
+
+
+def query_prefix_counts(connection, group_by, path, prefix_id):
+    if group_by != "path":
+        return query_rollup(
+            connection, "prefix_counts", "''", "", ["r.prefix_id = ?"], [prefix_id]
+        )
+    depth = path.count("/") + 1 if path else 0
+    check_path_depth(depth)
+    conditions = ["p.depth = ?"]
+    params = [depth + 1]
+    if path:
+        conditions.append("substr(p.path, 1, ?) = ?")
+        params.extend([len(path) + 1, f"{path}/"])
+    return query_rollup(
+        connection,
+        "prefix_counts",
+        "p.path",
+        "JOIN prefixes AS p ON p.id = r.prefix_id",
+        conditions,
+        params,
+    )
+
+
+def query_author_counts(connection, group_by, author):
+    conditions = []
+    params = []
+    if author:
+        conditions.append("a.name LIKE ?")
+        params.append(f"%{author}%")
+    return query_rollup(
+        connection,
+        "author_counts",
+        "a.name" if group_by == "author" else "''",
+        "JOIN authors AS a ON a.id = r.author_id",
+        conditions,
+        params,
+    )
+
+
+def query_day_counts(connection, group_by, since, until):
+    conditions = []
+    params = []
+    if group_by == "type":
+        group = "''"
+    else:
+        # day 는 이미 로컬 날짜이므로 localtime 변환 없이 계산
+        group = "strftime(?, r.day * 86400, 'unixepoch')"
+        params.append(TIME_WINDOWS[group_by])
+    if since is not None:
+        conditions.append("r.day >= ?")
+        params.append(since.toordinal() - EPOCH_ORDINAL)
+    if until is not None:
+        conditions.append("r.day < ?")
+        params.append(until.toordinal() - EPOCH_ORDINAL)
+    return query_rollup(connection, "day_counts", group, "", conditions, params)
+
+
+def check_path_depth(depth):
+    if depth >= STATS_PATH_DEPTH:
+        raise click.BadParameter(
+            f"directories are indexed {STATS_PATH_DEPTH} levels deep.",
+            param_hint="'--path'",
+        )
+
+
+def query_commits(connection, group_by, author, path, since, until):
+    joins = ["JOIN authors AS a ON a.id = c.author_id"]
+    conditions = []
+    params = []
+    if author:
+        conditions.append("a.name LIKE ?")
+        params.append(f"%{author}%")
+    if since is not None:
+        conditions.append("c.time >= ?")
+        params.append(int(since.timestamp()))
+    if until is not None:
+        conditions.append("c.time < ?")
+        params.append(int(until.timestamp()))
+
+    depth = path.count("/") + 1 if path else 0
+    if path:
+        prefix = connection.execute(
+            "SELECT id FROM prefixes WHERE path = ?", (path,)
+        ).fetchone()
+        if prefix is not None:
+            conditions.append(
+                "c.id IN (SELECT commit_id FROM commit_prefixes WHERE prefix_id = ?)"
+            )
+            params.append(prefix[0])
+        else:
+            # 파일이나 색인보다 깊은 경로는 git 으로 직접 찾음
+            load_path_commits(connection, path)
+            conditions.append("c.sha IN (SELECT sha FROM path_commits)")
+
+    if group_by == "type":
+        group = "''"
+    elif group_by == "author":
+        group = "a.name"
+    elif group_by == "path":
+        check_path_depth(depth)
+        joins.append(
+            "JOIN commit_prefixes AS cp ON cp.commit_id = c.id"
+            " JOIN prefixes AS p ON p.id = cp.prefix_id"
+        )
+        conditions.append("p.depth = ?")
+        params.append(depth + 1)
+        if path:
+            conditions.append("substr(p.path, 1, ?) = ?")
+            params.extend([len(path) + 1, f"{path}/"])
+        group = "p.path"
+    else:
+        group = "strftime(?, c.time, 'unixepoch', 'localtime')"
+        params.insert(0, TIME_WINDOWS[group_by])
+
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return connection.execute(
+        f"""
+        SELECT {group}, c.type, c.emoji, COUNT(*)
+        FROM commits AS c {" ".join(joins)}
+        {where}
+        GROUP BY 1, 2, 3
+        """,
+        params,
+    ).fetchall()
+
+
+def summarize(rows, classify, group_by):
+    """Fold query rows into [(group, total, {label: count})] in display order."""
+    groups = {}
+    for group, commit_type, emoji, count in rows:
+        counts = groups.setdefault(group, {})
+        label = classify(commit_type, emoji)
+        counts[label] = counts.get(label, 0) + count
+
+    summary = []
+    for group, counts in groups.items():
+        ordered = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        summary.append((group, sum(counts.values()), dict(ordered)))
+    if group_by in TIME_WINDOWS:
+        summary.sort(key=lambda item: item[0])
+    else:
+        summary.sort(key=lambda item: (-item[1], item[0]))
+    return summary
+
+
+def echo_text(summary, group_by):
+    if not summary:
+        click.echo("No commits found.")
+        return
+    if group_by == "type":
+        _, total, counts = summary[0]
+        width = max(len(label) for label in counts)
+        for label, count in counts.items():
+            click.echo(f"{label:<{width}}  {count:>8}  {count / total:6.1%}")
+        click.echo(click.style(f"{'total':<{width}}  {total:>8}", bold=True))
+        return
+    width = max(len(group) for group, _, _ in summary)
+    for group, total, counts in summary:
+        breakdown = ", ".join(f"{label} {count}" for label, count in counts.items())
+        label = click.style(f"{group:<{width}}", bold=True)
+        click.echo(f"{label}  {total:>8}  {breakdown}")
+
+
+@click.command(name="stats")
+@click.option(
+    "--by",
+    "group_by",
+    type=click.Choice(["type", "author", "path", *TIME_WINDOWS]),
+    default="type",
+    show_default=True,
+    help="Break the commit type counts down by this key.",
+)
+@click.option("--author", help="Only count authors whose name or email contains this.")
+@click.option("--path", help="Only count commits touching this path.")
+@click.option("--since", type=click.DateTime(), help="Count commits from this date.")
+@click.option("--until", type=click.DateTime(), help="Count commits before this date.")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="json prints one JSON object per group.",
+)
+def stats_command(group_by, author, path, since, until, output_format):
+    """Show the commit type distribution of this repository's branches and tags."""
+    snapshot = load_snapshot()
+    template_source = snapshot["config"].commit_template
+    matcher = compile_template(
+        template_source, snapshot["template_tokens"]
+    ).matcher()
+
+    connection = open_commit_index(template_source)
+    try:
+        with progress("Indexing commits..."):
+            added, removed = update_commit_index(connection, matcher)
+        rows = query_stats(connection, group_by, author, path, since, until)
+    finally:
+        connection.close()
+    if added or removed:
+        click.echo(f"Indexed {added} new commits, dropped {removed}.", err=True)
+
+    summary = summarize(rows, build_classifier(snapshot), group_by)
+    if output_format == "json":
+        for group, total, counts in summary:
+            click.echo(
+                json.dumps(
+                    {"group": group, "total": total, "types": counts},
+                    ensure_ascii=False,
+                )
+            )
+    else:
+        echo_text(summary, group_by)
@@ -1,58 +1,45 @@
-import json
-import os
 import subprocess
-import threading
-import time
+import sys
 
 import click
 
-from snippy.constants import (
-    BASE_DIR,
-    CACHE_EXPIRATION_TIME,
-    LATEST_VERSION_PATH,
-    VERSION_CACHE_PATH,
+from snippy.utils.io_utils import run_async
+from snippy.utils.progress import progress
+from snippy.utils.trace import span
+from snippy.utils.update_check import release_update_lock, save_update_state
+from snippy.utils.version_providers import (
+    get_version_providers,
+    is_newer_version,
+    resolve_versions,
+)
+from snippy.utils.version_utils import (
+    get_stamped_version,
+    load_cached_version,
+    save_cached_version,
 )
-from snippy.utils.animation_utils import show_loading_animation
-
-
-def update_brew():
-    try:
-        result = subprocess.run(
-            ["brew", "update"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            click.echo("Homebrew updated successfully!")
-        else:
-            click.echo(f"Error updating Homebrew: {result.stderr}")
-    except Exception as e:
-        click.echo(f"Failed to update Homebrew: {e}")
 
 
 def update_snippy():
-    stop_animation = show_loading_animation(message="🕵️  Checking for updates...")
     try:
-        update_brew()
-
-        installed_version = fetch_installed_version()
-        latest_version = fetch_latest_version()
+        with progress("🕵️  Checking for updates..."), span("resolve versions"):
+            installed_version, latest_version = run_async(
+                resolve_versions, get_version_providers(update_formulae=True)
+            )
 
         if installed_version is None or latest_version is None:
-            stop_animation.set()
-            click.echo("\nUnable to check versions. Please try again later. 😢")
+            click.echo("Unable to check versions. Please try again later. 😢")
             return
 
-        if installed_version == latest_version:
-            stop_animation.set()
-            click.echo(
-                f"\nSnippy is already up-to-date! Version: {installed_version} 🎉"
-            )
+        save_installed_version(installed_version)
+        update_available = is_newer_version(latest_version, installed_version)
+        save_update_state(latest_version, installed_version, update_available)
+
+        if not update_available:
+            click.echo(f"Snippy is already up-to-date! Version: {installed_version} 🎉")
             return
 
-        stop_animation.set()
         click.echo(
-            f"\n🆕✨ Current version: {installed_version}, Latest version: {latest_version}"
+            f"🆕✨ Current version: {installed_version}, Latest version: {latest_version}"
         )
         update = click.prompt("Would you like to update? (y/N)", type=str, default="n")
 
@@ -62,13 +49,15 @@ def update_snippy():
             )
             return
 
-        result = subprocess.run(
-            ["brew", "upgrade", "snippy"],
-            capture_output=True,
-            text=True,
-        )
+        with progress("🍺 Upgrading Snippy..."), span("brew upgrade"):
+            result = subprocess.run(
+                ["brew", "upgrade", "snippy"],
+                capture_output=True,
+                text=True,
+            )
 
         if result.returncode == 0:
+            save_update_state(latest_version, latest_version, False)
             click.echo(
                 click.style(
                     f"\nSnippy has been updated from {installed_version} to {latest_version}! 🎉",
@@ -80,69 +69,11 @@ def update_snippy():
                 click.style(f"\nFailed to update Snippy: {result.stderr}", fg="red")
             )
     except Exception as e:
-        stop_animation.set()
-        click.echo(click.style(f"\nAn error occurred during the update: {e}", fg="red"))
-    finally:
-        if not stop_animation.is_set():
-            stop_animation.set()
-
-
-def save_latest_version(latest_version):
-    os.makedirs(BASE_DIR, exist_ok=True)
-    with open(LATEST_VERSION_PATH, "w") as f:
-        json.dump({"latest_version": latest_version}, f)
+        click.echo(click.style(f"An error occurred during the update: {e}", fg="red"))
 
 
 def save_installed_version(installed_version):
-    os.makedirs(BASE_DIR, exist_ok=True)
-    with open(VERSION_CACHE_PATH, "w") as f:
-        json.dump({"installed_version": installed_version}, f)
-
-
-def is_cache_expired(file_path):
-    if not os.path.exists(file_path):
-        return True
-    last_modified = os.path.getmtime(file_path)
-    return (time.time() - last_modified) > CACHE_EXPIRATION_TIME
-
-
-def fetch_latest_version():
-    try:
-        result = subprocess.run(
-            ["brew", "info", "--json=v2", "snippy"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            latest_version = data["formulae"][0]["versions"]["stable"]
-            save_latest_version(latest_version)
-            return latest_version
-        else:
-            print(f"Error fetching latest version: {result.stderr}")
-    except Exception as e:
-        print(f"Failed to fetch the latest version: {e}")
-    return None
-
-
-def fetch_latest_version_in_background():
-    def fetch():
-        fetch_latest_version()
-
-    thread = threading.Thread(target=fetch, daemon=True)
-    thread.start()
-    thread.join()
-
-
-def load_latest_version():
-    if not os.path.exists(LATEST_VERSION_PATH) or is_cache_expired(LATEST_VERSION_PATH):
-        fetch_latest_version_in_background()
-        return None
-    try:
-        with open(LATEST_VERSION_PATH, "r") as f:
-            return json.load(f).get("latest_version")
-    except FileNotFoundError:
-        return None
+    save_cached_version(installed_version)
 
 
 def fetch_installed_version():
@@ -164,42 +95,62 @@ def fetch_installed_version():
 
 
 def fetch_installed_version_with_animation():
-    stop_animation = show_loading_animation(
-        message="🕵️  Checking for installed version..."
-    )
-    installed_version = fetch_installed_version()
-    stop_animation.set()
-    print("\n", end="")
-    return installed_version
-
-
-def load_installed_version():
-    try:
-        with open(VERSION_CACHE_PATH, "r") as f:
-            return json.load(f).get("installed_version")
-    except FileNotFoundError:
+    with progress("🕵️  Checking for installed version..."):
         return fetch_installed_version()
 
 
-def version_check_in_background():
-    def check():
+def refresh_update_state():
+    """Refresh the cached update check. Runs in the detached process only."""
+    try:
         try:
-            installed_version = fetch_installed_version()
-            latest_version = fetch_latest_version()
-
-            if (
-                installed_version
-                and latest_version
-                and installed_version != latest_version
-            ):
-                click.echo(
-                    f"\n🆕✨ New version available! Current: {installed_version}, Latest: {latest_version}"
-                )
-                click.echo(
-                    f"Run {click.style('`snippy update`', fg='bright_yellow', bold=True)} to update. 👋"
-                )
+            installed_version, latest_version = run_async(
+                resolve_versions, get_version_providers()
+            )
         except Exception:
-            pass
+            installed_version, latest_version = None, None
+        # 최신 버전을 못 찾았어도 확인한 시각은 기록해야 TTL 동안 다시 시도하지 않음
+        installed_version = (
+            installed_version or get_stamped_version() or load_cached_version()
+        )
+        save_update_state(
+            latest_version,
+            installed_version,
+            is_newer_version(latest_version, installed_version),
+        )
+    finally:
+        release_update_lock()
+
+
+@click.command(name="update")
+def update_command():
+    click.echo(
+        click.style(
+            "Buy me a coffee! What do you think? 😝  @https://www.buymeacoffee.com/narashin",
+            fg="cyan",
+        )
+    )
+
+    # 항상 공지사항 출력
+    click.echo(click.style("\n⚠️  Notice", fg="yellow", bold=True))
+    click.echo(
+        click.style(
+            "If you're using version 3.1.0 or below, please run ",
+            fg="yellow",
+        )
+        + click.style("snippy reset", fg="yellow", bold=True)
+        + click.style(" after updating.", fg="yellow")
+    )
+    click.echo(
+        click.style(
+            "This is required to migrate to the new configuration format.",
+            fg="yellow",
+        )
+    )
+    click.echo()
+    update_snippy()
+
 
-    thread = threading.Thread(target=check, daemon=True)
-    thread.start()
+if __name__ == "__main__":
+    # schedule_update_check 가 분리된 프로세스로 실행하는 진입점
+    if sys.argv[1:] == ["--refresh"]:
+        refresh_update_state()
@@ -1,17 +1,52 @@
 import os
 
-import click
-
 # Base Directory
 BASE_DIR = os.path.expanduser("~/.snippy")
 
 # File Paths
 CONFIG_PATH = os.path.join(BASE_DIR, "config.json")
+CONFIG_SNAPSHOT_PATH = os.path.join(BASE_DIR, "config.snapshot")
 VERSION_CACHE_PATH = os.path.join(BASE_DIR, "installed_version.json")
 LATEST_VERSION_PATH = os.path.join(BASE_DIR, "latest_version.json")
-CACHE_EXPIRATION_TIME = 30
+UPDATE_CHECK_LOCK_PATH = os.path.join(BASE_DIR, "update_check.lock")
+BREW_UPDATE_STAMP_PATH = os.path.join(BASE_DIR, "brew_update.stamp")
+USAGE_LOG_PATH = os.path.join(BASE_DIR, "usage.log")
+USAGE_SCORES_PATH = os.path.join(BASE_DIR, "usage.scores")
+HOOK_CACHE_PATH = os.path.join(BASE_DIR, "hook.cache")
+# 조직 공통 설정 (SNIPPY_ORG_CONFIG 로 경로 변경), 있으면 config.json 위에 merge
+ORG_CONFIG_PATH = os.path.join(BASE_DIR, "org.json")
+# 저장소 루트의 설정 파일, 있으면 org 설정 위에 merge
+REPO_CONFIG_NAME = ".snippy.json"
+
+# 저장소별 캐시는 <git common dir>/snippy/ 아래에 둠
+REPO_CACHE_DIR = "snippy"
+
+# Update Check (config 의 update_check_ttl_hours 로 변경, 0 이면 확인하지 않음)
+UPDATE_CHECK_TTL_HOURS = 24
+UPDATE_CHECK_LOCK_TIMEOUT = 10 * 60
+# 마지막 brew update 이후 이 시간(초) 안에는 formula 정보를 다시 받지 않음
+BREW_UPDATE_TTL = 60 * 60
+
+# Config editor 에서 연속된 수정을 한 번의 저장으로 묶는 간격(초)
+CONFIG_SAVE_DEBOUNCE = 2.0
+
+# snippy run --repos 에서 동시에 실행하는 git 프로세스 수 (config 의 repo_jobs 로 변경)
+REPO_JOBS = 8
+
+# Frecency (자주, 최근에 고른 commit type 을 위로)
+USAGE_HALF_LIFE = 14 * 24 * 60 * 60
+USAGE_LOG_MAX_RECORDS = 4096
+
+# Daemon
+DAEMON_SOCKET_PATH = os.path.join(BASE_DIR, "daemon.sock")
+DAEMON_IDLE_TIMEOUT = 30 * 60
+# 연결한 client 가 요청을 다 보내기까지 기다리는 시간(초)
+DAEMON_REQUEST_TIMEOUT = 5
 
 # ANSI Colors
+ANSI_GREEN = "\033[32m"
+ANSI_RED = "\033[31m"
+ANSI_YELLOW = "\033[33m"
 ANSI_GREEN_BOLD = "\033[1;32m"
 ANSI_RED_BOLD = "\033[1;31m"
 ANSI_RESET = "\033[0m"
@@ -19,11 +54,10 @@ ANSI_RESET = "\033[0m"
 # Common Strings
 SEPARATOR = "-" * 40
 
-# Styled Texts
-NOTE_YELLOW = click.style("Note:", fg="yellow")
-ON_GREEN = click.style("on", fg="green")
-OFF_RED = click.style("off", fg="red")
-OFF_RED = click.style("off", fg="red")
+# Styled Texts (click.style 과 같은 결과, click 을 import 하지 않기 위해 ANSI 코드로 작성)
+NOTE_YELLOW = f"{ANSI_YELLOW}Note:{ANSI_RESET}"
+ON_GREEN = f"{ANSI_GREEN}on{ANSI_RESET}"
+OFF_RED = f"{ANSI_RED}off{ANSI_RESET}"
 
 # Commit Types
 RAW_COMMIT_TYPES = {
@@ -0,0 +1,172 @@
+"""Git hook entry points (``commit-msg`` and ``prepare-commit-msg``).
+
+Hooks run on every commit, so this module only imports the standard library
+on its fast path. Everything derived from the config (the validator regexes
+and the prefilled first lines) is kept in ``~/.snippy/hook.cache``, or under
+the git dir when the repository has a ``.snippy.json``, keyed by the stat
+signatures of the config layers and rebuilt by the slow path when any of them
+changes. click and the prompt libraries are never imported.
+
+``re`` is only imported when a ``commit-msg`` hook actually checks a subject.
+
+    python -m snippy.hook commit-msg .git/COMMIT_EDITMSG
+    python -m snippy.hook prepare-commit-msg .git/COMMIT_EDITMSG [source [sha]]
+"""
+
+import marshal
+import os
+import sys
+
+from snippy.constants import CONFIG_PATH, HOOK_CACHE_PATH
+from snippy.utils.config_layers import get_config_layers
+
+HOOK_CACHE_FORMAT = 5
+HOOK_CACHE_NAME = "hook.cache"
+
+# git 이 만들어 주는 메시지는 검사하지 않음
+GENERATED_PREFIXES = ("Merge ", 'Revert "', "fixup! ", "squash! ", "amend! ")
+
+
+def build_hook_cache(config_path=CONFIG_PATH):
+    from snippy.utils.config_cache import load_config_snapshot
+    from snippy.utils.config_schema import get_default_config, get_type_name
+    from snippy.utils.template_utils import compile_template
+
+    snapshot = load_config_snapshot(config_path)
+    config = snapshot["config"] if snapshot is not None else get_default_config()
+    # 로딩 중 마이그레이션으로 config 가 다시 저장될 수 있으니 키는 그 뒤에 계산
+    key, _ = get_config_layers(config_path)
+    template = compile_template(config.commit_template)
+    commit_types = config.commit_types
+
+    prefills = []
+    for commit_type, commit_data in commit_types.items():
+        base_type = get_type_name(commit_type)
+        prefills.append(
+            (
+                commit_type,
+                template.render(
+                    base_type if config.include_type else "",
+                    commit_data.emoji if config.include_emoji else "",
+                    "",
+                ),
+            )
+        )
+    types = {get_type_name(commit_type) for commit_type in commit_types}
+    emojis = {commit_data.emoji for commit_data in commit_types.values()}
+    pattern = template.matcher(types, emojis).pattern
+    loose_pattern = template.matcher().pattern
+    return {
+        "format": HOOK_CACHE_FORMAT,
+        "key": key,
+        "template": config.commit_template,
+        "pattern": pattern,
+        "loose_pattern": loose_pattern,
+        "prefills": prefills,
+        "types": [
+            f"{get_type_name(commit_type)} {commit_data.emoji}".strip()
+            for commit_type, commit_data in commit_types.items()
+        ],
+    }
+
+
+def load_hook_cache(config_path=CONFIG_PATH, cache_path=None):
+    # 저장소에 .snippy.json 이 있으면 그 저장소의 git dir 아래에 따로 캐시
+    key, cache_dir = get_config_layers(config_path)
+    if cache_path is None:
+        cache_path = (
+            os.path.join(cache_dir, HOOK_CACHE_NAME)
+            if cache_dir is not None
+            else HOOK_CACHE_PATH
+        )
+    try:
+        with open(cache_path, "rb") as file:
+            cache = marshal.loads(file.read())
+        if cache.get("format") == HOOK_CACHE_FORMAT and cache.get("key") == key:
+            return cache
+    except (OSError, EOFError, ValueError, TypeError, AttributeError):
+        pass
+
+    cache = build_hook_cache(config_path)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, "wb") as file:
+            marshal.dump(cache, file)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+    return cache
+
+
+def read_subject(text):
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        if line.strip():
+            return line.rstrip()
+    return ""
+
+
+def commit_msg(message_path, *_):
+    with open(message_path, "r", encoding="utf-8", errors="replace") as file:
+        subject = read_subject(file.read())
+    if not subject or subject.startswith(GENERATED_PREFIXES):
+        return 0
+
+    import re
+
+    cache = load_hook_cache()
+    if re.match(cache["pattern"], subject):
+        return 0
+    if re.match(cache["loose_pattern"], subject):
+        reason = "unknown commit type or emoji"
+    else:
+        reason = f"expected \"{cache['template']}\""
+    sys.stderr.write(
+        f"snippy: commit message does not follow the template ({reason}).\n"
+        f"  {subject}\n"
+        "Use `git commit --no-verify` to skip this check.\n"
+    )
+    return 1
+
+
+def prepare_commit_msg(message_path, source=None, *_):
+    # -m, -F, merge, squash, amend 등 이미 메시지가 있으면 건드리지 않음
+    if source:
+        return 0
+    with open(message_path, "r", encoding="utf-8", errors="replace") as file:
+        existing = file.read()
+    if read_subject(existing):
+        return 0
+
+    cache = load_hook_cache()
+    prefills = cache["prefills"]
+    if not prefills:
+        return 0
+
+    from snippy.utils.usage_log import frecency_order
+
+    first = frecency_order([commit_type for commit_type, _ in prefills])[0]
+    help_line = "# snippy types: " + ", ".join(cache["types"])
+    with open(message_path, "w", encoding="utf-8") as file:
+        file.write(f"{prefills[first][1]}\n{help_line}\n{existing}")
+    return 0
+
+
+HOOKS = {
+    "commit-msg": commit_msg,
+    "prepare-commit-msg": prepare_commit_msg,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in HOOKS or len(argv) < 2:
+        sys.stderr.write(f"usage: python -m snippy.hook {{{','.join(HOOKS)}}} FILE\n")
+        return 2
+    return HOOKS[argv[0]](*argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
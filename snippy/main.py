@@ -1,92 +1,118 @@
 import sys
 
 import click
-import questionary
-
-from snippy.commands.commit import commit_with_warning, select_commit_type
-from snippy.commands.config import configure, load_config_async, reset_config
-from snippy.commands.update import (
-    fetch_installed_version_with_animation,
-    load_installed_version,
-    update_snippy,
-)
-from snippy.utils.emoji_utils import emojize_if_valid
-from snippy.utils.io_utils import run_async
 
-# Reusable option for run
-def click_run_option():
-    return click.option("-m", "--message", default=None, help="Commit message to use.")
+from snippy.utils.click_utils import LazyGroup, click_run_option, click_type_options
+
+
+def print_version(ctx, param, value):
+    # --version 이 실제로 전달된 경우에만 버전을 조회
+    if not value or ctx.resilient_parsing:
+        return
+    from snippy.utils.trace import span
+    from snippy.utils.version_utils import resolve_installed_version
+
+    with span("resolve version"):
+        version = resolve_installed_version()
+    click.echo(f"Snippy, version {version or 'Unknown'}")
+    ctx.exit()
+
+
+def start_profile(ctx, param, value):
+    # client 가 이미 시작했으면 아무 일도 하지 않음, python -m snippy.main 으로 실행된 경우용
+    if value and not ctx.resilient_parsing:
+        from snippy.utils.trace import start_tracing
+
+        start_tracing()
+
+
+def click_profile_option():
+    return click.option(
+        "--profile",
+        is_flag=True,
+        expose_value=False,
+        is_eager=True,
+        callback=start_profile,
+        help="Print where the time went to stderr when done (or set SNIPPY_TRACE).",
+    )
 
 
-def lazy_version_fetch():
-    return (
-        load_installed_version()
-        or fetch_installed_version_with_animation()
-        or "Unknown"
+def click_version_option():
+    return click.option(
+        "--version",
+        is_flag=True,
+        expose_value=False,
+        is_eager=True,
+        callback=print_version,
+        help="Show the version and exit.",
     )
 
 
-@click.group(invoke_without_command=True)
-@click.version_option(
-    version=lazy_version_fetch(),
-    prog_name="Snippy",
+# 서브커맨드 모듈은 해당 커맨드가 실행될 때만 import
+LAZY_SUBCOMMANDS = {
+    "run": ("snippy.commands.run:run_command", "Start Snippy"),
+    "config": ("snippy.commands.config:config_command", "Configure Snippy"),
+    "update": ("snippy.commands.update:update_command", "Update Snippy"),
+    "reset": (
+        "snippy.commands.config:reset_command",
+        "Reset configuration to default values",
+    ),
+    "batch": (
+        "snippy.commands.batch:batch_command",
+        "Create templated commits from JSONL on stdin",
+    ),
+    "daemon": (
+        "snippy.commands.daemon:daemon_command",
+        "Keep snippy warm in a background process",
+    ),
+    "lint": (
+        "snippy.commands.lint:lint_command",
+        "Check commit subjects in a range against the template",
+    ),
+    "changelog": (
+        "snippy.commands.changelog:changelog_command",
+        "Write a Markdown changelog for a commit range",
+    ),
+    "stats": (
+        "snippy.commands.stats:stats_command",
+        "Show commit type statistics for this repository",
+    ),
+    "hook": (
+        "snippy.commands.hook:hook_command",
+        "Install git hooks that check and prefill commit messages",
+    ),
+}
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
+    invoke_without_command=True,
 )
+@click_version_option()
+@click_profile_option()
 @click_run_option()
+@click_type_options()
 @click.pass_context
-def cli(ctx, message):
+def cli(ctx, message, type_name, no_type, no_emoji):
     """Snippy! Templatize your git commit comments. <3"""
 
     # Store message in context for subcommands
     ctx.ensure_object(dict)
     ctx.obj['message'] = message
+    ctx.obj['type_name'] = type_name
+    ctx.obj['no_type'] = no_type
+    ctx.obj['no_emoji'] = no_emoji
 
     if ctx.invoked_subcommand is None:
-        run_internal(message)
-
-
-@cli.command(name="config")
-def config_command():
-    config = run_async(load_config_async)
-    configure(config)
-
-
-@cli.command(name="reset")
-def reset_command():
-    reset_config()
-    click.echo("Configuration reset to default values.")
-
-
-@cli.command(name="update")
-def update_command():
-    click.echo(
-        click.style(
-            "Buy me a coffee! What do you think? 😝  @https://www.buymeacoffee.com/narashin",
-            fg="cyan",
-        )
-    )
+        from snippy.commands.run import run_internal
 
-    # 항상 공지사항 출력
-    click.echo(click.style("\n⚠️  Notice", fg="yellow", bold=True))
-    click.echo(
-        click.style(
-            "If you're using version 3.1.0 or below, please run ",
-            fg="yellow",
-        )
-        + click.style("snippy reset", fg="yellow", bold=True)
-        + click.style(" after updating.", fg="yellow")
-    )
-    click.echo(
-        click.style(
-            "This is required to migrate to the new configuration format.",
-            fg="yellow",
-        )
-    )
-    click.echo()
-    update_snippy()
+        run_internal(message, type_name=type_name, no_type=no_type, no_emoji=no_emoji)
 
 
 @cli.command(name="help")
 def help_command():
+    """Show this help message"""
     click.echo(
         click.style(
             "Buy me a coffee! What do you think? 😝  @https://www.buymeacoffee.com/narashin",
@@ -95,140 +121,17 @@ def help_command():
     )
     click.echo("\nSnippy! Templatize your git commit comments. <3")
     click.echo("\nAvailable commands:")
-    click.echo("  run      - Start Snippy")
-    click.echo("  config   - Configure Snippy")
-    click.echo("  update   - Update Snippy")
-    click.echo("  reset    - Reset configuration to default values")
-    click.echo("  help     - Show this help message")
-
-
-
-
-
-@cli.command()
-@click_run_option()
-@click.pass_context
-def run(ctx, message):
-    # Use message from context if available, otherwise use the option
-    if ctx.obj and ctx.obj.get('message'):
-        message = ctx.obj.get('message')
-    run_internal(message)
-
-def run_internal(message):
-    try:
-        config = run_async(load_config_async)
-
-        commit_template = config.get("commit_template")
-        commit_types = config.get("commit_types")
-
-        first_commit_type = next(iter(commit_types.items()))
-        example_commit = commit_template.replace("<type>", first_commit_type[0])
-        if config.get("include_emoji", True):
-            example_commit = example_commit.replace(
-                "<emoji>", emojize_if_valid(first_commit_type[1]["emoji"])
-            )
-        else:
-            example_commit = example_commit.replace("<emoji>", "")
-        example_commit = example_commit.replace("<subject>", "This is example comment.")
-        click.echo("Template:")
-        click.echo(f"  {commit_template} (e.g: {example_commit})")
-        click.echo()
-
-        include_type = config.get("include_type", True)
-        include_emoji = config.get("include_emoji", True)
-
-        commit_type = ""
-        emoji_code = ""
-
-        if include_type and include_emoji:
-            filtered_commit_types = {
-                k: {"emoji": v["emoji"], "description": v["description"]}
-                for k, v in commit_types.items()
-            }
-        elif include_type and not include_emoji:
-            filtered_commit_types = {
-                k: {"emoji": "", "description": v["description"]}
-                for k, v in commit_types.items()
-            }
-        elif include_emoji and not include_type:
-            filtered_commit_types = {
-                k: {"emoji": v["emoji"], "description": v["description"]}
-                for k, v in commit_types.items()
-            }
-        else:
-            filtered_commit_types = {}
-
-        if include_type or include_emoji:
-            result = select_commit_type(
-                filtered_commit_types, include_type, include_emoji
-            )
-            if result in ["add", "delete"]:
-                click.echo(
-                    "Configuration options are not available in commit mode. Please use 'snippy config'."
-                )
-                sys.exit(1)
-            elif result is None:
-                click.echo("Commit cancelled.")
-                sys.exit(1)
-            else:
-                commit_type, emoji_code = result
-
-        # Use provided message or prompt for one
-        if message:
-            subject = message
-        else:
-            subject = questionary.text("Enter commit message:").ask()
-            if subject is None:
-                click.echo("Commit cancelled.")
-                sys.exit(1)
-
-        if not subject:
-            generated_message = commit_template
-            if include_type:
-                generated_message = generated_message.replace("<type>", commit_type)
-            else:
-                generated_message = generated_message.replace("<type>", "")
-
-            if include_emoji:
-                generated_message = generated_message.replace(
-                    "<emoji>", emojize_if_valid(emoji_code)
-                )
-            else:
-                generated_message = generated_message.replace("<emoji>", "")
-
-            generated_message = generated_message.replace("<subject>", "").strip()
-
-            if generated_message:
-                click.echo(
-                    click.style(
-                        f"No commit message provided. Using default: {generated_message}",
-                        fg="yellow",
-                    )
-                )
-            else:
-                click.echo(
-                    click.style(
-                        "Commit message cannot be empty. Please provide a message.",
-                        fg="red",
-                    )
-                )
-                sys.exit(1)
-
-        commit_message = commit_template.replace("<type>", commit_type).replace(
-            "<subject>", subject
-        )
-        if "<emoji>" in commit_template:
-            commit_message = commit_message.replace(
-                "<emoji>", emojize_if_valid(emoji_code)
-            )
-        else:
-            commit_message = commit_message.replace("<emoji>", "")
-
-        commit_with_warning(commit_message)
-
-    except KeyboardInterrupt:
-        click.echo("\nSay Good bye to Snippy. Bye Bye!", err=True)
-        raise click.Abort()
+    click.echo("  run       - Start Snippy")
+    click.echo("  config    - Configure Snippy")
+    click.echo("  update    - Update Snippy")
+    click.echo("  reset     - Reset configuration to default values")
+    click.echo("  batch     - Create templated commits from JSONL on stdin")
+    click.echo("  daemon    - Keep snippy warm in a background process")
+    click.echo("  lint      - Check commit subjects in a range against the template")
+    click.echo("  changelog - Write a Markdown changelog for a commit range")
+    click.echo("  stats     - Show commit type statistics for this repository")
+    click.echo("  hook      - Install git hooks that check and prefill commit messages")
+    click.echo("  help      - Show this help message")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+import importlib
+
+import click
+
+from snippy.utils.trace import span
+
+
+# Reusable option for run
+def click_run_option():
+    return click.option("-m", "--message", default=None, help="Commit message to use.")
+
+
+# -t 와 -m 을 함께 주면 prompt 없이 커밋하므로 스크립트/IDE 에서 사용 가능
+def click_type_options():
+    options = (
+        click.option(
+            "-t",
+            "--type",
+            "type_name",
+            default=None,
+            help="Commit type to use instead of picking one.",
+        ),
+        click.option(
+            "--no-type",
+            is_flag=True,
+            default=False,
+            help="Leave the type out of the message.",
+        ),
+        click.option(
+            "--no-emoji",
+            is_flag=True,
+            default=False,
+            help="Leave the emoji out of the message.",
+        ),
+    )
+
+    def decorator(function):
+        for option in reversed(options):
+            function = option(function)
+        return function
+
+    return decorator
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is dispatched.
+
+    ``lazy_subcommands`` maps a command name to ``("module:attribute", short_help)``.
+    The short help is kept here so that ``--help`` does not import every command.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands:
+                rows.append((name, self.lazy_subcommands[name][1]))
+                continue
+            command = super().get_command(ctx, name)
+            if command is not None and not command.hidden:
+                rows.append((name, command.get_short_help_str()))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name):
+        import_path = self.lazy_subcommands[cmd_name][0]
+        module_name, attribute = import_path.split(":", 1)
+        with span("import command", command=cmd_name):
+            command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy command '{cmd_name}' is not a click command.")
+        return command
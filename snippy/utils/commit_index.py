@@ -0,0 +1,387 @@
+"""Incremental SQLite index of commit classifications for ``snippy stats``.
+
+Every non-merge commit reachable from a branch or tag is stored once, keyed
+by SHA, with its author, author time, the type and emoji parsed by the commit
+template, and the directories it touches (up to ``STATS_PATH_DEPTH`` levels).
+
+The ref tips seen by the last update are kept in the index. An update only
+walks ``git log <current tips> --not <previous tips>``, and when a ref moved
+in a way that is not a fast-forward (rebase, force push, deleted branch) the
+commits that are no longer reachable from any ref are removed again with
+``git log <previous tips> --not <current tips>``.
+
+Commit counts per type are also rolled up by day, by author and by
+directory as commits are added and removed, so the common queries read a
+table the size of the calendar, the team or the tree instead of aggregating
+the whole history.
+"""
+
+import time
+from datetime import date
+
+from snippy.utils.git_utils import (
+    CatFileBatch,
+    get_subprocess_module,
+    iter_git_records,
+)
+from snippy.utils.repo_cache import open_repo_cache
+
+STATS_INDEX_FORMAT = 2
+
+# 이 깊이까지의 디렉터리만 색인, 더 깊은 경로는 git log 로 직접 조회
+STATS_PATH_DEPTH = 3
+
+# 이 개수마다 색인을 commit, 중간에 끊겨도 그때까지의 결과는 남음
+STATS_BATCH_SIZE = 5000
+
+HEADER_MARK = "\x1e"
+FIELD_SEPARATOR = "\x1f"
+LOG_FORMAT = "--format=%x1e%H%x1f%at%x1f%aN <%aE>%x1f%s"
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+STATS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tips (
+    ref TEXT PRIMARY KEY,
+    sha TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS authors (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS prefixes (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    depth INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commits (
+    id INTEGER PRIMARY KEY,
+    sha TEXT UNIQUE NOT NULL,
+    author_id INTEGER NOT NULL,
+    time INTEGER NOT NULL,
+    type TEXT,
+    emoji TEXT
+);
+CREATE INDEX IF NOT EXISTS commits_time ON commits (time, type, emoji);
+CREATE INDEX IF NOT EXISTS commits_author ON commits (author_id, time, type, emoji);
+CREATE TABLE IF NOT EXISTS commit_prefixes (
+    prefix_id INTEGER NOT NULL,
+    commit_id INTEGER NOT NULL,
+    PRIMARY KEY (prefix_id, commit_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS commit_prefixes_commit ON commit_prefixes (commit_id);
+CREATE TABLE IF NOT EXISTS day_counts (
+    day INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    emoji TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, type, emoji)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS author_counts (
+    author_id INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    emoji TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (author_id, type, emoji)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS prefix_counts (
+    prefix_id INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    emoji TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (prefix_id, type, emoji)
+) WITHOUT ROWID;
+"""
+
+# 집계 테이블에서 type/emoji 가 없는 커밋은 NULL 대신 "" 로 저장
+ROLLUP_TABLES = ("day_counts", "author_counts", "prefix_counts")
+
+DATA_TABLES = (
+    "tips",
+    "authors",
+    "prefixes",
+    "commits",
+    "commit_prefixes",
+    *ROLLUP_TABLES,
+)
+
+
+def local_day(timestamp):
+    """Days since 1970-01-01 in the local calendar."""
+    return date.fromtimestamp(timestamp).toordinal() - EPOCH_ORDINAL
+
+
+class RollupCounts:
+    """Pending count changes for the rollup tables, applied in one pass."""
+
+    def __init__(self):
+        self.changes = {table: {} for table in ROLLUP_TABLES}
+
+    def add(self, timestamp, author_id, prefix_ids, commit_type, emoji, delta=1):
+        kind = (commit_type or "", emoji or "")
+        keys = [("day_counts", local_day(timestamp)), ("author_counts", author_id)]
+        keys.extend(("prefix_counts", prefix_id) for prefix_id in prefix_ids)
+        for table, key in keys:
+            changes = self.changes[table]
+            changes[(key, *kind)] = changes.get((key, *kind), 0) + delta
+
+    def flush(self, connection):
+        for table, changes in self.changes.items():
+            if not changes:
+                continue
+            connection.executemany(
+                f"""
+                INSERT INTO {table} VALUES (?, ?, ?, ?)
+                ON CONFLICT DO UPDATE SET count = count + excluded.count
+                """,
+                ((*key, delta) for key, delta in changes.items()),
+            )
+            if any(delta < 0 for delta in changes.values()):
+                connection.execute(f"DELETE FROM {table} WHERE count <= 0")
+            changes.clear()
+
+
+def open_commit_index(template_source, git_dir=None):
+    """Open the index, clearing it when it was built for another template."""
+    connection = open_repo_cache("stats", STATS_SCHEMA, git_dir)
+    expected = {
+        "format": str(STATS_INDEX_FORMAT),
+        "template": template_source,
+        "path_depth": str(STATS_PATH_DEPTH),
+        # 일 단위 집계는 색인할 때의 시간대 기준
+        "timezone": ",".join(time.tzname),
+    }
+    if dict(connection.execute("SELECT key, value FROM meta")) != expected:
+        with connection:
+            for table in DATA_TABLES:
+                connection.execute(f"DELETE FROM {table}")
+            connection.execute("DELETE FROM meta")
+            connection.executemany(
+                "INSERT INTO meta VALUES (?, ?)", expected.items()
+            )
+    return connection
+
+
+def list_tips():
+    """Return {ref: commit sha} for every branch and tag pointing at a commit."""
+    subprocess = get_subprocess_module()
+    result = subprocess.run(
+        [
+            "git",
+            "for-each-ref",
+            "--format=%(refname) %(objecttype) %(objectname) "
+            "%(*objecttype) %(*objectname)",
+            "refs/heads",
+            "refs/tags",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    tips = {}
+    for line in result.stdout.splitlines():
+        ref, object_type, sha, *peeled = line.split()
+        if peeled:
+            object_type, sha = peeled
+        if object_type == "commit":
+            tips[ref] = sha
+    return tips
+
+
+def iter_prefixes(path):
+    parts = path.split("/")[:-1]
+    for depth in range(1, min(len(parts), STATS_PATH_DEPTH) + 1):
+        yield "/".join(parts[:depth]), depth
+
+
+def iter_log_commits(include, exclude=(), with_paths=True):
+    """Yield (sha, time, author, subject, paths) for ``include --not exclude``.
+
+    Revisions go through ``git log --stdin`` so any number of refs fits.
+    """
+    args = ["log", "--stdin", "-z", "--no-merges", LOG_FORMAT]
+    if with_paths:
+        args[4:4] = ["--name-only", "--no-renames"]
+    revisions = [*include, *(f"^{sha}" for sha in exclude)]
+    records = iter_git_records(
+        args, input="".join(f"{revision}\n" for revision in revisions).encode()
+    )
+    commit = None
+    for record in records:
+        if record.startswith(HEADER_MARK):
+            if commit is not None:
+                yield commit
+            sha, timestamp, author, subject = record[1:].split(FIELD_SEPARATOR, 3)
+            commit = (sha, int(timestamp), author, subject, [])
+        elif record and commit is not None:
+            commit[4].append(record.lstrip("\n"))
+    if commit is not None:
+        yield commit
+
+
+def existing_objects(shas):
+    with CatFileBatch() as reader:
+        return {sha for sha, object_type, _ in reader.read_many(shas) if object_type}
+
+
+def remove_commits(connection, shas):
+    shas = list(shas)
+    for start in range(0, len(shas), 500):
+        batch = shas[start : start + 500]
+        marks = ",".join("?" * len(batch))
+        commits = connection.execute(
+            f"""
+            SELECT id, time, author_id, type, emoji FROM commits
+            WHERE sha IN ({marks})
+            """,
+            batch,
+        ).fetchall()
+        prefixes = {}
+        for commit_id, prefix_id in connection.execute(
+            f"""
+            SELECT commit_id, prefix_id FROM commit_prefixes
+            WHERE commit_id IN ({",".join("?" * len(commits))})
+            """,
+            [commit[0] for commit in commits],
+        ):
+            prefixes.setdefault(commit_id, []).append(prefix_id)
+        rollups = RollupCounts()
+        for commit_id, timestamp, author_id, commit_type, emoji in commits:
+            rollups.add(
+                timestamp,
+                author_id,
+                prefixes.get(commit_id, ()),
+                commit_type,
+                emoji,
+                delta=-1,
+            )
+        rollups.flush(connection)
+        connection.execute(
+            f"""
+            DELETE FROM commit_prefixes WHERE commit_id IN (
+                SELECT id FROM commits WHERE sha IN ({marks})
+            )
+            """,
+            batch,
+        )
+        connection.execute(f"DELETE FROM commits WHERE sha IN ({marks})", batch)
+
+
+class IndexWriter:
+    """Insert commits, interning authors and directory prefixes in memory."""
+
+    def __init__(self, connection, matcher):
+        self.connection = connection
+        self.matcher = matcher
+        self.authors = dict(connection.execute("SELECT name, id FROM authors"))
+        self.prefixes = dict(connection.execute("SELECT path, id FROM prefixes"))
+        self.rollups = RollupCounts()
+
+    def author_id(self, name):
+        author_id = self.authors.get(name)
+        if author_id is None:
+            author_id = self.connection.execute(
+                "INSERT INTO authors (name) VALUES (?)", (name,)
+            ).lastrowid
+            self.authors[name] = author_id
+        return author_id
+
+    def prefix_id(self, path, depth):
+        prefix_id = self.prefixes.get(path)
+        if prefix_id is None:
+            prefix_id = self.connection.execute(
+                "INSERT INTO prefixes (path, depth) VALUES (?, ?)", (path, depth)
+            ).lastrowid
+            self.prefixes[path] = prefix_id
+        return prefix_id
+
+    def add(self, sha, timestamp, author, subject, paths):
+        match = self.matcher.match(subject)
+        groups = match.groupdict() if match else {}
+        author_id = self.author_id(author)
+        commit_type = groups.get("type")
+        emoji = groups.get("emoji")
+        cursor = self.connection.execute(
+            "INSERT OR IGNORE INTO commits (sha, author_id, time, type, emoji)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (sha, author_id, timestamp, commit_type, emoji),
+        )
+        if cursor.rowcount != 1:
+            return False
+        prefix_ids = {
+            self.prefix_id(prefix, depth)
+            for path in paths
+            for prefix, depth in iter_prefixes(path)
+        }
+        if prefix_ids:
+            self.connection.executemany(
+                "INSERT INTO commit_prefixes VALUES (?, ?)",
+                ((prefix_id, cursor.lastrowid) for prefix_id in prefix_ids),
+            )
+        self.rollups.add(timestamp, author_id, prefix_ids, commit_type, emoji)
+        return True
+
+    def flush(self):
+        self.rollups.flush(self.connection)
+
+
+def update_commit_index(connection, matcher):
+    """Bring the index up to date with the current refs; return (added, removed)."""
+    current = list_tips()
+    previous = dict(connection.execute("SELECT ref, sha FROM tips"))
+    moved = {sha for ref, sha in previous.items() if current.get(ref) != sha}
+    if moved - set(current.values()):
+        alive = existing_objects(moved)
+        if alive != moved:
+            # 이전 tip 이 gc 로 사라지면 어떤 커밋이 떨어져 나갔는지 알 수 없음
+            with connection:
+                for table in DATA_TABLES:
+                    connection.execute(f"DELETE FROM {table}")
+            return update_commit_index(connection, matcher)
+
+    removed = 0
+    current_tips = sorted(set(current.values()))
+    if moved:
+        orphans = (
+            commit[0]
+            for commit in iter_log_commits(moved, current_tips, with_paths=False)
+        )
+        with connection:
+            batch = []
+            for sha in orphans:
+                batch.append(sha)
+                if len(batch) >= 500:
+                    remove_commits(connection, batch)
+                    removed += len(batch)
+                    batch = []
+            remove_commits(connection, batch)
+            removed += len(batch)
+
+    added = 0
+    if current_tips:
+        writer = IndexWriter(connection, matcher)
+        known = sorted(set(previous.values()) & set(current.values()) | moved)
+        pending = 0
+        try:
+            for commit in iter_log_commits(current_tips, known):
+                added += writer.add(*commit)
+                pending += 1
+                if pending >= STATS_BATCH_SIZE:
+                    writer.flush()
+                    connection.commit()
+                    pending = 0
+            writer.flush()
+            connection.execute("DELETE FROM tips")
+            connection.executemany("INSERT INTO tips VALUES (?, ?)", current.items())
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+    else:
+        with connection:
+            connection.execute("DELETE FROM tips")
+    return added, removed
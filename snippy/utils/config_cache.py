@@ -0,0 +1,133 @@
+import marshal
+import os
+
+from snippy.constants import CONFIG_PATH, CONFIG_SNAPSHOT_PATH
+from snippy.utils.config_layers import get_config_layers
+from snippy.utils.config_schema import Config, get_type_name
+from snippy.utils.config_store import read_config_layers
+from snippy.utils.search_index import build_search_index
+from snippy.utils.template_utils import tokenize_template
+from snippy.utils.trace import span
+
+# 스냅샷 구조가 바뀌면 올려서 기존 캐시를 무효화
+SNAPSHOT_FORMAT = 5
+
+CHOICE_KEYS = ("11", "10", "01")
+
+# 같은 프로세스(daemon)에서 반복 호출될 때 파일을 다시 읽지 않도록 스냅샷 파일별로 보관
+_loaded_snapshots = {}
+
+SNAPSHOT_NAME = "config.snapshot"
+
+
+def get_choice_key(include_type, include_emoji):
+    return f"{int(bool(include_type))}{int(bool(include_emoji))}"
+
+
+def format_commit_type(base_type, commit_data, include_type, include_emoji):
+    if include_type and include_emoji:
+        return f"{base_type} ({commit_data.emoji}) - {commit_data.description}"
+    elif include_type:
+        return f"{base_type} - {commit_data.description}"
+    elif include_emoji:
+        return f"{commit_data.emoji} - {commit_data.description}"
+    return f"{base_type} - {commit_data.description}"
+
+
+def build_commit_type_choices(commit_types, include_type, include_emoji):
+    choices = []
+    for commit_type, commit_data in commit_types.items():
+        base_type = get_type_name(commit_type)
+        display = format_commit_type(
+            base_type, commit_data, include_type, include_emoji
+        )
+        emoji = commit_data.emoji if include_emoji else ""
+        choices.append({"name": display, "value": (commit_type, emoji)})
+    return choices
+
+
+def compile_config(config, key):
+    """Return the marshal snapshot for ``config``; the Config is stored as a dict."""
+    choices = {
+        choice_key: build_commit_type_choices(
+            config.commit_types, choice_key[0] == "1", choice_key[1] == "1"
+        )
+        for choice_key in CHOICE_KEYS
+    }
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "key": key,
+        "config": config.to_dict(),
+        "template_tokens": tokenize_template(config.commit_template),
+        "choices": choices,
+        # picker 에서 쓰는 검색 인덱스, choices 와 같은 순서
+        "search": {
+            choice_key: build_search_index([choice["name"] for choice in entries])
+            for choice_key, entries in choices.items()
+        },
+    }
+
+
+def read_snapshot(path=CONFIG_SNAPSHOT_PATH):
+    try:
+        with open(path, "rb") as file:
+            # marshal.load(file) 는 파일을 조금씩 여러 번 읽어서 큰 스냅샷에서 훨씬 느림
+            return marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def write_snapshot(snapshot, path=CONFIG_SNAPSHOT_PATH):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as file:
+            marshal.dump(snapshot, file)
+        os.replace(temp_path, path)
+    except OSError:
+        # 캐시 저장 실패는 치명적이지 않으므로 무시
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def load_config_snapshot(config_path=CONFIG_PATH, snapshot_path=None, start=None):
+    """Return the compiled snapshot for the config that applies at ``start``.
+
+    That is ``config_path`` with the org and repository layers merged over it
+    (see ``config_layers``), or None if ``config_path`` does not exist. The
+    snapshot is kept per repository when a ``.snippy.json`` applies, and reused
+    while the (mtime, size, inode) of every layer is unchanged.
+    ``snapshot["config"]`` is a Config.
+    """
+    key, cache_dir = get_config_layers(config_path, start)
+    if not key or key[0][0] != config_path:
+        return None
+    if snapshot_path is None:
+        snapshot_path = (
+            os.path.join(cache_dir, SNAPSHOT_NAME)
+            if cache_dir is not None
+            else CONFIG_SNAPSHOT_PATH
+        )
+
+    snapshot = _loaded_snapshots.get(snapshot_path)
+    if snapshot is not None and snapshot["key"] == key:
+        return snapshot
+
+    snapshot = read_snapshot(snapshot_path)
+    if not (
+        isinstance(snapshot, dict)
+        and snapshot.get("format") == SNAPSHOT_FORMAT
+        and snapshot.get("key") == key
+    ):
+        with span("compile config", layers=len(key)):
+            config = read_config_layers([path for path, _ in key])
+            # 오래된 설정 파일이면 read_config_layers 가 migrate 해서 다시 썼으므로 key 가 바뀜
+            key, _ = get_config_layers(config_path, start)
+            snapshot = compile_config(config, key)
+            write_snapshot(snapshot, snapshot_path)
+
+    snapshot = dict(snapshot, config=Config.from_dict(snapshot["config"]))
+    _loaded_snapshots[snapshot_path] = snapshot
+    return snapshot
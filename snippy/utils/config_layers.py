@@ -0,0 +1,86 @@
+"""Which config files apply in the current directory.
+
+The global ``~/.snippy/config.json`` is the bottom layer. An org-wide file
+(``~/.snippy/org.json`` or ``$SNIPPY_ORG_CONFIG``) and the ``.snippy.json`` at
+the root of the current repository are merged over it, in that order.
+
+The repository root is found by walking up to ``.git`` instead of running
+``git rev-parse``, and each layer is described by its stat signature, so
+checking whether a cached merge is still valid costs a few ``stat`` calls.
+Only ``os`` is imported because the git hooks use this on their fast path.
+"""
+
+import os
+
+from snippy.constants import (
+    CONFIG_PATH,
+    ORG_CONFIG_PATH,
+    REPO_CACHE_DIR,
+    REPO_CONFIG_NAME,
+)
+
+ORG_CONFIG_ENV = "SNIPPY_ORG_CONFIG"
+
+
+def find_repo_root(start=None):
+    """Return ``(root, git_dir)`` for the repository containing ``start``.
+
+    Both are None outside a repository. ``git_dir`` is None when ``.git`` is a
+    file that does not point at a git directory.
+    """
+    path = os.path.abspath(start or os.getcwd())
+    if os.environ.get("GIT_DIR"):
+        root = os.environ.get("GIT_WORK_TREE") or path
+        return os.path.abspath(root), os.path.abspath(os.environ["GIT_DIR"])
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            return path, dot_git
+        if os.path.isfile(dot_git):
+            with open(dot_git, "r") as f:
+                content = f.read().strip()
+            if not content.startswith("gitdir:"):
+                return path, None
+            return path, os.path.normpath(
+                os.path.join(path, content[len("gitdir:") :].strip())
+            )
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None, None
+        path = parent
+
+
+def get_stat_key(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def get_config_layers(config_path=CONFIG_PATH, start=None):
+    """Return ``(layers, cache_dir)`` for the config files that apply at ``start``.
+
+    ``layers`` holds ``(path, stat key)`` for each file that exists, bottom
+    layer first, and doubles as the cache key of their merge. ``cache_dir`` is
+    the repository's ``<git dir>/snippy`` when a ``.snippy.json`` applies,
+    otherwise None (the merge is the same in every repository, so the caches
+    under ``~/.snippy`` are used).
+    """
+    layers = []
+    for path in (config_path, os.environ.get(ORG_CONFIG_ENV) or ORG_CONFIG_PATH):
+        try:
+            layers.append((path, get_stat_key(path)))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+    cache_dir = None
+    root, git_dir = find_repo_root(start)
+    if root is not None:
+        path = os.path.join(root, REPO_CONFIG_NAME)
+        try:
+            layers.append((path, get_stat_key(path)))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        else:
+            # worktree 마다 .snippy.json 이 다를 수 있으니 common dir 가 아닌 git dir 에 둠
+            if git_dir is not None:
+                cache_dir = os.path.join(git_dir, REPO_CACHE_DIR)
+    return tuple(layers), cache_dir
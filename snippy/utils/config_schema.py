@@ -0,0 +1,200 @@
+"""Typed, versioned form of ``config.json``.
+
+The file carries a ``schema_version``. Older files are brought up to date by
+running ``MIGRATIONS`` in order, and whoever loaded them writes the result
+back, so each migration runs once per config file instead of on every
+session. Emoji shortcodes are turned into glyphs whenever a config is
+written, so the rest of snippy reads glyphs and never emojizes.
+
+Everything outside this module reads the ``Config``/``CommitType`` model
+instead of the raw dict.
+"""
+
+from dataclasses import dataclass, field
+
+from snippy.constants import RAW_COMMIT_TYPES, REPO_JOBS, UPDATE_CHECK_TTL_HOURS
+
+DEFAULT_TEMPLATE = "<type>: <emoji> <subject>"
+
+# Config 필드로 읽는 키
+KNOWN_KEYS = (
+    "schema_version",
+    "commit_template",
+    "commit_types",
+    "include_type",
+    "include_emoji",
+    "scopes",
+    "update_check_ttl_hours",
+    "repo_jobs",
+)
+
+
+def migrate_string_commit_types(data):
+    """v0 -> v1: string commit types become ``{"emoji", "description"}`` dicts."""
+    commit_types = {}
+    for commit_type, value in (data.get("commit_types") or {}).items():
+        if value is None:
+            # 상위 layer 의 타입을 지우는 표시, merge 할 때 처리
+            commit_types[commit_type] = None
+            continue
+        if isinstance(value, str):
+            value = {
+                "emoji": value,
+                "description": RAW_COMMIT_TYPES.get(commit_type, {}).get(
+                    "description", ""
+                ),
+            }
+        commit_types[commit_type] = dict(value)
+    data["commit_types"] = commit_types
+    return data
+
+
+def migrate_emoji_shortcodes(data):
+    """v1 -> v2: store emoji glyphs instead of ``:alias:`` shortcodes."""
+    from snippy.utils.emoji_utils import emojize_if_valid
+
+    data["commit_types"] = {
+        # org/저장소 layer 는 emoji 없이 description 만 바꿀 수 있으므로 없는 키는 채우지 않음
+        commit_type: (
+            dict(value, emoji=emojize_if_valid(value["emoji"] or ""))
+            if value is not None and "emoji" in value
+            else value
+        )
+        for commit_type, value in (data.get("commit_types") or {}).items()
+    }
+    return data
+
+
+# MIGRATIONS[n] 은 schema_version n 을 n + 1 로 올림, 순서대로 추가만 할 것
+MIGRATIONS = (
+    migrate_string_commit_types,
+    migrate_emoji_shortcodes,
+)
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def migrate_config(data):
+    """Return ``(data, migrated)`` with ``data`` upgraded to ``SCHEMA_VERSION``.
+
+    A file written by a newer snippy is returned unchanged.
+    """
+    version = data.get("schema_version", 0)
+    if not isinstance(version, int) or version >= SCHEMA_VERSION:
+        return data, False
+    for migration in MIGRATIONS[version:]:
+        data = migration(data)
+    data["schema_version"] = SCHEMA_VERSION
+    return data, True
+
+
+def get_type_name(commit_type):
+    """Return the type written into commit messages for the config key ``commit_type``.
+
+    The config editor keeps several entries for one type apart with a suffix
+    (``fix``, ``fix_1``); every one of them is written as ``fix``.
+    """
+    return commit_type.split("_")[0]
+
+
+@dataclass(slots=True)
+class CommitType:
+    emoji: str = ""
+    description: str = ""
+
+
+@dataclass(slots=True)
+class Config:
+    commit_template: str = DEFAULT_TEMPLATE
+    # 키 순서가 picker 에 보이는 순서, "fix_1" 처럼 중복 타입은 접미사로 구분
+    commit_types: dict = field(default_factory=dict)
+    include_type: bool = True
+    include_emoji: bool = True
+    scopes: dict = field(default_factory=dict)
+    update_check_ttl_hours: float = UPDATE_CHECK_TTL_HOURS
+    repo_jobs: int = REPO_JOBS
+    schema_version: int = SCHEMA_VERSION
+    # 모르는 키는 그대로 보관했다가 저장할 때 다시 씀
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Config from a dict that is already at ``SCHEMA_VERSION``.
+
+        A ``null`` commit type, or ``"commit_types": null``, is treated as
+        absent, the same as a ``null`` in an org or repository layer.
+        """
+        return cls(
+            commit_template=data.get("commit_template") or DEFAULT_TEMPLATE,
+            commit_types={
+                commit_type: CommitType(
+                    value.get("emoji") or "", value.get("description") or ""
+                )
+                for commit_type, value in (data.get("commit_types") or {}).items()
+                if value is not None
+            },
+            include_type=bool(data.get("include_type", True)),
+            include_emoji=bool(data.get("include_emoji", True)),
+            scopes=data.get("scopes") or {},
+            update_check_ttl_hours=data.get(
+                "update_check_ttl_hours", UPDATE_CHECK_TTL_HOURS
+            ),
+            repo_jobs=data.get("repo_jobs", REPO_JOBS),
+            schema_version=data.get("schema_version", SCHEMA_VERSION),
+            extra={key: value for key, value in data.items() if key not in KNOWN_KEYS},
+        )
+
+    def to_dict(self):
+        """Return the JSON form, with emoji glyphs and only non-default tunables."""
+        from snippy.utils.emoji_utils import emojize_if_valid
+
+        data = {
+            "schema_version": self.schema_version,
+            "commit_template": self.commit_template,
+            "commit_types": {
+                commit_type: {
+                    "emoji": emojize_if_valid(value.emoji),
+                    "description": value.description,
+                }
+                for commit_type, value in self.commit_types.items()
+            },
+            "include_type": self.include_type,
+            "include_emoji": self.include_emoji,
+        }
+        if self.scopes:
+            data["scopes"] = self.scopes
+        if self.update_check_ttl_hours != UPDATE_CHECK_TTL_HOURS:
+            data["update_check_ttl_hours"] = self.update_check_ttl_hours
+        if self.repo_jobs != REPO_JOBS:
+            data["repo_jobs"] = self.repo_jobs
+        data.update(self.extra)
+        return data
+
+
+def merge_config(base, layer):
+    """Return ``base`` with ``layer`` deep-merged over it.
+
+    Nested objects (``commit_types``, ``scopes``) are merged key by key, any
+    other value replaces the one below, and ``null`` removes the key.
+    """
+    merged = dict(base)
+    for key, value in layer.items():
+        if value is None:
+            merged.pop(key, None)
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def parse_config(data):
+    """Return ``(config, migrated)`` for the raw JSON object of a config file."""
+    data, migrated = migrate_config(dict(data))
+    return Config.from_dict(data), migrated
+
+
+def get_default_config():
+    return parse_config(
+        {"commit_template": DEFAULT_TEMPLATE, "commit_types": RAW_COMMIT_TYPES}
+    )[0]
@@ -0,0 +1,134 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from snippy.constants import CONFIG_PATH, CONFIG_SAVE_DEBOUNCE
+from snippy.utils.config_schema import (
+    Config,
+    get_default_config,
+    merge_config,
+    migrate_config,
+    parse_config,
+)
+
+
+def read_config(path=CONFIG_PATH):
+    """Return the Config stored in ``path``.
+
+    A file with an older ``schema_version`` is migrated and written back first,
+    so the migrations do not run again on the next load.
+    """
+    with open(path, "r") as file:
+        config, migrated = parse_config(json.load(file))
+    if migrated:
+        write_config(config, path)
+    return config
+
+
+def read_config_layers(paths):
+    """Return the Config for ``paths`` merged in order over the first one.
+
+    Only the first (global) file is migrated on disk; the org and repository
+    files belong to someone else and are migrated in memory.
+    """
+    config = read_config(paths[0])
+    if len(paths) == 1:
+        return config
+    data = config.to_dict()
+    for path in paths[1:]:
+        with open(path, "r") as file:
+            layer, _ = migrate_config(json.load(file))
+        data = merge_config(data, layer)
+    return Config.from_dict(data)
+
+
+def write_config(config, path=CONFIG_PATH):
+    """Write ``config`` to ``path`` atomically (temp file, fsync, rename).
+
+    ``config`` is a Config or a raw dict; either way it is written at the
+    current schema version with emoji glyphs instead of shortcodes.
+    """
+    if not isinstance(config, Config):
+        config = parse_config(config)[0]
+    config = config.to_dict()
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w") as file:
+            json.dump(config, file, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ConfigStore:
+    """Holds the config being edited and writes it back only when it changed.
+
+    Editors mutate ``store.config`` and call ``mark_dirty()``. ``save()`` may be
+    called as often as convenient: it does nothing when nothing changed and
+    writes at most once per ``debounce`` seconds. ``flush()`` (called when a
+    ``session()`` exits) writes whatever is still pending.
+    """
+
+    def __init__(
+        self,
+        path=CONFIG_PATH,
+        default_factory=get_default_config,
+        debounce=CONFIG_SAVE_DEBOUNCE,
+    ):
+        self.path = path
+        self.default_factory = default_factory
+        self.debounce = debounce
+        self.config = None
+        self.dirty = False
+        self.last_write = 0.0
+
+    def load(self):
+        try:
+            self.config = read_config(self.path)
+            self.dirty = False
+        except FileNotFoundError:
+            self.config = self.default_factory()
+            self.dirty = True
+        return self.config
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def replace(self, config):
+        self.config = config
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return False
+        if time.monotonic() - self.last_write < self.debounce:
+            # 직전에 저장했으면 다음 save() 나 flush() 로 미룸
+            return False
+        return self.flush()
+
+    def flush(self):
+        if not self.dirty or self.config is None:
+            return False
+        write_config(self.config, self.path)
+        self.dirty = False
+        self.last_write = time.monotonic()
+        return True
+
+    @contextmanager
+    def session(self):
+        if self.config is None:
+            self.load()
+        try:
+            yield self
+        finally:
+            # Ctrl-C 로 빠져나가도 그 전까지의 수정은 한 번에 저장
+            self.flush()
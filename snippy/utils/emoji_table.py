@@ -0,0 +1,77 @@
+# Generated by scripts/generate_emoji_table.py. Do not edit by hand.
+# emoji==2.16.0
+
+EMOJI_ALIASES = {
+    ":adhesive_bandage:": "🩹",
+    ":alembic:": "⚗️",
+    ":alien:": "👽",
+    ":ambulance:": "🚑",
+    ":arrow_down:": "⬇️",
+    ":arrow_up:": "⬆️",
+    ":art:": "🎨",
+    ":beers:": "🍻",
+    ":bento:": "🍱",
+    ":bookmark:": "🔖",
+    ":boom:": "💥",
+    ":bricks:": "🧱",
+    ":bug:": "🐛",
+    ":building_construction:": "🏗️",
+    ":bulb:": "💡",
+    ":busts_in_silhouette:": "👥",
+    ":camera_flash:": "📸",
+    ":card_file_box:": "🗃️",
+    ":chart_with_upwards_trend:": "📈",
+    ":children_crossing:": "🚸",
+    ":closed_lock_with_key:": "🔐",
+    ":clown_face:": "🤡",
+    ":coffin:": "⚰️",
+    ":construction:": "🚧",
+    ":construction_worker:": "👷",
+    ":dizzy:": "💫",
+    ":egg:": "🍳",
+    ":fire:": "🔥",
+    ":globe_with_meridians:": "🌐",
+    ":goal_net:": "🥅",
+    ":green_heart:": "💚",
+    ":heavy_minus_sign:": "➖",
+    ":heavy_plus_sign:": "➕",
+    ":iphone:": "📱",
+    ":label:": "🏷️",
+    ":lipstick:": "💄",
+    ":lock:": "🔒",
+    ":loud_sound:": "🔊",
+    ":mag:": "🔍",
+    ":memo:": "📝",
+    ":money_with_wings:": "💸",
+    ":monocle_face:": "🧐",
+    ":mute:": "🔇",
+    ":necktie:": "👔",
+    ":package:": "📦",
+    ":page_facing_up:": "📄",
+    ":passport_control:": "🛂",
+    ":pencil2:": "✏️",
+    ":poop:": "💩",
+    ":pushpin:": "📌",
+    ":recycle:": "♻️",
+    ":rewind:": "⏪",
+    ":rocket:": "🚀",
+    ":rotating_light:": "🚨",
+    ":safety_vest:": "🦺",
+    ":see_no_evil:": "🙈",
+    ":seedling:": "🌱",
+    ":sparkles:": "✨",
+    ":speech_balloon:": "💬",
+    ":stethoscope:": "🩺",
+    ":tada:": "🎉",
+    ":technologist:": "🧑‍💻",
+    ":test_tube:": "🧪",
+    ":thread:": "🧵",
+    ":triangular_flag_on_post:": "🚩",
+    ":truck:": "🚚",
+    ":twisted_rightwards_arrows:": "🔀",
+    ":wastebasket:": "🗑️",
+    ":wheelchair:": "♿",
+    ":white_check_mark:": "✅",
+    ":wrench:": "🔧",
+    ":zap:": "⚡",
+}
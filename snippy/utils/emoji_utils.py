@@ -1,28 +1,28 @@
+from snippy.utils.emoji_table import EMOJI_ALIASES
+from snippy.utils.trace import span
+
 _emoji = None
 
 
 def get_emoji_module():
     global _emoji
     if _emoji is None:
-        import emoji
+        with span("import emoji"):
+            import emoji
 
         _emoji = emoji
     return _emoji
 
 
 def emojize_if_valid(emoji_code):
+    glyph = EMOJI_ALIASES.get(emoji_code)
+    if glyph is not None:
+        return glyph
+    # alias 가 없는 문자열(이미 이모지이거나 빈 값)은 emoji 패키지를 로드할 필요가 없음
+    if ":" not in emoji_code:
+        return emoji_code
     try:
         return get_emoji_module().emojize(emoji_code, language="alias")
     except KeyError:
         return emoji_code
 
-
-def emojize_commit_types(commit_types):
-    emoji = get_emoji_module()
-    return {
-        key: {
-            "emoji": emoji.emojize(value["emoji"], language="alias"),
-            "description": value["description"],
-        }
-        for key, value in commit_types.items()
-    }
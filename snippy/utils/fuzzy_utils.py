@@ -0,0 +1,49 @@
+from snippy.utils.search_index import SearchSession, build_search_index
+
+# 덮어쓰는 InquirerPy 내부 속성, 버전이 바뀌어 하나라도 없으면 기본 fuzzy 필터를 그대로 씀
+PATCHED_CONTROL_ATTRS = ("_filter_choices", "_current_text")
+PATCHED_PROMPT_ATTRS = ("_calculate_wait_time",)
+
+
+def use_search_index(prompt, index=None, order=None):
+    """Make an ``inquirer.fuzzy`` prompt filter through a precomputed search index.
+
+    InquirerPy re-scores every choice with pfzy on each keystroke, after a wait
+    that grows with the number of choices. The index makes filtering cheap
+    enough to run immediately. ``index`` must be built from the choice names;
+    when the prompt shows them in a different order, ``order`` lists the index
+    entry of each displayed choice.
+
+    This replaces private InquirerPy methods; if they are missing the prompt
+    is returned unchanged and keeps pfzy's filtering.
+    """
+    control = getattr(prompt, "content_control", None)
+    if control is None or not (
+        all(hasattr(control, name) for name in PATCHED_CONTROL_ATTRS)
+        and all(hasattr(prompt, name) for name in PATCHED_PROMPT_ATTRS)
+    ):
+        return prompt
+    choices = control.choices
+    if index is None:
+        index, order = build_search_index([choice["name"] for choice in choices]), None
+    session = SearchSession(index, order)
+    by_entry = [None] * len(choices)
+    for position, entry_id in enumerate(session.order):
+        by_entry[entry_id] = choices[position]
+
+    async def filter_choices(wait_time):
+        results = session.search(control._current_text())
+        if results is None:
+            for choice in choices:
+                choice["indices"] = []
+            return choices
+        filtered = []
+        for entry_id, indices in results:
+            choice = by_entry[entry_id]
+            choice["indices"] = indices
+            filtered.append(choice)
+        return filtered
+
+    control._filter_choices = filter_choices
+    prompt._calculate_wait_time = lambda: 0.0
+    return prompt
@@ -0,0 +1,93 @@
+import os
+
+from snippy.utils.git_utils import get_subprocess_module
+
+GIT_BACKEND_ENV = "SNIPPY_GIT_BACKEND"
+
+
+class GitBackend:
+    """Git operations used on the commit path."""
+
+    name = None
+
+    def has_staged_changes(self):
+        raise NotImplementedError
+
+    def commit(self, commit_message):
+        subprocess = get_subprocess_module()
+        return subprocess.run(["git", "commit", "-m", commit_message]).returncode
+
+
+class SubprocessGitBackend(GitBackend):
+    """Asks git, reading only the exit code so the staged path list is never produced."""
+
+    name = "subprocess"
+
+    def has_staged_changes(self):
+        subprocess = get_subprocess_module()
+        result = subprocess.run(
+            ["git", "diff", "--cached", "--quiet", "--no-ext-diff"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        # 0: 변경 없음, 1: 변경 있음, 그 외: git 저장소가 아님 등
+        return result.returncode == 1
+
+
+class IndexGitBackend(GitBackend):
+    """Compares .git/index with HEAD's tree in-process, without forking git.
+
+    Walking the index in Python costs more than the fork it saves (about 10ms
+    against 4ms for git at 20k files, see benchmarks/bench_staged.py), so this
+    is opt-in. It is kept for setups where starting git is the expensive part,
+    such as a git wrapper on PATH or a sandbox that makes process creation slow.
+    """
+
+    name = "index"
+
+    def __init__(self, git_dir=None):
+        self.git_dir = git_dir
+
+    def has_staged_changes(self):
+        from snippy.utils import git_index
+
+        git_dir = self.git_dir or git_index.find_git_dir()
+        if git_dir is None:
+            return False
+        return git_index.has_staged_changes(git_index.Repository(git_dir))
+
+
+class AutoGitBackend(GitBackend):
+    """Uses the in-process reader and falls back to git when the repository is unsupported."""
+
+    name = "auto"
+
+    def __init__(self):
+        self.index_backend = IndexGitBackend()
+        self.subprocess_backend = SubprocessGitBackend()
+
+    def has_staged_changes(self):
+        from snippy.utils.git_index import UnsupportedRepository
+
+        try:
+            return self.index_backend.has_staged_changes()
+        except (UnsupportedRepository, OSError, ValueError):
+            return self.subprocess_backend.has_staged_changes()
+
+
+GIT_BACKENDS = {
+    AutoGitBackend.name: AutoGitBackend,
+    IndexGitBackend.name: IndexGitBackend,
+    SubprocessGitBackend.name: SubprocessGitBackend,
+}
+
+
+def get_git_backend(name=None):
+    # 기본값은 exit code 만 읽는 subprocess 백엔드 (benchmarks/bench_staged.py 참고)
+    name = name or os.environ.get(GIT_BACKEND_ENV) or SubprocessGitBackend.name
+    try:
+        return GIT_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown git backend '{name}'. Choose one of: {', '.join(GIT_BACKENDS)}"
+        )
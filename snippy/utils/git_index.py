@@ -0,0 +1,526 @@
+"""Read-only access to a git repository's index and object store, without forking git.
+
+Only what snippy needs is implemented: resolving HEAD, reading commit and tree
+objects (loose or packed) and parsing ``.git/index`` (versions 2-4). Anything
+else - split or sparse indexes, reftable refs, SHA-256 repositories - raises
+UnsupportedRepository so callers can fall back to the git executable.
+"""
+
+import glob
+import os
+import struct
+import zlib
+from array import array
+
+from snippy.utils.config_layers import find_repo_root
+
+HASH_SIZE = 20
+TREE_MODE = 0o40000
+
+INDEX_HEADER = struct.Struct("!4sII")
+INDEX_ENTRY = struct.Struct("!24x I 12x 20s H")
+EXTENDED_FLAG = 0x4000
+INTENT_TO_ADD_FLAG = 0x2000
+NAME_MASK = 0xFFF
+
+OBJ_COMMIT, OBJ_TREE, OBJ_BLOB, OBJ_TAG = 1, 2, 3, 4
+OBJ_OFS_DELTA, OBJ_REF_DELTA = 6, 7
+TYPE_NAMES = {OBJ_COMMIT: b"commit", OBJ_TREE: b"tree", OBJ_BLOB: b"blob", OBJ_TAG: b"tag"}
+
+
+class UnsupportedRepository(Exception):
+    pass
+
+
+def find_git_dir(start=None):
+    root, git_dir = find_repo_root(start)
+    if root is not None and git_dir is None:
+        raise UnsupportedRepository(f"Unrecognised .git file in {root}")
+    return git_dir
+
+
+class IndexEntry:
+    __slots__ = ("path", "mode", "object_id", "stage", "intent_to_add")
+
+    def __init__(self, path, mode, object_id, stage, intent_to_add):
+        self.path = path
+        self.mode = mode
+        self.object_id = object_id
+        self.stage = stage
+        self.intent_to_add = intent_to_add
+
+
+class Pack:
+    def __init__(self, idx_path):
+        self.pack_path = idx_path[: -len(".idx")] + ".pack"
+        with open(idx_path, "rb") as f:
+            data = f.read()
+        if data[:4] != b"\377tOc" or struct.unpack_from("!I", data, 4)[0] != 2:
+            raise UnsupportedRepository(f"Unsupported pack index {idx_path}")
+        self.fanout = struct.unpack_from("!256I", data, 8)
+        count = self.fanout[255]
+        self.names_start = 8 + 256 * 4
+        self.offsets_start = self.names_start + count * HASH_SIZE + count * 4
+        self.large_offsets_start = self.offsets_start + count * 4
+        self.data = data
+        self._file = None
+
+    def find(self, binary_id):
+        first = binary_id[0]
+        low = self.fanout[first - 1] if first else 0
+        high = self.fanout[first]
+        data = self.data
+        while low < high:
+            middle = (low + high) // 2
+            start = self.names_start + middle * HASH_SIZE
+            name = data[start : start + HASH_SIZE]
+            if name < binary_id:
+                low = middle + 1
+            elif name > binary_id:
+                high = middle
+            else:
+                (offset,) = struct.unpack_from("!I", data, self.offsets_start + middle * 4)
+                if offset & 0x80000000:
+                    index = offset & 0x7FFFFFFF
+                    (offset,) = struct.unpack_from(
+                        "!Q", data, self.large_offsets_start + index * 8
+                    )
+                return offset
+        return None
+
+    def read_at(self, offset, store):
+        if self._file is None:
+            self._file = open(self.pack_path, "rb")
+        f = self._file
+        f.seek(offset)
+        header = f.read(32)
+        byte = header[0]
+        obj_type = (byte >> 4) & 7
+        size = byte & 15
+        shift, position = 4, 1
+        while byte & 0x80:
+            byte = header[position]
+            size |= (byte & 0x7F) << shift
+            shift += 7
+            position += 1
+
+        if obj_type == OBJ_OFS_DELTA:
+            byte = header[position]
+            position += 1
+            base_offset = byte & 0x7F
+            while byte & 0x80:
+                byte = header[position]
+                position += 1
+                base_offset = ((base_offset + 1) << 7) | (byte & 0x7F)
+            base_type, base = self.read_at(offset - base_offset, store)
+            delta = self._inflate(offset + position)
+            return base_type, apply_delta(base, delta)
+        if obj_type == OBJ_REF_DELTA:
+            base_id = header[position : position + HASH_SIZE]
+            base_type, base = store.read_binary(base_id)
+            delta = self._inflate(offset + position + HASH_SIZE)
+            return base_type, apply_delta(base, delta)
+        return TYPE_NAMES[obj_type], self._inflate(offset + position)
+
+    def _inflate(self, offset):
+        f = self._file
+        f.seek(offset)
+        decompressor = zlib.decompressobj()
+        chunks = []
+        while not decompressor.eof:
+            chunk = f.read(8192)
+            if not chunk:
+                break
+            chunks.append(decompressor.decompress(chunk))
+        return b"".join(chunks)
+
+
+def _read_varint(data, position):
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+
+def apply_delta(base, delta):
+    _, position = _read_varint(delta, 0)
+    _, position = _read_varint(delta, position)
+    out = []
+    length = len(delta)
+    while position < length:
+        opcode = delta[position]
+        position += 1
+        if opcode & 0x80:
+            offset = size = 0
+            for bit in range(4):
+                if opcode & (1 << bit):
+                    offset |= delta[position] << (8 * bit)
+                    position += 1
+            for bit in range(3):
+                if opcode & (1 << (4 + bit)):
+                    size |= delta[position] << (8 * bit)
+                    position += 1
+            out.append(base[offset : offset + (size or 0x10000)])
+        elif opcode:
+            out.append(delta[position : position + opcode])
+            position += opcode
+        else:
+            raise UnsupportedRepository("Corrupt delta")
+    return b"".join(out)
+
+
+class ObjectStore:
+    def __init__(self, objects_dir):
+        self.objects_dirs = [objects_dir]
+        alternates = os.path.join(objects_dir, "info", "alternates")
+        if os.path.exists(alternates):
+            with open(alternates, "r") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        self.objects_dirs.append(os.path.join(objects_dir, line))
+        self._packs = None
+
+    @property
+    def packs(self):
+        if self._packs is None:
+            self._packs = [
+                Pack(idx_path)
+                for objects_dir in self.objects_dirs
+                for idx_path in glob.glob(os.path.join(objects_dir, "pack", "*.idx"))
+            ]
+        return self._packs
+
+    def read_binary(self, binary_id):
+        hex_id = binary_id.hex()
+        for objects_dir in self.objects_dirs:
+            loose_path = os.path.join(objects_dir, hex_id[:2], hex_id[2:])
+            try:
+                with open(loose_path, "rb") as f:
+                    raw = zlib.decompress(f.read())
+            except FileNotFoundError:
+                continue
+            header, _, body = raw.partition(b"\0")
+            return header.split(b" ", 1)[0], body
+        for pack in self.packs:
+            offset = pack.find(binary_id)
+            if offset is not None:
+                return pack.read_at(offset, self)
+        raise UnsupportedRepository(f"Object {hex_id} not found")
+
+    def read_tree(self, binary_id):
+        obj_type, body = self.read_binary(binary_id)
+        if obj_type != b"tree":
+            raise UnsupportedRepository(f"{binary_id.hex()} is not a tree")
+        entries = []
+        position, length = 0, len(body)
+        while position < length:
+            space = body.index(b" ", position)
+            nul = body.index(b"\0", space)
+            mode = int(body[position:space], 8)
+            name = body[space + 1 : nul]
+            entries.append((mode, name, body[nul + 1 : nul + 1 + HASH_SIZE]))
+            position = nul + 1 + HASH_SIZE
+        return entries
+
+    def commit_tree(self, binary_id):
+        obj_type, body = self.read_binary(binary_id)
+        while obj_type == b"tag":
+            target = body.split(b"\n", 1)[0].split(b" ", 1)[1]
+            obj_type, body = self.read_binary(bytes.fromhex(target.decode()))
+        if obj_type != b"commit" or not body.startswith(b"tree "):
+            raise UnsupportedRepository(f"{binary_id.hex()} is not a commit")
+        return bytes.fromhex(body[5 : 5 + HASH_SIZE * 2].decode())
+
+
+class Repository:
+    def __init__(self, git_dir):
+        self.git_dir = git_dir
+        commondir_path = os.path.join(git_dir, "commondir")
+        if os.path.exists(commondir_path):
+            with open(commondir_path, "r") as f:
+                self.common_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+        else:
+            self.common_dir = git_dir
+        self._check_format()
+        self.objects = ObjectStore(
+            os.environ.get("GIT_OBJECT_DIRECTORY")
+            or os.path.join(self.common_dir, "objects")
+        )
+        self.index_path = os.environ.get("GIT_INDEX_FILE") or os.path.join(
+            git_dir, "index"
+        )
+
+    def _check_format(self):
+        try:
+            with open(os.path.join(self.common_dir, "config"), "r") as f:
+                config = f.read().lower()
+        except FileNotFoundError:
+            return
+        if "objectformat" in config or "refstorage" in config:
+            raise UnsupportedRepository("Repository uses a non-default storage format")
+
+    def resolve_ref(self, ref, depth=0):
+        if depth > 5:
+            raise UnsupportedRepository(f"Symbolic ref loop at {ref}")
+        for base in (self.git_dir, self.common_dir):
+            try:
+                with open(os.path.join(base, ref), "r") as f:
+                    value = f.read().strip()
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                continue
+            if value.startswith("ref:"):
+                return self.resolve_ref(value[4:].strip(), depth + 1)
+            return bytes.fromhex(value)
+        try:
+            with open(os.path.join(self.common_dir, "packed-refs"), "r") as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    object_id, _, name = line.rstrip("\n").partition(" ")
+                    if name == ref:
+                        return bytes.fromhex(object_id)
+        except FileNotFoundError:
+            pass
+        # 아직 커밋이 없는 브랜치 (unborn HEAD)
+        return None
+
+    def head_tree(self):
+        commit_id = self.resolve_ref("HEAD")
+        if commit_id is None:
+            return None
+        return self.objects.commit_tree(commit_id)
+
+    def read_index(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = None
+        return Index(data)
+
+
+class Index:
+    """A parsed ``.git/index``.
+
+    The first pass only walks entry boundaries to reach the extensions. For
+    index v2/v3 it also records where each entry starts, so ``entries``
+    decodes only the entries that are looked at: a walk that skips whole
+    directories through the cache-tree never touches their entries. v4
+    prefix-compresses names, so its entries are decoded all at once.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.cache_tree = {}
+        self.has_intent_to_add = False
+        self._entries = None
+        self._offsets = array("I")
+        if data is None:
+            self.version = self.count = 0
+            self._entries = []
+            return
+
+        signature, self.version, self.count = INDEX_HEADER.unpack_from(data, 0)
+        if signature != b"DIRC" or self.version not in (2, 3, 4):
+            raise UnsupportedRepository(f"Unsupported index version {self.version}")
+        self._read_extensions(self._skip_entries())
+
+    def _skip_entries(self):
+        data = self.data
+        offsets = self._offsets
+        position = INDEX_HEADER.size
+        for _ in range(self.count):
+            offsets.append(position)
+            flags = (data[position + 60] << 8) | data[position + 61]
+            name_start = position + INDEX_ENTRY.size
+            if flags & EXTENDED_FLAG:
+                if data[name_start] & (INTENT_TO_ADD_FLAG >> 8):
+                    self.has_intent_to_add = True
+                name_start += 2
+            if self.version == 4:
+                while data[name_start] & 0x80:
+                    name_start += 1
+                position = data.index(b"\0", name_start + 1) + 1
+            else:
+                name_length = flags & NAME_MASK
+                if name_length == NAME_MASK:
+                    name_length = data.index(b"\0", name_start) - name_start
+                position += (name_start - position + name_length + 8) & ~7
+        return position
+
+    def _read_extensions(self, position):
+        data = self.data
+        end = len(data) - HASH_SIZE
+        while position + 8 <= end:
+            signature = data[position : position + 4]
+            (size,) = struct.unpack_from("!I", data, position + 4)
+            if signature == b"TREE":
+                self.cache_tree = _parse_cache_tree(data[position + 8 : position + 8 + size])
+            elif not signature[:1].isupper():
+                raise UnsupportedRepository(
+                    f"Index extension {signature!r} is not supported"
+                )
+            position += 8 + size
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            if self.version == 4:
+                self._entries = self._decode_entries()
+            else:
+                self._entries = LazyEntries(self)
+        return self._entries
+
+    def decode_entry(self, position, previous_name=b""):
+        """Return (entry, next position) for the entry starting at ``position``."""
+        data = self.data
+        mode, object_id, flags = INDEX_ENTRY.unpack_from(data, position)
+        name_start = position + INDEX_ENTRY.size
+        intent_to_add = False
+        if flags & EXTENDED_FLAG:
+            (extended,) = struct.unpack_from("!H", data, name_start)
+            intent_to_add = bool(extended & INTENT_TO_ADD_FLAG)
+            name_start += 2
+        if self.version == 4:
+            strip, name_start = _read_varint(data, name_start)
+            name_end = data.index(b"\0", name_start)
+            name = previous_name[: len(previous_name) - strip] + data[name_start:name_end]
+            position = name_end + 1
+        else:
+            name_length = flags & NAME_MASK
+            if name_length == NAME_MASK:
+                name_end = data.index(b"\0", name_start)
+            else:
+                name_end = name_start + name_length
+            name = data[name_start:name_end]
+            position += (name_end - position + 8) & ~7
+        if mode == TREE_MODE:
+            raise UnsupportedRepository("Sparse index is not supported")
+        entry = IndexEntry(name, mode, object_id, (flags >> 12) & 3, intent_to_add)
+        return entry, position
+
+    def _decode_entries(self):
+        entries = []
+        position = INDEX_HEADER.size
+        previous_name = b""
+        for _ in range(self.count):
+            entry, position = self.decode_entry(position, previous_name)
+            previous_name = entry.path
+            entries.append(entry)
+        return entries
+
+
+class LazyEntries:
+    """The entries of a v2/v3 index, decoded on access from their recorded offsets."""
+
+    __slots__ = ("index", "decoded")
+
+    def __init__(self, index):
+        self.index = index
+        self.decoded = {}
+
+    def __len__(self):
+        return self.index.count
+
+    def __getitem__(self, position):
+        entry = self.decoded.get(position)
+        if entry is None:
+            if not 0 <= position < self.index.count:
+                raise IndexError(position)
+            entry, _ = self.index.decode_entry(self.index._offsets[position])
+            self.decoded[position] = entry
+        return entry
+
+
+def _parse_cache_tree(body):
+    cache_tree = {}
+    position = 0
+    # (경로, 남은 하위 트리 수) 스택으로 pre-order 구조를 복원
+    stack = []
+    while position < len(body):
+        nul = body.index(b"\0", position)
+        name = body[position:nul]
+        newline = body.index(b"\n", nul)
+        entry_count, subtrees = (int(value) for value in body[nul + 1 : newline].split(b" "))
+        position = newline + 1
+        object_id = None
+        if entry_count >= 0:
+            object_id = body[position : position + HASH_SIZE]
+            position += HASH_SIZE
+
+        while stack and stack[-1][1] == 0:
+            stack.pop()
+        if stack:
+            parent, remaining = stack[-1]
+            stack[-1] = (parent, remaining - 1)
+            path = parent + name + b"/"
+        else:
+            path = b""
+        cache_tree[path] = (entry_count, object_id)
+        stack.append((path, subtrees))
+    return cache_tree
+
+
+def has_staged_changes(repository):
+    """Return True if the index differs from HEAD's tree, stopping at the first difference."""
+    index = repository.read_index()
+    head_tree = repository.head_tree()
+
+    if head_tree is None:
+        return any(not entry.intent_to_add for entry in index.entries)
+
+    cache_tree = index.cache_tree
+    use_cache_tree = not index.has_intent_to_add
+    root = cache_tree.get(b"")
+    if use_cache_tree and root is not None and root[0] >= 0:
+        # cache-tree 가 유효하면 index 항목을 디코딩하지 않고 트리 id 만으로 판단
+        return root[1] != head_tree
+
+    entries = index.entries
+    position = 0
+    total = len(entries)
+
+    def differs(tree_id, prefix):
+        nonlocal position
+        for mode, name, object_id in repository.objects.read_tree(tree_id):
+            path = prefix + name
+            while position < total and entries[position].intent_to_add:
+                position += 1
+            if mode == TREE_MODE:
+                cached = cache_tree.get(path + b"/") if use_cache_tree else None
+                if cached is not None and cached[0] >= 0 and cached[1] == object_id:
+                    position += cached[0]
+                    continue
+                if differs(object_id, path + b"/"):
+                    return True
+                continue
+            if position >= total:
+                return True
+            entry = entries[position]
+            if (
+                entry.path != path
+                or entry.stage
+                or entry.object_id != object_id
+                or _normalize_mode(entry.mode) != _normalize_mode(mode)
+            ):
+                return True
+            position += 1
+        return False
+
+    if differs(head_tree, b""):
+        return True
+    while position < total and entries[position].intent_to_add:
+        position += 1
+    return position != total
+
+
+def _normalize_mode(mode):
+    # 오래된 트리에 남아 있는 100664 같은 모드를 git 과 동일하게 정규화
+    if mode & 0o170000 == 0o100000:
+        return 0o100755 if mode & 0o111 else 0o100644
+    return mode
@@ -7,18 +7,58 @@ def get_subprocess_module():
     return subprocess
 
 
-def check_staged_files():
+def iter_git_records(args, chunk_size=1 << 16, input=None):
+    """Run ``git <args>`` and yield its NUL-separated output records as they arrive.
+
+    Only one chunk is held at a time, so memory does not grow with the output.
+    ``input`` is written to git's stdin first, for commands such as
+    ``git log --stdin`` that read all of it before writing anything.
+    Returns git's exit status when exhausted.
+    """
+    import os
+
     subprocess = get_subprocess_module()
-    result = subprocess.run(
-        ["git", "diff", "--cached", "--name-only"], stdout=subprocess.PIPE, text=True
+    process = subprocess.Popen(
+        ["git", *args],
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
     )
-    if not result.stdout.strip():
-        return False
-    return True
+    if input is not None:
+        process.stdin.write(input)
+        process.stdin.close()
+    try:
+        pending = b""
+        while True:
+            chunk = process.stdout.read1(chunk_size)
+            if not chunk:
+                break
+            *records, pending = (pending + chunk).split(b"\0")
+            for record in records:
+                yield os.fsdecode(record)
+        if pending:
+            yield os.fsdecode(pending)
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    return returncode
+
+
+def iter_staged_paths():
+    """Yield staged paths from ``git diff --cached --name-only -z`` as they arrive."""
+    return iter_git_records(["diff", "--cached", "--name-only", "-z", "--no-ext-diff"])
+
+
+def check_staged_files(backend=None):
+    from snippy.utils.git_backend import get_git_backend
+
+    return (backend or get_git_backend()).has_staged_changes()
 
 
-def warn_if_no_staged_files(commit_message):
-    if not check_staged_files():
+def warn_if_no_staged_files(commit_message, backend=None, has_staged=None):
+    if has_staged is None:
+        has_staged = check_staged_files(backend)
+    if not has_staged:
         click.echo(
             click.style("Warning: No staged files detected!", fg="yellow", bold=True)
         )
@@ -27,3 +67,83 @@ def warn_if_no_staged_files(commit_message):
             + f' git commit -m "{commit_message}"'
         )
         raise click.Abort()
+
+
+def verify_range(revision_range):
+    subprocess = get_subprocess_module()
+    result = subprocess.run(
+        ["git", "rev-list", "--max-count=1", revision_range, "--"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise click.ClickException(
+            result.stderr.strip() or f"Invalid revision range: {revision_range}"
+        )
+
+
+def get_git_common_dir():
+    """Return the absolute ``.git`` directory shared by all worktrees."""
+    import os
+
+    subprocess = get_subprocess_module()
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-common-dir"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr.strip() or "Not a git repository.")
+    return os.path.abspath(result.stdout.strip())
+
+
+class CatFileBatch:
+    """One long-lived ``git cat-file --batch`` process for reading many objects.
+
+    Object names are written in batches small enough to fit in the pipe buffer
+    before the answers are read back, so git never blocks on a full pipe.
+    """
+
+    BATCH_SIZE = 256
+
+    def __init__(self):
+        subprocess = get_subprocess_module()
+        self.process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.stdout.close()
+            self.process.wait()
+
+    def read_many(self, names):
+        """Yield (name, type, content) per name; missing objects have type None."""
+        names = list(names)
+        for start in range(0, len(names), self.BATCH_SIZE):
+            batch = names[start : start + self.BATCH_SIZE]
+            self.process.stdin.write("".join(f"{name}\n" for name in batch).encode())
+            self.process.stdin.flush()
+            for name in batch:
+                yield (name, *self._read_object())
+
+    def _read_object(self):
+        header = self.process.stdout.readline().split()
+        if len(header) != 3:
+            # "<name> missing" / "<name> ambiguous"
+            return None, b""
+        size = int(header[2])
+        content = self.process.stdout.read(size)
+        self.process.stdout.read(1)
+        return header[1].decode(), content
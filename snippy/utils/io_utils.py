@@ -1,20 +1,27 @@
-import asyncio
+def run_async(func, *args, **kwargs):
+    import asyncio
 
-from prompt_toolkit import prompt
-from prompt_toolkit.styles import Style
+    return asyncio.run(func(*args, **kwargs))
 
 
-def run_async(func, *args, **kwargs):
-    return asyncio.run(func(*args, **kwargs))
+_prompt_style = None
+
 
+def get_prompt_style():
+    global _prompt_style
+    if _prompt_style is None:
+        from prompt_toolkit.styles import Style
 
-promptStyle = Style.from_dict(
-    {
-        "prompt": "ansiblue bold",  # 프롬프트 텍스트 스타일
-        "input": "ansiwhite bold",  # 입력 텍스트 스타일
-    }
-)
+        _prompt_style = Style.from_dict(
+            {
+                "prompt": "ansiblue bold",  # 프롬프트 텍스트 스타일
+                "input": "ansiwhite bold",  # 입력 텍스트 스타일
+            }
+        )
+    return _prompt_style
 
 
 def get_input(prompt_message: str) -> str:
-    return prompt(prompt_message, style=promptStyle).strip()
+    from prompt_toolkit import prompt
+
+    return prompt(prompt_message, style=get_prompt_style()).strip()
@@ -0,0 +1,118 @@
+"""Commit one rendered message in many repositories at once.
+
+Each repository runs ``git diff --cached --quiet`` and then ``git commit``.
+Repositories are processed concurrently on one event loop, with at most
+``jobs`` git processes running at any time, and a failure in one repository
+never stops the others.
+"""
+
+import asyncio
+import glob
+import os
+import re
+
+COMMIT_LINE_PATTERN = re.compile(r"^\[(?:.+ )?([0-9a-f]{7,})\]", re.MULTILINE)
+
+STATUS_COMMITTED = "committed"
+STATUS_NOTHING_STAGED = "nothing staged"
+STATUS_FAILED = "failed"
+
+
+class RepoResult:
+    __slots__ = ("repo", "status", "detail")
+
+    def __init__(self, repo, status, detail=""):
+        self.repo = repo
+        self.status = status
+        self.detail = detail
+
+
+def expand_repos(patterns):
+    """Expand comma-separated paths and globs into repository paths, in order.
+
+    Globs only yield directories that contain ``.git``. Plain paths are kept
+    as given, so a mistyped one shows up as a failure in the summary.
+    """
+    repos = []
+    for pattern in patterns:
+        for item in pattern.split(","):
+            item = os.path.expanduser(item.strip())
+            if not item:
+                continue
+            if glob.has_magic(item):
+                repos.extend(
+                    path
+                    for path in sorted(glob.glob(item))
+                    if os.path.exists(os.path.join(path, ".git"))
+                )
+            else:
+                repos.append(item)
+    return list(dict.fromkeys(os.path.normpath(repo) for repo in repos))
+
+
+async def run_git(semaphore, repo, *args):
+    """Return (returncode, stdout, stderr) of ``git -C repo <args>``."""
+    async with semaphore:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "git",
+                "-C",
+                repo,
+                *args,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            return -1, "", str(e)
+        stdout, stderr = await process.communicate()
+    return process.returncode, stdout.decode(errors="replace"), stderr.decode(
+        errors="replace"
+    )
+
+
+def last_line(text):
+    lines = [line for line in text.strip().splitlines() if line.strip()]
+    return lines[-1].strip() if lines else ""
+
+
+async def commit_repo(semaphore, repo, commit_message):
+    if not os.path.isdir(repo):
+        return RepoResult(repo, STATUS_FAILED, "No such directory")
+
+    code, _, stderr = await run_git(
+        semaphore, repo, "diff", "--cached", "--quiet", "--no-ext-diff"
+    )
+    # 0: 변경 없음, 1: 변경 있음, 그 외: git 저장소가 아님 등
+    if code == 0:
+        return RepoResult(repo, STATUS_NOTHING_STAGED)
+    if code == 129:
+        # 저장소 밖에서는 git diff 가 --cached 를 모르는 옵션으로 보고 usage 를 출력
+        return RepoResult(repo, STATUS_FAILED, "Not a git repository")
+    if code != 1:
+        return RepoResult(repo, STATUS_FAILED, last_line(stderr) or f"exit {code}")
+
+    code, stdout, stderr = await run_git(
+        semaphore, repo, "commit", "-m", commit_message
+    )
+    if code != 0:
+        detail = last_line(stderr) or last_line(stdout) or f"exit {code}"
+        return RepoResult(repo, STATUS_FAILED, detail)
+    match = COMMIT_LINE_PATTERN.search(stdout)
+    return RepoResult(repo, STATUS_COMMITTED, match.group(1) if match else "")
+
+
+async def commit_repos(repos, commit_message, jobs, on_result=None):
+    """Commit in every repo and return the results in the order of ``repos``."""
+    semaphore = asyncio.Semaphore(max(jobs, 1))
+
+    async def run(repo):
+        try:
+            result = await commit_repo(semaphore, repo, commit_message)
+        except Exception as e:
+            result = RepoResult(repo, STATUS_FAILED, str(e))
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    return await asyncio.gather(*(run(repo) for repo in repos))
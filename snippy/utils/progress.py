@@ -0,0 +1,138 @@
+"""Spinner for slow steps.
+
+``with progress("Checking for updates..."):`` draws a spinner while the block
+runs and erases it when the block exits, however it exits. ``async with``
+works the same way inside coroutines.
+
+All active reporters share one ticker thread per stream. It starts with the
+first reporter and exits with the last, so concurrent threads or asyncio
+tasks draw a single line (the newest message, plus how many others are
+running) instead of fighting over it. When the stream is not a terminal,
+nothing is drawn and no thread is started.
+"""
+
+import itertools
+import os
+import sys
+import threading
+
+FRAMES = ("|", "/", "-", "\\")
+TICK_INTERVAL = 0.1
+
+_tickers = {}
+_tickers_lock = threading.Lock()
+
+
+def is_interactive(stream):
+    try:
+        return stream.isatty() and os.environ.get("TERM") != "dumb"
+    except (AttributeError, ValueError):
+        return False
+
+
+class Ticker:
+    """Redraws the newest active reporter until none is left."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.condition = threading.Condition()
+        self.active = []
+        self.thread = None
+
+    def add(self, reporter):
+        with self.condition:
+            self.active.append(reporter)
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.run, name="snippy-progress", daemon=True
+                )
+                self.thread.start()
+            else:
+                self.condition.notify()
+
+    def remove(self, reporter):
+        thread = None
+        with self.condition:
+            self.active.remove(reporter)
+            if not self.active:
+                thread, self.thread = self.thread, None
+            self.condition.notify()
+        if thread is not None:
+            # 줄을 지운 뒤에 다음 출력이 나오도록 ticker 가 끝날 때까지 기다림
+            thread.join()
+
+    def run(self):
+        frames = itertools.cycle(FRAMES)
+        current = threading.current_thread()
+        with self.condition:
+            while self.thread is current:
+                text = self.active[-1].render()
+                if len(self.active) > 1:
+                    text = f"{text} (+{len(self.active) - 1} more)"
+                self.write(f"\r{text} {next(frames)}\033[K")
+                self.condition.wait(TICK_INTERVAL)
+            self.write("\r\033[K")
+
+    def write(self, text):
+        try:
+            self.stream.write(text)
+            self.stream.flush()
+        except (OSError, ValueError):
+            pass
+
+
+def get_ticker(stream):
+    with _tickers_lock:
+        ticker = _tickers.get(id(stream))
+        if ticker is None or ticker.stream is not stream:
+            ticker = _tickers[id(stream)] = Ticker(stream)
+        return ticker
+
+
+class Progress:
+    __slots__ = ("message", "total", "done", "stream", "ticker")
+
+    def __init__(self, message, total=None, stream=None):
+        self.message = message
+        self.total = total
+        self.done = 0
+        self.stream = stream if stream is not None else sys.stdout
+        self.ticker = None
+
+    def render(self):
+        if self.total is None:
+            return self.message
+        return f"{self.message} {self.done}/{self.total}"
+
+    def update(self, message):
+        self.message = message
+
+    def advance(self, count=1):
+        self.done += count
+
+    def __enter__(self):
+        if is_interactive(self.stream):
+            self.ticker = get_ticker(self.stream)
+            self.ticker.add(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.ticker is not None:
+            self.ticker.remove(self)
+            self.ticker = None
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info):
+        return self.__exit__(*exc_info)
+
+
+def progress(message, total=None, stream=None):
+    """Return a reporter for ``message``; use it with ``with`` or ``async with``.
+
+    With ``total``, the line also shows ``done/total``; call ``advance()`` as
+    items finish.
+    """
+    return Progress(message, total, stream)
@@ -0,0 +1,23 @@
+"""SQLite caches kept next to the repository they describe.
+
+Each cache lives under ``<git common dir>/snippy/`` so every worktree of a
+repository shares it, and it goes away with the repository.
+"""
+
+import os
+import sqlite3
+
+from snippy.constants import REPO_CACHE_DIR
+from snippy.utils.git_utils import get_git_common_dir
+
+
+def open_repo_cache(name, schema, git_dir=None):
+    """Open ``<name>.sqlite3`` for the current repository and apply ``schema``."""
+    cache_dir = os.path.join(git_dir or get_git_common_dir(), REPO_CACHE_DIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    connection = sqlite3.connect(os.path.join(cache_dir, f"{name}.sqlite3"))
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA temp_store=FILE")
+    connection.executescript(schema)
+    return connection
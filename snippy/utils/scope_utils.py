@@ -0,0 +1,149 @@
+"""Infer ``<scope>`` from staged paths.
+
+The ``scopes`` config maps path patterns to scope names, in the spirit of
+CODEOWNERS: ``{"packages/api/": "api", "docs/": "docs", "*.md": "docs"}``.
+Patterns follow gitignore rules (a pattern without a slash matches at any
+depth, a directory pattern covers everything below it) and the last matching
+pattern wins.
+
+All patterns are compiled into one trie over path segments, so each staged
+path is walked once no matter how many rules there are. Paths arrive sorted
+from git, and the walk state of the current directory chain is kept on a
+stack so consecutive paths in the same directory reuse it.
+"""
+
+import re
+from fnmatch import translate
+
+# scope 가 이보다 많이 섞여 있으면 너무 넓은 변경으로 보고 비워 둠
+MAX_SCOPES = 3
+
+GLOB_CHARS = frozenset("*?[")
+
+_compiled_rules = {}
+
+
+class ScopeNode:
+    __slots__ = ("children", "globs", "any", "rule", "loop", "expanded")
+
+    def __init__(self, loop=False):
+        self.children = {}
+        self.globs = {}
+        self.any = None
+        self.rule = -1
+        # "**" 노드는 경로 조각을 몇 개든 소비하며 자기 자신에 머묾
+        self.loop = loop
+        # 이 노드와 "**" 로 바로 갈 수 있는 노드들, 처음 쓸 때 계산
+        self.expanded = None
+
+
+class ScopeMatcher:
+    def __init__(self, rules):
+        self.scopes = []
+        self.root = ScopeNode()
+        for rule_id, (pattern, scope) in enumerate(rules):
+            self.scopes.append(scope)
+            self.add(pattern, rule_id)
+
+    def add(self, pattern, rule_id):
+        pattern = pattern.strip()
+        anchored = pattern.startswith("/") or "/" in pattern.strip("/")
+        segments = [segment for segment in pattern.strip("/").split("/") if segment]
+        if not segments:
+            return
+        if not anchored:
+            segments.insert(0, "**")
+
+        node = self.root
+        for segment in segments:
+            if segment == "**":
+                if node.any is None:
+                    node.any = ScopeNode(loop=True)
+                node = node.any
+            elif GLOB_CHARS.isdisjoint(segment):
+                node = node.children.setdefault(segment, ScopeNode())
+            else:
+                if segment not in node.globs:
+                    regex = re.compile(translate(segment))
+                    node.globs[segment] = (regex, ScopeNode())
+                node = node.globs[segment][1]
+        node.rule = max(node.rule, rule_id)
+
+    @staticmethod
+    def expand(node):
+        if node.expanded is None:
+            expanded = [node]
+            while expanded[-1].any is not None and expanded[-1].any not in expanded:
+                expanded.append(expanded[-1].any)
+            node.expanded = tuple(expanded)
+        return node.expanded
+
+    def step(self, states, best, segment):
+        next_states = []
+        for node in states:
+            if node.loop:
+                next_states.append(node)
+            child = node.children.get(segment)
+            if child is not None:
+                next_states.extend(self.expand(child))
+            for regex, child in node.globs.values():
+                if regex.match(segment):
+                    next_states.extend(self.expand(child))
+        if len(next_states) > 1:
+            next_states = tuple(dict.fromkeys(next_states))
+        for node in next_states:
+            if node.rule > best:
+                best = node.rule
+        return next_states, best
+
+    def scan(self, paths):
+        """Return ({scope: path count}, number of paths) for an iterable of paths."""
+        counts = {}
+        total = 0
+        # stack[i] = (segment, states, best) after consuming the first i+1 segments
+        stack = []
+        root_states = self.expand(self.root)
+        for path in paths:
+            total += 1
+            segments = path.split("/")
+            depth = 0
+            while (
+                depth < len(stack)
+                and depth < len(segments) - 1
+                and stack[depth][0] == segments[depth]
+            ):
+                depth += 1
+            del stack[depth:]
+
+            states, best = (stack[-1][1], stack[-1][2]) if stack else (root_states, -1)
+            for index in range(depth, len(segments)):
+                states, best = self.step(states, best, segments[index])
+                if index < len(segments) - 1:
+                    stack.append((segments[index], states, best))
+            if best >= 0:
+                scope = self.scopes[best]
+                counts[scope] = counts.get(scope, 0) + 1
+        return counts, total
+
+
+def get_scope_matcher(rules):
+    if isinstance(rules, dict):
+        rules = list(rules.items())
+    key = tuple(tuple(rule) for rule in rules)
+    matcher = _compiled_rules.get(key)
+    if matcher is None:
+        matcher = _compiled_rules[key] = ScopeMatcher(key)
+    return matcher
+
+
+def choose_scope(counts):
+    if not counts or len(counts) > MAX_SCOPES:
+        return ""
+    ordered = sorted(counts, key=lambda scope: (-counts[scope], scope))
+    return ",".join(scope for scope in ordered if scope)
+
+
+def infer_scope(rules, paths):
+    """Return (scope, number of paths) for ``paths`` under the ``scopes`` rules."""
+    counts, total = get_scope_matcher(rules).scan(paths)
+    return choose_scope(counts), total
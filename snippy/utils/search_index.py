@@ -0,0 +1,195 @@
+"""Precomputed search over picker entries.
+
+``build_search_index`` turns the entry names into a trigram index made only of
+dicts, lists and strings so it can be stored in the marshal config snapshot.
+``SearchSession`` answers the queries typed into the picker, narrowing the
+previous keystroke's result set whenever the query only grew.
+"""
+
+import re
+
+NGRAM = 3
+
+# 결과가 많을 때 화면에 보일 만한 앞부분만 강조 표시 위치를 계산
+HIGHLIGHT_LIMIT = 200
+
+WORD_BOUNDARIES = frozenset(" _-/:().,[]")
+
+
+def build_search_index(names):
+    texts = [name.lower() for name in names]
+    grams = {}
+    # lower() 는 "İ" -> "i̇" 처럼 길이를 바꿀 수 있음, 그런 이름만 소문자 위치 -> 원래 위치 표를 둠
+    offsets = {}
+    for entry_id, text in enumerate(texts):
+        for gram in {text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1)}:
+            grams.setdefault(gram, []).append(entry_id)
+        name = names[entry_id]
+        if len(text) != len(name):
+            offsets[entry_id] = [
+                position for position, char in enumerate(name) for _ in char.lower()
+            ]
+    return {"texts": texts, "grams": grams, "offsets": offsets}
+
+
+def compile_subsequence(query):
+    # 각 글자를 group 으로 잡아 강조 위치를 바로 얻음, 글자 사이는 최소 매칭
+    return re.compile(".*?".join(f"({re.escape(char)})" for char in query))
+
+
+class SearchSession:
+    """Incremental filtering over one index, kept for the life of a prompt."""
+
+    def __init__(self, index, order=None):
+        self.texts = index["texts"]
+        self.grams = index["grams"]
+        self.offsets = index.get("offsets", {})
+        self.all_ids = range(len(self.texts))
+        # order: 화면에 보이는 순서의 entry id 목록, 순위가 같으면 이 순서를 따름
+        self.order = list(self.all_ids) if order is None else list(order)
+        self.position = [0] * len(self.order)
+        for position, entry_id in enumerate(self.order):
+            self.position[entry_id] = position
+        # (query, ids) of the last substring and subsequence searches
+        self.last_substring = ("", None)
+        self.last_subsequence = ("", None)
+
+    def candidates_for(self, term):
+        # term 의 모든 trigram 이 들어 있는 항목만 후보로 (짧은 term 은 전체)
+        if len(term) < NGRAM:
+            return None
+        postings = []
+        for i in range(len(term) - NGRAM + 1):
+            posting = self.grams.get(term[i : i + NGRAM])
+            if posting is None:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return sorted(candidates)
+
+    def narrow(self, last, query):
+        last_query, last_ids = last
+        if last_ids is not None and last_query and query.startswith(last_query):
+            return last_ids
+        return None
+
+    def substring_ids(self, query, terms):
+        ids = self.narrow(self.last_substring, query)
+        if ids is None:
+            ids = self.all_ids
+            for term in terms:
+                candidates = self.candidates_for(term)
+                if candidates is not None:
+                    ids = candidates
+                    break
+        texts = self.texts
+        for term in terms:
+            ids = [i for i in ids if term in texts[i]]
+        self.last_substring = (query, ids)
+        return ids
+
+    def subsequence_ids(self, query, pattern):
+        ids = self.narrow(self.last_subsequence, query)
+        if ids is None:
+            ids = self.all_ids
+        texts = self.texts
+        search = pattern.search
+        ids = [i for i in ids if search(texts[i])]
+        self.last_subsequence = (query, ids)
+        return ids
+
+    def rank_substring(self, ids, term):
+        # 이름 맨 앞 > 단어 시작 > 중간 순, 같으면 앞쪽에서 찾은 것과 짧은 이름 우선.
+        # tuple 대신 하나의 정수로 묶어 정렬해야 수천 건에서도 빠름
+        texts = self.texts
+        position_of = self.position
+        keys = []
+        for entry_id in ids:
+            text = texts[entry_id]
+            position = text.find(term)
+            if position == 0:
+                tier = 0
+            elif text[position - 1] in WORD_BOUNDARIES:
+                tier = 1
+            else:
+                tier = 2
+            keys.append(
+                (((tier << 12 | min(position, 0xFFF)) << 12 | min(len(text), 0xFFF)) << 24)
+                | position_of[entry_id]
+            )
+        keys.sort()
+        order = self.order
+        return [order[key & 0xFFFFFF] for key in keys]
+
+    def to_original(self, entry_id, indices):
+        """Map positions in the lowercased text back to the entry's name."""
+        offsets = self.offsets.get(entry_id)
+        if offsets is None:
+            return indices
+        return sorted({offsets[index] for index in indices})
+
+    def highlight_substring(self, entry_id, terms):
+        text = self.texts[entry_id]
+        indices = set()
+        for term in terms:
+            position = text.find(term)
+            indices.update(range(position, position + len(term)))
+        return self.to_original(entry_id, sorted(indices))
+
+    def search(self, query):
+        """Return ranked ``[(entry_id, highlight_indices), ...]``, or None for an empty query.
+
+        Entries containing every whitespace-separated term come first; when
+        there are none, entries containing the query's characters in order
+        are returned instead.
+        """
+        query = query.lower()
+        terms = query.split()
+        if not terms:
+            return None
+
+        ids = self.substring_ids(query, terms)
+        if ids:
+            ids = self.rank_substring(ids, terms[0])
+            return [
+                (
+                    entry_id,
+                    self.highlight_substring(entry_id, terms)
+                    if rank < HIGHLIGHT_LIMIT
+                    else [],
+                )
+                for rank, entry_id in enumerate(ids)
+            ]
+
+        pattern = compile_subsequence("".join(terms))
+        ids = self.subsequence_ids(query, pattern)
+        texts = self.texts
+        ranked = []
+        for entry_id in ids:
+            match = pattern.search(texts[entry_id])
+            ranked.append(
+                (
+                    match.end() - match.start(),
+                    len(texts[entry_id]),
+                    self.position[entry_id],
+                    entry_id,
+                    match,
+                )
+            )
+        ranked.sort(key=lambda entry: entry[:3])
+        return [
+            (
+                entry_id,
+                self.to_original(
+                    entry_id, [match.start(g) for g in range(1, match.re.groups + 1)]
+                )
+                if rank < HIGHLIGHT_LIMIT
+                else [],
+            )
+            for rank, (_, _, _, entry_id, match) in enumerate(ranked)
+        ]
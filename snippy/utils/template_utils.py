@@ -0,0 +1,272 @@
+import re
+
+from snippy.utils.config_schema import get_type_name
+
+PLACEHOLDERS = ("<type>", "<emoji>", "<subject>", "<scope>")
+PLACEHOLDER_PATTERN = re.compile(r"(<type>|<emoji>|<subject>|<scope>)")
+
+# scope 가 비었을 때 함께 지우는 괄호, e.g. "<type>(<scope>): " -> "<type>: "
+SCOPE_BRACKETS = {"(": ")", "[": "]", "{": "}"}
+
+# --no-type / --no-emoji 로 뺄 수 있는 placeholder, 바로 뒤의 구분자(": ", " ")도 함께 빠짐
+OPTIONAL_PLACEHOLDERS = ("<type>", "<emoji>")
+SEPARATOR_PATTERN = re.compile(r"\s*[^\w\s<>()\[\]{}]*\s*")
+
+EXAMPLE_SUBJECT = "This is example comment."
+
+_compiled_templates = {}
+
+
+def tokenize_template(template):
+    return tuple(token for token in PLACEHOLDER_PATTERN.split(template) if token)
+
+
+class CompiledTemplate:
+    """A commit template split into literal and placeholder tokens.
+
+    Rendering is a single ``str.format`` call, so every placeholder is filled
+    in one pass regardless of how many times it appears in the template.
+    ``render(type, emoji, subject, scope)`` takes its arguments positionally;
+    for templates without ``<scope>`` it is the bound ``str.format`` itself.
+    """
+
+    __slots__ = (
+        "source",
+        "tokens",
+        "placeholders",
+        "_format",
+        "_format_without_scope",
+        "_matchers",
+        "render",
+    )
+
+    def __init__(self, source, tokens=None):
+        self.source = source
+        self.tokens = tuple(tokens) if tokens is not None else tokenize_template(source)
+        self.placeholders = frozenset(
+            token for token in self.tokens if token in PLACEHOLDERS
+        )
+        self._format = self._build_format(self.tokens).format
+        self._format_without_scope = self._build_format(
+            _strip_scope(self.tokens)
+        ).format
+        self._matchers = {}
+        # render 는 한 번만 정해 두고 호출마다 scope 를 확인하지 않음, scope 가 없는
+        # 템플릿이면 str.format 을 바로 호출 (남는 인자는 format 이 무시함)
+        if "<scope>" in self.placeholders:
+            self.render = self._render_with_scope
+        else:
+            self.render = self._format
+
+    @staticmethod
+    def _build_format(tokens):
+        fields = []
+        for token in tokens:
+            if token in PLACEHOLDERS:
+                fields.append("{%d}" % PLACEHOLDERS.index(token))
+            else:
+                fields.append(token.replace("{", "{{").replace("}", "}}"))
+        return "".join(fields)
+
+    def _render_with_scope(self, type="", emoji="", subject="", scope=""):
+        if scope:
+            return self._format(type, emoji, subject, scope)
+        return self._format_without_scope(type, emoji, subject, scope)
+
+    def without(self, *placeholders):
+        """Return this template without ``placeholders`` and the separators after them.
+
+        ``"<type>: <emoji> <subject>".without("<type>")`` renders like
+        ``"<emoji> <subject>"``, instead of leaving ``": "`` in front.
+        """
+        dropped = self.placeholders.intersection(placeholders)
+        if not dropped:
+            return self
+        tokens = []
+        drop_separator = False
+        for token in self.tokens:
+            if token in dropped:
+                drop_separator = True
+                continue
+            if drop_separator and token not in PLACEHOLDERS:
+                token = token[SEPARATOR_PATTERN.match(token).end() :]
+            drop_separator = False
+            if token:
+                tokens.append(token)
+        return compile_template("".join(tokens), tokens)
+
+    def validate(self, include_type=True, include_emoji=True):
+        errors = []
+        if "<subject>" not in self.placeholders:
+            errors.append("Template must include <subject>.")
+        if include_emoji and "<emoji>" not in self.placeholders:
+            errors.append("<emoji> must be included when emoji is enabled.")
+        if include_type and "<type>" not in self.placeholders:
+            errors.append("<type> must be included when type is enabled.")
+        return errors
+
+    def matcher(self, types=None, emojis=None):
+        """Return a regex that parses a rendered subject line back into its parts.
+
+        ``types``/``emojis`` restrict the groups to known values; when omitted the
+        groups match any non-space text. When the template has both ``<type>``
+        and ``<emoji>``, either one may be left out together with its
+        separator, as ``without`` renders it, but not both.
+        """
+        cache_key = (
+            tuple(types) if types is not None else None,
+            tuple(emojis) if emojis is not None else None,
+        )
+        pattern = self._matchers.get(cache_key)
+        if pattern is None:
+            pattern = self._matchers[cache_key] = re.compile(
+                self._matcher_source(*cache_key)
+            )
+        return pattern
+
+    def _matcher_source(self, types, emojis):
+        group_patterns = {
+            "<type>": _alternation(types, r"[^\s:()]+"),
+            "<emoji>": _alternation(emojis, r"\S*"),
+            "<subject>": r".+",
+            "<scope>": r"[^()\[\]{}]*",
+        }
+        optional = set()
+        if all(self.tokens.count(token) == 1 for token in OPTIONAL_PLACEHOLDERS):
+            optional.update(OPTIONAL_PLACEHOLDERS)
+        seen = set()
+        parts = ["^"]
+        # 생략할 수 있는 group 은 뒤따르는 구분자와 묶은 뒤에 추가
+        pending = None
+        for token in _group_scope(self.tokens):
+            if pending is not None:
+                separator = ""
+                if isinstance(token, str) and token not in PLACEHOLDERS:
+                    separator = token[: SEPARATOR_PATTERN.match(token).end()]
+                    token = token[len(separator) :]
+                parts.append(f"(?:{pending}{re.escape(separator)})?")
+                pending = None
+                if not token:
+                    continue
+            if isinstance(token, tuple):
+                # 괄호로 감싼 scope 는 괄호째로 생략될 수 있음
+                open_bracket, close_bracket = token
+                if "<scope>" in seen:
+                    scope = "(?P=scope)"
+                else:
+                    seen.add("<scope>")
+                    scope = f"(?P<scope>[^{re.escape(open_bracket + close_bracket)}]+)"
+                parts.append(
+                    f"(?:{re.escape(open_bracket)}{scope}{re.escape(close_bracket)})?"
+                )
+                continue
+            if token not in PLACEHOLDERS:
+                parts.append(re.escape(token))
+                continue
+            name = token[1:-1]
+            if token in seen:
+                parts.append(f"(?P={name})")
+            elif token in optional:
+                seen.add(token)
+                pending = f"(?P<{name}>{group_patterns[token]})"
+            else:
+                seen.add(token)
+                parts.append(f"(?P<{name}>{group_patterns[token]})")
+        if pending is not None:
+            parts.append(f"(?:{pending})?")
+        if optional:
+            # type 과 emoji 가 둘 다 빠진 subject 는 받지 않음
+            parts.append("(?(type)|(?(emoji)|(?!)))")
+        parts.append("$")
+        return "".join(parts)
+
+
+def _group_scope(tokens):
+    """Yield tokens with each bracketed ``<scope>`` as one (open, close) tuple."""
+    tokens = list(tokens)
+    for i, token in enumerate(tokens):
+        if token != "<scope>" or not 0 < i < len(tokens) - 1:
+            continue
+        before, after = tokens[i - 1], tokens[i + 1]
+        if (
+            before not in PLACEHOLDERS
+            and after not in PLACEHOLDERS
+            and before[-1:] in SCOPE_BRACKETS
+            and after[:1] == SCOPE_BRACKETS[before[-1]]
+        ):
+            tokens[i - 1] = before[:-1]
+            tokens[i] = (before[-1], after[0])
+            tokens[i + 1] = after[1:]
+    return [token for token in tokens if token]
+
+
+def _strip_scope(tokens):
+    stripped = [
+        token
+        for token in _group_scope(tokens)
+        if not isinstance(token, tuple) and token != "<scope>"
+    ]
+    # "[<scope>] <subject>" 처럼 scope 로 시작하면 남은 앞 공백도 지움
+    if stripped and stripped[0] not in PLACEHOLDERS:
+        stripped[0] = stripped[0].lstrip()
+    return [token for token in stripped if token]
+
+
+def _alternation(values, fallback):
+    if values is None:
+        return fallback
+    # 긴 값을 먼저 시도해야 접두사가 겹치는 타입(fix / fixup)이 올바르게 매칭됨
+    ordered = sorted(set(values), key=len, reverse=True)
+    if not ordered:
+        return ""
+    return "|".join(re.escape(value) for value in ordered)
+
+
+def compile_template(source, tokens=None):
+    compiled = _compiled_templates.get(source)
+    if compiled is None:
+        compiled = _compiled_templates[source] = CompiledTemplate(source, tokens)
+    return compiled
+
+
+def render_example(template, commit_types, include_type=True, include_emoji=True):
+    commit_type, emoji = "", ""
+    if commit_types:
+        first_type, first_data = next(iter(commit_types.items()))
+        commit_type = get_type_name(first_type) if include_type else ""
+        emoji = first_data.emoji if include_emoji else ""
+    return compile_template(template).render(commit_type, emoji, EXAMPLE_SUBJECT)
+
+
+def build_type_classifier(config, template):
+    """Return a function mapping a parsed (type, emoji) to its config key, or None.
+
+    Only the placeholders the template has and the config renders take part.
+    An exact (type, emoji) pair wins, then the type alone, then the emoji
+    alone, so ``feat: 🐛 ...`` still counts as feat. The first commit type
+    wins when several share a key.
+    """
+    use_type = "<type>" in template.placeholders and config.include_type
+    use_emoji = "<emoji>" in template.placeholders and config.include_emoji
+    keys = {}
+    for commit_type, commit_data in config.commit_types.items():
+        type_name = get_type_name(commit_type) if use_type else None
+        emoji = commit_data.emoji if use_emoji else None
+        if type_name is None and emoji is None:
+            continue
+        keys.setdefault((type_name, emoji), commit_type)
+        if type_name is not None:
+            keys.setdefault((type_name, None), commit_type)
+        if emoji is not None:
+            keys.setdefault((None, emoji), commit_type)
+
+    def classify(commit_type, emoji):
+        commit_type = commit_type if use_type else None
+        emoji = emoji if use_emoji else None
+        return (
+            keys.get((commit_type, emoji))
+            or keys.get((commit_type, None))
+            or keys.get((None, emoji))
+        )
+
+    return classify
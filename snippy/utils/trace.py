@@ -0,0 +1,197 @@
+"""Named timing spans for finding out where an invocation spends its time.
+
+``with span("load config"):`` records how long the block took. Tracing is off
+unless ``snippy --profile ...`` or ``SNIPPY_TRACE`` turns it on, and while it
+is off ``span()`` returns one shared object whose ``__enter__``/``__exit__``
+do nothing, so the spans can stay in the hot path.
+
+``SNIPPY_TRACE=1`` (or ``--profile``) prints a summary to stderr when the
+process exits. Any other value is used as a path, and a Chrome trace-event
+JSON file is written there instead (open it in ``chrome://tracing`` or
+https://ui.perfetto.dev).
+
+Only ``os`` and ``time`` are imported so the client can use it before click.
+"""
+
+import os
+import time
+from _thread import get_ident
+
+TRACE_ENV = "SNIPPY_TRACE"
+PROFILE_FLAG = "--profile"
+TEXT_OUTPUTS = ("1", "true", "yes", "text", "-")
+
+
+class NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Span:
+    __slots__ = ("recorder", "name", "args", "start", "depth")
+
+    def __init__(self, recorder, name, args):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.depth = self.recorder.push()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = time.perf_counter()
+        self.recorder.pop()
+        self.recorder.events.append(
+            (self.name, self.start, end, self.depth, get_ident(), self.args)
+        )
+        return False
+
+
+class Recorder:
+    def __init__(self, output):
+        self.output = output
+        self.started = time.perf_counter()
+        self.ident = get_ident()
+        self.events = []
+        self.depths = {}
+
+    def push(self):
+        ident = get_ident()
+        depth = self.depths.get(ident, 0)
+        self.depths[ident] = depth + 1
+        return depth
+
+    def pop(self):
+        ident = get_ident()
+        self.depths[ident] -= 1
+
+    def write(self):
+        end = time.perf_counter()
+        if self.output is None:
+            write_summary(self.events, self.started, end, self.ident)
+            return
+        try:
+            write_chrome_trace(self.events, self.started, self.output)
+        except OSError as e:
+            import sys
+
+            print(
+                f"snippy: could not write trace to {self.output}: {e}",
+                file=sys.stderr,
+            )
+
+
+_recorder = None
+
+
+def span(name, **args):
+    """Return a context manager that records ``name`` while tracing is on."""
+    if _recorder is None:
+        return NULL_SPAN
+    return Span(_recorder, name, args)
+
+
+def is_tracing():
+    return _recorder is not None
+
+
+def wants_profile(argv):
+    """Return whether ``--profile`` is given before the subcommand in ``argv``."""
+    tokens = iter(argv)
+    for token in tokens:
+        if token == PROFILE_FLAG:
+            return True
+        if token in ("-m", "--message", "-t", "--type"):
+            next(tokens, None)
+        elif token == "--" or not token.startswith("-"):
+            return False
+    return False
+
+
+def start_tracing(output=None):
+    """Start recording spans. ``output`` is a Chrome trace path, or None for text."""
+    global _recorder
+    if _recorder is not None:
+        return
+    _recorder = Recorder(output)
+
+    import atexit
+
+    atexit.register(finish_tracing)
+
+
+def start_tracing_from(argv, environ=os.environ):
+    """Start tracing if ``argv`` or ``environ`` asks for it."""
+    value = environ.get(TRACE_ENV, "").strip()
+    if value and value.lower() not in ("0", "false", "no"):
+        start_tracing(None if value.lower() in TEXT_OUTPUTS else value)
+    elif wants_profile(argv):
+        start_tracing()
+
+
+def finish_tracing():
+    """Write the trace, if one is being recorded, and stop recording."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.write()
+
+
+def reset_tracing():
+    """Drop the current trace without writing it (used after fork)."""
+    global _recorder
+    _recorder = None
+
+
+def write_summary(events, started, end, main_thread, stream=None):
+    import sys
+
+    stream = stream or sys.stderr
+    lines = [f"snippy trace: {(end - started) * 1e3:.1f}ms total"]
+    for name, start, stop, depth, ident, args in sorted(
+        events, key=lambda event: (event[1], event[3])
+    ):
+        label = name
+        if args:
+            label += " (" + ", ".join(f"{k}={v}" for k, v in args.items()) + ")"
+        if ident != main_thread:
+            label += " [thread]"
+        offset = (start - started) * 1e3
+        lines.append(
+            f"{(stop - start) * 1e3:9.1f}ms  @{offset:8.1f}ms  {'  ' * depth}{label}"
+        )
+    try:
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+    except (OSError, ValueError):
+        pass
+
+
+def write_chrome_trace(events, started, path):
+    import json
+
+    pid = os.getpid()
+    trace_events = [
+        {
+            "name": name,
+            "ph": "X",
+            "ts": round((start - started) * 1e6, 1),
+            "dur": round((stop - start) * 1e6, 1),
+            "pid": pid,
+            "tid": ident,
+            "args": {key: str(value) for key, value in args.items()},
+        }
+        for name, start, stop, _, ident, args in events
+    ]
+    with open(os.path.expanduser(path), "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+import time
+
+from snippy.constants import (
+    BASE_DIR,
+    LATEST_VERSION_PATH,
+    UPDATE_CHECK_LOCK_PATH,
+    UPDATE_CHECK_LOCK_TIMEOUT,
+    UPDATE_CHECK_TTL_HOURS,
+)
+from snippy.utils.version_utils import get_distribution_signature
+
+
+def load_update_state():
+    try:
+        with open(LATEST_VERSION_PATH, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_update_state(latest_version, installed_version, update_available):
+    os.makedirs(BASE_DIR, exist_ok=True)
+    temp_path = f"{LATEST_VERSION_PATH}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(
+            {
+                "latest_version": latest_version,
+                "installed_version": installed_version,
+                "update_available": update_available,
+                "signature": get_distribution_signature(),
+                "checked_at": time.time(),
+            },
+            f,
+        )
+    os.replace(temp_path, LATEST_VERSION_PATH)
+
+
+def is_update_check_due(ttl_hours=UPDATE_CHECK_TTL_HOURS):
+    if not ttl_hours or ttl_hours <= 0:
+        return False
+    try:
+        checked_at = os.path.getmtime(LATEST_VERSION_PATH)
+    except FileNotFoundError:
+        return True
+    return time.time() - checked_at > ttl_hours * 3600
+
+
+def acquire_update_lock():
+    os.makedirs(BASE_DIR, exist_ok=True)
+    for _ in range(2):
+        try:
+            fd = os.open(
+                UPDATE_CHECK_LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644
+            )
+        except FileExistsError:
+            try:
+                age = time.time() - os.path.getmtime(UPDATE_CHECK_LOCK_PATH)
+            except FileNotFoundError:
+                continue
+            if age < UPDATE_CHECK_LOCK_TIMEOUT:
+                return False
+            # 이전 갱신 프로세스가 비정상 종료한 경우 오래된 lock 을 정리
+            try:
+                os.unlink(UPDATE_CHECK_LOCK_PATH)
+            except FileNotFoundError:
+                pass
+            continue
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+        return True
+    return False
+
+
+def release_update_lock():
+    try:
+        os.unlink(UPDATE_CHECK_LOCK_PATH)
+    except FileNotFoundError:
+        pass
+
+
+def schedule_update_check(ttl_hours=UPDATE_CHECK_TTL_HOURS):
+    """Start a detached refresh when the cached result is older than ``ttl_hours``.
+
+    Returns immediately; the refresh runs in its own session so it never blocks
+    or outlives the command's terminal. The lockfile keeps concurrent runs from
+    refreshing twice.
+    """
+    if not is_update_check_due(ttl_hours) or not acquire_update_lock():
+        return False
+
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "snippy.commands.update", "--refresh"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+    except OSError:
+        release_update_lock()
+        return False
+    return True
+
+
+def get_update_notice():
+    """Return (installed, latest) from the last refresh if a newer version exists."""
+    state = load_update_state()
+    if not state.get("update_available"):
+        return None
+    # 그 사이 업데이트했다면 설치 경로가 바뀌므로 알림을 보여주지 않음
+    if state.get("signature") != get_distribution_signature():
+        return None
+    return state.get("installed_version"), state.get("latest_version")
@@ -0,0 +1,142 @@
+"""Frecency of selected commit types.
+
+Every selection is appended to ``usage.log`` as a fixed 8-byte record
+(crc32 of the type key, unix time). Scores live in a small marshal summary
+together with the log offset they cover, so reading only folds in the records
+appended since the last summary, never the whole history.
+
+A score is ``log2(sum(2 ** (t / half_life)))`` over a type's selections. All
+types decay at the same rate, so ordering by this value is ordering by the
+current exponentially-decayed frecency without knowing the current time.
+"""
+
+import marshal
+import math
+import os
+import struct
+import time
+import zlib
+
+from snippy.constants import (
+    BASE_DIR,
+    USAGE_HALF_LIFE,
+    USAGE_LOG_MAX_RECORDS,
+    USAGE_LOG_PATH,
+    USAGE_SCORES_PATH,
+)
+
+RECORD = struct.Struct("<II")
+
+# 압축 후 log 에 남겨 두는 최근 기록 수
+USAGE_LOG_KEEP_RECORDS = 256
+
+
+def type_id(commit_type):
+    return zlib.crc32(commit_type.encode())
+
+
+def add_score(score, value):
+    if score is None:
+        return value
+    high, low = max(score, value), min(score, value)
+    return high + math.log2(1 + 2 ** (low - high))
+
+
+def read_summary(path=USAGE_SCORES_PATH):
+    try:
+        with open(path, "rb") as file:
+            summary = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return summary if isinstance(summary, dict) else None
+
+
+def write_summary(summary, path=USAGE_SCORES_PATH):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            marshal.dump(summary, file)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def fold_records(scores, data, half_life=USAGE_HALF_LIFE):
+    for type_key, timestamp in RECORD.iter_unpack(data):
+        scores[type_key] = add_score(scores.get(type_key), timestamp / half_life)
+
+
+def load_scores(log_path=USAGE_LOG_PATH, scores_path=USAGE_SCORES_PATH):
+    """Return ``(scores, summary)`` where scores maps type ids to frecency."""
+    try:
+        log_stat = os.stat(log_path)
+    except FileNotFoundError:
+        return {}, None
+
+    summary = read_summary(scores_path)
+    if (
+        summary is None
+        or summary.get("inode") != log_stat.st_ino
+        or summary.get("offset", 0) > log_stat.st_size
+    ):
+        # 요약이 없거나 다른 log 의 요약이면 log 전체로 다시 계산
+        summary = {"inode": log_stat.st_ino, "offset": 0, "scores": {}}
+
+    scores = dict(summary["scores"])
+    offset = summary["offset"]
+    end = log_stat.st_size - (log_stat.st_size - offset) % RECORD.size
+    if end > offset:
+        with open(log_path, "rb") as file:
+            file.seek(offset)
+            fold_records(scores, file.read(end - offset))
+    summary = {"inode": log_stat.st_ino, "offset": end, "scores": scores}
+    return scores, summary
+
+
+def compact_log(summary, log_path=USAGE_LOG_PATH):
+    # 점수는 요약에 모두 반영되어 있으므로 최근 기록만 남긴 새 log 로 교체
+    keep = USAGE_LOG_KEEP_RECORDS * RECORD.size
+    with open(log_path, "rb") as file:
+        file.seek(max(summary["offset"] - keep, 0))
+        tail = file.read(min(summary["offset"], keep))
+    temp_path = f"{log_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(tail)
+    os.replace(temp_path, log_path)
+    return {
+        "inode": os.stat(log_path).st_ino,
+        "offset": len(tail),
+        "scores": summary["scores"],
+    }
+
+
+def record_usage(commit_type, log_path=USAGE_LOG_PATH, scores_path=USAGE_SCORES_PATH):
+    """Append one selection of ``commit_type`` and bring the summary up to date."""
+    os.makedirs(BASE_DIR, exist_ok=True)
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, RECORD.pack(type_id(commit_type), int(time.time())))
+    finally:
+        os.close(fd)
+
+    _, summary = load_scores(log_path, scores_path)
+    if summary["offset"] > USAGE_LOG_MAX_RECORDS * RECORD.size:
+        summary = compact_log(summary, log_path)
+    write_summary(summary, scores_path)
+
+
+def frecency_order(commit_types, scores=None):
+    """Return indices of ``commit_types`` ordered by frecency, unused types last."""
+    if scores is None:
+        scores, _ = load_scores()
+    if not scores:
+        return list(range(len(commit_types)))
+    ranked = [scores.get(type_id(commit_type)) for commit_type in commit_types]
+    # 사용한 적 없는 타입은 설정 순서 그대로 뒤에 둠
+    return sorted(
+        range(len(commit_types)),
+        key=lambda i: (ranked[i] is None, -(ranked[i] or 0.0)),
+    )
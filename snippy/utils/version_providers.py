@@ -0,0 +1,173 @@
+"""Installed/latest version discovery for ``snippy update``.
+
+Each provider answers two questions, ``installed()`` and ``latest()``, and
+returns None when it cannot tell. All queries are started together with
+``asyncio.gather`` so the total wait is about as long as the slowest one.
+"""
+
+import asyncio
+import json
+import os
+import time
+
+from snippy.constants import BASE_DIR, BREW_UPDATE_STAMP_PATH, BREW_UPDATE_TTL
+from snippy.utils.version_utils import DISTRIBUTION_NAME, get_metadata_version
+
+VERSION_MANIFEST_ENV = "SNIPPY_VERSION_MANIFEST"
+
+
+async def run_command(*args):
+    """Run a command and return its stdout, or None if it failed or is missing."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    stdout, _ = await process.communicate()
+    if process.returncode != 0:
+        return None
+    return stdout.decode()
+
+
+class VersionProvider:
+    name = "base"
+
+    async def installed(self):
+        return None
+
+    async def latest(self):
+        return None
+
+
+class BrewProvider(VersionProvider):
+    name = "brew"
+
+    def __init__(self, formula=DISTRIBUTION_NAME, update_formulae=False):
+        self.formula = formula
+        self.update_formulae = update_formulae
+
+    async def installed(self):
+        output = await run_command("brew", "list", "--versions", self.formula)
+        if not output or len(output.split()) < 2:
+            return None
+        return output.split()[1]
+
+    async def latest(self):
+        # brew info 는 갱신된 formula 정보를 읽어야 하므로 brew update 뒤에 실행
+        if self.update_formulae and is_formula_metadata_stale():
+            if await run_command("brew", "update") is not None:
+                touch_brew_update_stamp()
+        output = await run_command("brew", "info", "--json=v2", self.formula)
+        if not output:
+            return None
+        try:
+            return json.loads(output)["formulae"][0]["versions"]["stable"]
+        except (ValueError, KeyError, IndexError):
+            return None
+
+
+class MetadataProvider(VersionProvider):
+    """The version pip/poetry recorded in the installed distribution's metadata."""
+
+    name = "metadata"
+
+    async def installed(self):
+        return get_metadata_version()
+
+
+class ManifestProvider(VersionProvider):
+    """Reads ``{"installed": ..., "latest": ...}`` from a local JSON file.
+
+    Used instead of brew when SNIPPY_VERSION_MANIFEST points at a file, so the
+    update flow can be exercised without Homebrew or network access.
+    """
+
+    name = "manifest"
+
+    def __init__(self, path):
+        self.path = path
+
+    def read(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    async def installed(self):
+        return self.read().get("installed")
+
+    async def latest(self):
+        return self.read().get("latest")
+
+
+def get_version_providers(update_formulae=False):
+    manifest_path = os.environ.get(VERSION_MANIFEST_ENV)
+    if manifest_path:
+        return [ManifestProvider(manifest_path)]
+    return [BrewProvider(update_formulae=update_formulae), MetadataProvider()]
+
+
+def is_formula_metadata_stale():
+    try:
+        updated_at = os.path.getmtime(BREW_UPDATE_STAMP_PATH)
+    except FileNotFoundError:
+        return True
+    return time.time() - updated_at > BREW_UPDATE_TTL
+
+
+def touch_brew_update_stamp():
+    os.makedirs(BASE_DIR, exist_ok=True)
+    with open(BREW_UPDATE_STAMP_PATH, "w"):
+        pass
+
+
+def parse_version(version):
+    from packaging.version import InvalidVersion, Version
+
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
+def is_newer_version(latest_version, installed_version):
+    if latest_version is None or installed_version is None:
+        return False
+    latest, installed = parse_version(latest_version), parse_version(installed_version)
+    if latest is None or installed is None:
+        return latest_version != installed_version
+    return latest > installed
+
+
+def pick_latest(versions):
+    # 여러 provider 가 답하면 packaging 기준으로 가장 높은 버전을 사용
+    best = None
+    for version in versions:
+        if version is not None and (best is None or is_newer_version(version, best)):
+            best = version
+    return best
+
+
+async def resolve_versions(providers):
+    """Return (installed, latest) gathered concurrently from ``providers``.
+
+    The installed version comes from the first provider (in order) that knows
+    it; the latest version is the highest one reported by any provider.
+    """
+    results = await asyncio.gather(
+        *(provider.installed() for provider in providers),
+        *(provider.latest() for provider in providers),
+        return_exceptions=True,
+    )
+    results = [None if isinstance(r, Exception) else r for r in results]
+    installed_versions, latest_versions = (
+        results[: len(providers)],
+        results[len(providers) :],
+    )
+    installed = next((v for v in installed_versions if v), None)
+    return installed, pick_latest(latest_versions)
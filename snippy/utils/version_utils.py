@@ -0,0 +1,68 @@
+import json
+import os
+
+from snippy.constants import BASE_DIR, VERSION_CACHE_PATH
+
+DISTRIBUTION_NAME = "snippy"
+
+
+def get_distribution_signature():
+    # brew upgrade 시 패키지 디렉터리가 새로 설치되므로 stat 값으로 캐시 유효성을 판단
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        stat = os.stat(package_dir)
+    except OSError:
+        return None
+    return [stat.st_ino, stat.st_mtime_ns]
+
+
+def get_metadata_version():
+    from importlib import metadata
+
+    try:
+        return metadata.version(DISTRIBUTION_NAME)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def get_stamped_version():
+    # snippy/_version.py is written by the release workflow right before `poetry build`
+    try:
+        from snippy._version import __version__
+    except ImportError:
+        return None
+    return __version__
+
+
+def load_cached_version():
+    try:
+        with open(VERSION_CACHE_PATH, "r") as f:
+            data = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    if data.get("signature") != get_distribution_signature():
+        return None
+    return data.get("installed_version")
+
+
+def save_cached_version(installed_version):
+    os.makedirs(BASE_DIR, exist_ok=True)
+    with open(VERSION_CACHE_PATH, "w") as f:
+        json.dump(
+            {
+                "installed_version": installed_version,
+                "signature": get_distribution_signature(),
+            },
+            f,
+        )
+
+
+def resolve_installed_version():
+    version = get_metadata_version() or get_stamped_version() or load_cached_version()
+    if version:
+        return version
+
+    # 위 방법이 모두 실패한 경우에만 brew 조회
+    from snippy.commands.update import fetch_installed_version_with_animation
+
+    return fetch_installed_version_with_animation()
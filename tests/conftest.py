@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNIPPY_MAIN = "import sys; from snippy.client import main; sys.exit(main())"
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A fresh git repository with its own ``~/.snippy``, as the cwd."""
+    home = tmp_path / "home"
+    path = tmp_path / "repo"
+    home.mkdir()
+    path.mkdir()
+    env = {
+        "HOME": str(home),
+        "SNIPPY_NO_DAEMON": "1",
+        "GIT_AUTHOR_NAME": "snippy",
+        "GIT_AUTHOR_EMAIL": "snippy@example.com",
+        "GIT_COMMITTER_NAME": "snippy",
+        "GIT_COMMITTER_EMAIL": "snippy@example.com",
+    }
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv("PYTHONPATH", ROOT)
+    monkeypatch.chdir(path)
+    subprocess.run(["git", "init", "-q"], check=True)
+    return path
+
+
+def git(*args):
+    return subprocess.run(
+        ["git", *args], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def snippy(*args, input=None, main=SNIPPY_MAIN):
+    return subprocess.run(
+        [sys.executable, "-c", main, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+        input=input,
+    ).stdout
@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+
+from conftest import SNIPPY_MAIN, git
+
+
+def batch(*records):
+    return subprocess.run(
+        [sys.executable, "-c", SNIPPY_MAIN, "batch"],
+        input="".join(json.dumps(record) + "\n" for record in records),
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_invalid_records_fail_alone(repo):
+    for name in ("a.txt", "b.txt"):
+        (repo / name).write_text(name)
+    result = batch(
+        {"type": ["feat"], "subject": "list type", "paths": ["a.txt"]},
+        {"type": "feat", "subject": "int path", "paths": [1]},
+        {"type": "feat", "subject": 1, "paths": ["a.txt"]},
+        {"type": "fix", "subject": "valid", "paths": ["b.txt"]},
+    )
+    assert result.returncode == 1
+    assert "[1] failed: type must be a string." in result.stderr
+    assert "[2] failed: paths must only hold non-empty strings." in result.stderr
+    assert "[3] failed: subject must be a string." in result.stderr
+    assert git("log", "--format=%s").splitlines() == ["fix: 🐛 valid"]
+    assert git("for-each-ref", "refs/snippy") == ""
+
+
+def test_batch_ref_is_deleted_when_head_update_fails(repo):
+    (repo / "a.txt").write_text("a")
+    # HEAD 가 가리키는 브랜치를 잠가서 update-ref HEAD 를 실패시킴
+    branch = git("symbolic-ref", "HEAD").strip()
+    (repo / ".git" / f"{branch}.lock").write_text("")
+    result = batch({"type": "feat", "subject": "locked", "paths": ["a.txt"]})
+    assert result.returncode != 0
+    assert git("for-each-ref", "refs/snippy") == ""
@@ -0,0 +1,46 @@
+import json
+
+from conftest import git, snippy
+
+from snippy.utils.config_schema import CommitType, Config
+from snippy.utils.template_utils import build_type_classifier, compile_template
+
+COMMIT_TYPES = {
+    "feat": CommitType("✨", "New Feature"),
+    "fix": CommitType("🐛", "Bug Fix"),
+}
+
+
+def classify(**options):
+    config = Config(commit_types=COMMIT_TYPES, **options)
+    return build_type_classifier(config, compile_template(config.commit_template))
+
+
+def test_exact_pair():
+    assert classify()("fix", "🐛") == "fix"
+
+
+def test_type_wins_over_mismatched_emoji():
+    assert classify()("feat", "🐛") == "feat"
+
+
+def test_emoji_alone():
+    assert classify()("wip", "🐛") == "fix"
+    assert classify()("wip", "🚧") is None
+
+
+def test_ignores_what_the_config_does_not_render():
+    assert classify(include_type=False)("feat", "🐛") == "fix"
+    assert classify(include_emoji=False)("wip", "🐛") is None
+
+
+def test_stats_and_changelog_agree_on_mismatched_emoji(repo):
+    git("commit", "-q", "--allow-empty", "-m", "chore: 🔧 first")
+    git("commit", "-q", "--allow-empty", "-m", "feat: 🐛 wrong emoji")
+
+    stats = json.loads(snippy("stats", "--format", "json"))
+    assert stats["types"] == {"chore 🔧": 1, "feat ✨": 1}
+
+    changelog = snippy("changelog", "HEAD~1..HEAD")
+    assert "## ✨ 새로운 기능 추가 / New Feature\n\n- wrong emoji" in changelog
+    assert "## Other" not in changelog
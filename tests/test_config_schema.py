@@ -0,0 +1,37 @@
+from snippy.utils.config_schema import (
+    SCHEMA_VERSION,
+    CommitType,
+    Config,
+    get_default_config,
+    parse_config,
+)
+
+
+def test_null_commit_types():
+    config, _ = parse_config({"schema_version": SCHEMA_VERSION, "commit_types": None})
+    assert config.commit_types == {}
+
+
+def test_null_commit_type_is_skipped():
+    config, _ = parse_config(
+        {
+            "schema_version": SCHEMA_VERSION,
+            "commit_types": {"feat": {"emoji": "✨"}, "fix": None},
+        }
+    )
+    assert config.commit_types == {"feat": CommitType("✨", "")}
+
+
+def test_migrated_null_commit_type_is_skipped():
+    config, migrated = parse_config(
+        {"commit_types": {"feat": ":sparkles:", "fix": None}}
+    )
+    assert migrated
+    assert list(config.commit_types) == ["feat"]
+    assert config.commit_types["feat"].emoji == "✨"
+
+
+def test_round_trip_is_equal():
+    config = get_default_config()
+    assert Config.from_dict(config.to_dict()) == config
+    assert "CommitType(emoji='✨'" in repr(config.commit_types["feat"])
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+from conftest import git
+
+from snippy.utils.git_backend import (
+    AutoGitBackend,
+    IndexGitBackend,
+    SubprocessGitBackend,
+)
+
+
+def write(name, content):
+    os.makedirs(os.path.dirname(name) or ".", exist_ok=True)
+    with open(name, "w") as f:
+        f.write(content)
+
+
+def make_repo(index_version, file_count=50):
+    git("config", "gc.auto", "0")
+    git("config", "index.version", str(index_version))
+    for index in range(file_count):
+        write(f"pkg{index % 20}/sub{index % 7}/file{index}.txt", f"{index}\n")
+    git("add", "-A")
+    git("commit", "-qm", "init")
+
+
+def change(name, content="changed\n"):
+    write(name, content)
+    git("add", name)
+
+
+def commit_history():
+    for i in range(5):
+        write(f"pkg{i}/sub{i}/file{i}.txt", "v2\n")
+        git("commit", "-qam", f"c{i}")
+    git("repack", "-adq", "--depth=50")
+    change("pkg7/sub0/file7.txt")
+
+
+SCENARIOS = {
+    "clean": lambda: None,
+    "modified": lambda: change("pkg1/sub1/file1.txt"),
+    "added": lambda: change("new/file.txt", "new\n"),
+    "deleted": lambda: git("rm", "-q", "pkg2/sub2/file2.txt"),
+    "mode": lambda: git("update-index", "--chmod=+x", "pkg3/sub3/file3.txt"),
+    "unstaged only": lambda: write("pkg4/sub4/file4.txt", "dirty\n"),
+    "intent to add": lambda: (write("ita.txt", "ita\n"), git("add", "-N", "ita.txt")),
+    "packed": lambda: git("repack", "-adq"),
+    "packed + modified": lambda: (
+        git("repack", "-adq"),
+        change("pkg5/sub5/file5.txt"),
+    ),
+    "packed history": commit_history,
+    # reset 이 cache-tree 를 무효화하므로 항목을 하나씩 비교하는 경로를 탐
+    "no cache-tree": lambda: (
+        change("pkg6/sub6/file6.txt"),
+        git("reset", "-q", "pkg6/sub6/file6.txt"),
+    ),
+    "no cache-tree + modified": lambda: (
+        change("pkg6/sub6/file6.txt"),
+        git("reset", "-q", "pkg6/sub6/file6.txt"),
+        change("pkg8/sub1/file8.txt"),
+    ),
+}
+
+BACKENDS = (IndexGitBackend, SubprocessGitBackend, AutoGitBackend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=lambda backend: backend.name)
+@pytest.mark.parametrize("scenario", SCENARIOS)
+@pytest.mark.parametrize("index_version", (2, 3, 4))
+def test_backends_agree_with_git(repo, index_version, scenario, backend):
+    make_repo(index_version)
+    SCENARIOS[scenario]()
+    expected = bool(git("diff", "--cached", "--name-only").strip())
+    assert backend().has_staged_changes() == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=lambda backend: backend.name)
+def test_unborn_head(repo, backend):
+    assert backend().has_staged_changes() is False
+    write("first.txt", "first\n")
+    git("add", "first.txt")
+    assert backend().has_staged_changes() is True
@@ -0,0 +1,53 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+from conftest import git, snippy
+
+SNIPPY_SCRIPT = f"""#!{sys.executable}
+import sys
+from snippy.client import main
+sys.exit(main())
+"""
+
+
+def put_snippy_on_path(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "snippy"
+    script.write_text(SNIPPY_SCRIPT)
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def try_commit(message):
+    return subprocess.run(
+        ["git", "commit", "-q", "--allow-empty", "-m", message],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_hook_does_not_pin_the_interpreter(repo):
+    snippy("hook", "install")
+    hook = (repo / ".git" / "hooks" / "commit-msg").read_text()
+    assert sys.executable not in hook
+    assert hook.startswith("#!/bin/sh\n")
+
+
+def test_hook_runs_the_snippy_on_path(repo, tmp_path, monkeypatch):
+    snippy("hook", "install")
+    put_snippy_on_path(tmp_path, monkeypatch)
+    assert try_commit("does not follow").returncode == 1
+    assert try_commit("feat: ✨ follows").returncode == 0
+    assert git("log", "--format=%s").splitlines() == ["feat: ✨ follows"]
+
+
+@pytest.mark.skipif(shutil.which("snippy") is not None, reason="snippy is on PATH")
+def test_hook_is_skipped_without_snippy(repo):
+    snippy("hook", "install")
+    result = try_commit("does not follow")
+    assert result.returncode == 0
+    assert "snippy: not found on PATH" in result.stderr
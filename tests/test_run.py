@@ -0,0 +1,70 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from conftest import SNIPPY_MAIN, git, snippy
+
+# picker 대신 항상 fix 를 고르고, 터미널 확인을 건너뜀
+PICK_FIX = """
+import sys
+import snippy.commands.run as run
+run.require_terminal = lambda hint: None
+run.select_commit_type = lambda *args, **kwargs: ("fix", "🐛")
+from snippy.client import main
+sys.exit(main())
+"""
+
+
+def commit(*args, **kwargs):
+    with open("README.md", "a") as f:
+        f.write("change\n")
+    git("add", "README.md")
+    snippy("run", "-m", "handle empty input", *args, **kwargs)
+    return git("log", "-1", "--format=%s").strip()
+
+
+@pytest.mark.parametrize("flags", [(), ("--no-type",), ("--no-emoji",)])
+def test_picker_matches_type_option(repo, flags):
+    picked = commit(*flags, main=PICK_FIX)
+    assert picked == commit("-t", "fix", *flags)
+
+
+def test_picker_drops_disabled_parts(repo):
+    assert "fix" not in commit("--no-type", main=PICK_FIX)
+    assert "🐛" not in commit("--no-emoji", main=PICK_FIX)
+
+
+@pytest.mark.parametrize(
+    "flags, expected",
+    [
+        (("--no-type",), "🐛 handle empty input"),
+        (("--no-emoji",), "fix: handle empty input"),
+    ],
+)
+def test_disabled_parts_drop_their_separator(repo, flags, expected):
+    assert commit("-t", "fix", *flags) == expected
+    assert commit(*flags, main=PICK_FIX) == expected
+    # 같은 설정의 lint, stats 도 이 메시지를 fix 커밋으로 받아들여야 함
+    snippy("lint", "HEAD")
+    stats = json.loads(snippy("stats", "--format", "json"))
+    assert stats["types"] == {"fix 🐛": 2}
+
+
+def usage_records(repo):
+    path = repo.parent / "home" / ".snippy" / "usage.log"
+    return path.stat().st_size // 8 if path.exists() else 0
+
+
+def test_usage_is_recorded_only_after_a_commit(repo):
+    (repo / "README.md").write_text("unstaged\n")
+    result = subprocess.run(
+        [sys.executable, "-c", SNIPPY_MAIN, "run", "-t", "fix", "-m", "nothing staged"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert usage_records(repo) == 0
+
+    commit("-t", "fix")
+    assert usage_records(repo) == 1